@@ -1,16 +1,17 @@
 import re
 import click
+import logging
 import sys
-import asyncio
 import os
 from cwsf import __version__
 from cwsf.utils.logging import setup_logging
-from cwsf.core.orchestrator import Orchestrator
-from cwsf.core.queue import PriorityJobQueue
-from cwsf.config.loader import load_config, ConfigParseError
-from cwsf.config.validator import validate_config
 from typing import List, Dict, Any, Tuple, Optional
-from cwsf.utils.run_history import RunHistoryStore, RunResult
+
+# Heavier modules (config loader/validator, orchestrator, run history) are
+# imported inside the commands that need them to keep CLI startup fast.
+
+# Colour per run status in `status` output; anything else is shown in red
+_STATUS_COLOR = {"success": "green", "partial": "yellow"}
 
 @click.group(invoke_without_command=True)
 @click.version_option(version=__version__, prog_name="CWSF")
@@ -52,11 +53,12 @@ def validate_config_dir(config_dir: str):
 @click.option("--site", help="Validate a specific site configuration.")
 @click.pass_context
 def validate(ctx, validate_all, site):
-    config_dir = ctx.obj["config_dir"]
-    validate_config_dir(config_dir)
     """
     Validate configuration file(s) against the schema.
     """
+    config_dir = ctx.obj["config_dir"]
+    validate_config_dir(config_dir)
+
     if not validate_all and not site:
         click.echo("Error: Must specify either --all or --site <name>", err=True)
         sys.exit(2)
@@ -65,63 +67,50 @@ def validate(ctx, validate_all, site):
         click.echo("Error: --all and --site are mutually exclusive", err=True)
         sys.exit(2)
 
-    if not os.path.exists(config_dir) or not os.path.isdir(config_dir):
-        click.echo(f"Error: Config directory '{config_dir}' does not exist or is not a directory.", err=True)
-        sys.exit(1)
+    from cwsf.config.loader import iter_validated_configs, ConfigParseError
 
-    files_to_validate = []
-    for f in os.listdir(config_dir):
-        if f.endswith(".yaml") or f.endswith(".yml"):
-            files_to_validate.append(os.path.join(config_dir, f))
+    results = list(iter_validated_configs(config_dir))
     
-    if not files_to_validate:
+    if not results:
         click.echo(f"No configuration files found in {config_dir}")
         sys.exit(0)
 
     valid_count = 0
     total_count = 0
-    
-    # Sort files for consistent output
-    files_to_validate.sort()
 
-    for file_path in files_to_validate:
-        try:
-            config_dict = load_config(file_path)
-            
-            # If --site is specified, we only care about the matching site_name
-            if site and config_dict.get("site_name") != site:
-                continue
-                
-            total_count += 1
-            result = validate_config(config_dict, config_file=os.path.basename(file_path))
-            
-            if result.is_valid:
-                valid_count += 1
-                click.echo(click.style(f"✓ {config_dict.get('site_name', 'unknown')} ({file_path})", fg="green"))
-            else:
-                click.echo(click.style(f"✗ {config_dict.get('site_name', 'unknown')} ({file_path})", fg="red"))
-                for error in result.errors:
-                    click.echo(f"  - Error: {error.field_path}: {error.message}")
-                for warning in result.warnings:
-                    click.echo(f"  - Warning: {warning.field_path}: {warning.message}")
-            
-            # If we were looking for a specific site and found it, we can stop
-            if site:
-                break
-                
-        except ConfigParseError as e:
+    for file_path, config_dict, result, exc in results:
+        if exc is not None:
             # If --site is specified, we might not know the site_name yet,
             # but we should still report the parse error if we're validating --all
             # or if we suspect this file might be the one (though we can't know without parsing)
             if validate_all:
                 total_count += 1
                 click.echo(click.style(f"✗ {file_path}", fg="red"))
-                click.echo(f"  - Parse Error: {e.message}")
-        except Exception as e:
-            if validate_all:
-                total_count += 1
-                click.echo(click.style(f"✗ {file_path}", fg="red"))
-                click.echo(f"  - Unexpected Error: {str(e)}")
+                if isinstance(exc, ConfigParseError):
+                    click.echo(f"  - Parse Error: {exc.message}")
+                else:
+                    click.echo(f"  - Unexpected Error: {str(exc)}")
+            continue
+
+        # If --site is specified, we only care about the matching site_name
+        if site and config_dict.get("site_name") != site:
+            continue
+            
+        total_count += 1
+        
+        if result.is_valid:
+            valid_count += 1
+            click.echo(click.style(f"✓ {config_dict.get('site_name', 'unknown')} ({file_path})", fg="green"))
+        else:
+            click.echo(click.style(f"✗ {config_dict.get('site_name', 'unknown')} ({file_path})", fg="red"))
+            for error in result.errors:
+                click.echo(f"  - Error: {error.field_path}: {error.message}")
+            for warning in result.warnings:
+                click.echo(f"  - Warning: {warning.field_path}: {warning.message}")
+        
+        # If we were looking for a specific site and found it, we can stop
+        if site:
+            break
 
     if site:
         if total_count == 0:
@@ -146,25 +135,25 @@ def list_configs(ctx):
     config_dir = ctx.obj["config_dir"]
     validate_config_dir(config_dir)
 
-    # Collect all YAML files
-    yaml_files = []
-    for f in os.listdir(config_dir):
-        if f.endswith(".yaml") or f.endswith(".yml"):
-            yaml_files.append(os.path.join(config_dir, f))
+    from cwsf.config.loader import iter_validated_configs
+
+    results = list(iter_validated_configs(config_dir))
 
-    if not yaml_files:
+    if not results:
         click.echo(f"No configuration files found in {config_dir}")
         sys.exit(0)
 
     # Build rows: (site_name, file, status, schedule, priority)
     rows: List[Tuple[str, str, str, str, str]] = []
 
-    for file_path in yaml_files:
+    for file_path, config_dict, result, exc in results:
         file_name = os.path.basename(file_path)
-        try:
-            config_dict = load_config(file_path)
-            result = validate_config(config_dict, config_file=file_name)
-
+        if exc is not None:
+            site_name = file_name
+            status = "error"
+            schedule_str = "—"
+            priority_str = "—"
+        else:
             site_name = config_dict.get("site_name", "unknown")
 
             if result.is_valid:
@@ -186,49 +175,28 @@ def list_configs(ctx):
             else:
                 priority_str = "default"
 
-        except ConfigParseError as e:
-            site_name = file_name
-            status = "error"
-            schedule_str = "—"
-            priority_str = "—"
-        except Exception as e:
-            site_name = file_name
-            status = "error"
-            schedule_str = "—"
-            priority_str = "—"
-
         rows.append((site_name, file_name, status, schedule_str, priority_str))
 
     # Sort alphabetically by site name
     rows.sort(key=lambda r: r[0].lower())
 
-    # Determine column widths
+    # Determine column widths in a single pass over header + rows
     headers = ("Site Name", "File", "Status", "Schedule", "Priority")
-    col_widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            col_widths[i] = max(col_widths[i], len(cell))
+    col_widths = [max(map(len, col)) for col in zip(headers, *rows)]
 
     # Format and print header
     sep = "  "
-    header_line = sep.join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-    divider = sep.join("-" * col_widths[i] for i in range(len(headers)))
-    click.echo(header_line)
-    click.echo(divider)
+    row_fmt = sep.join(f"{{:<{w}}}" for w in col_widths)
+    click.echo(row_fmt.format(*headers))
+    click.echo(sep.join("-" * w for w in col_widths))
 
-    # Print rows with colour coding for status
+    # Print rows with colour coding for status. The status cell is padded
+    # before styling so the ANSI codes don't count towards its width.
     status_colours = {"valid": "green", "invalid": "red", "error": "red"}
-    for row in rows:
-        site_name, file_name, status, schedule_str, priority_str = row
-        colour = status_colours.get(status)
-        cells = [
-            site_name.ljust(col_widths[0]),
-            file_name.ljust(col_widths[1]),
-            click.style(status.ljust(col_widths[2]), fg=colour),
-            schedule_str.ljust(col_widths[3]),
-            priority_str.ljust(col_widths[4]),
-        ]
-        click.echo(sep.join(cells))
+    status_width = col_widths[2]
+    for site_name, file_name, status, schedule_str, priority_str in rows:
+        styled_status = click.style(status.ljust(status_width), fg=status_colours.get(status))
+        click.echo(row_fmt.format(site_name, file_name, styled_status, schedule_str, priority_str))
 
     sys.exit(0)
 
@@ -261,6 +229,10 @@ def run(ctx, site, base_url_override):
 
     overrides = {"base_url": base_url_override} if base_url_override else {}
 
+    import asyncio
+    from cwsf.core.orchestrator import Orchestrator
+    from cwsf.core.queue import PriorityJobQueue
+
     queue = PriorityJobQueue()
     orchestrator = Orchestrator(queue=queue, config_dir=config_dir, config_overrides=overrides)
     
@@ -289,6 +261,8 @@ def status(ctx, site):
     config_dir = ctx.obj["config_dir"]
     validate_config_dir(config_dir)
 
+    from cwsf.utils.run_history import RunHistoryStore
+
     store = RunHistoryStore()
     
     if site:
@@ -300,7 +274,7 @@ def status(ctx, site):
         click.echo(f"Status for site: {click.style(site, bold=True)}")
         click.echo("-" * 40)
         for run in history:
-            status_color = "green" if run.status == "success" else "yellow" if run.status == "partial" else "red"
+            status_color = _STATUS_COLOR.get(run.status, "red")
             click.echo(f"Run at: {run.timestamp}")
             click.echo(f"Status: {click.style(run.status, fg=status_color)}")
             click.echo(f"Records: {run.records_count}")
@@ -315,32 +289,24 @@ def status(ctx, site):
             sys.exit(0)
             
         headers = ("Site Name", "Last Run", "Records", "Status", "Errors")
-        col_widths = [len(h) for h in headers]
+        rows = [
+            (run.site_name, run.timestamp, str(run.records_count), run.status, str(run.error_count))
+            for run in last_runs
+        ]
         
-        # Calculate widths
-        for run in last_runs:
-            col_widths[0] = max(col_widths[0], len(run.site_name))
-            col_widths[1] = max(col_widths[1], len(run.timestamp))
-            col_widths[2] = max(col_widths[2], len(str(run.records_count)))
-            col_widths[3] = max(col_widths[3], len(run.status))
-            col_widths[4] = max(col_widths[4], len(str(run.error_count)))
+        # Calculate widths in a single pass over header + rows
+        col_widths = [max(map(len, col)) for col in zip(headers, *rows)]
             
         sep = "  "
-        header_line = sep.join(h.ljust(col_widths[i]) for i, h in enumerate(headers))
-        divider = sep.join("-" * col_widths[i] for i in range(len(headers)))
-        click.echo(header_line)
-        click.echo(divider)
+        row_fmt = sep.join(f"{{:<{w}}}" for w in col_widths)
+        click.echo(row_fmt.format(*headers))
+        click.echo(sep.join("-" * w for w in col_widths))
         
-        for run in last_runs:
-            status_color = "green" if run.status == "success" else "yellow" if run.status == "partial" else "red"
-            cells = [
-                run.site_name.ljust(col_widths[0]),
-                run.timestamp.ljust(col_widths[1]),
-                str(run.records_count).ljust(col_widths[2]),
-                click.style(run.status.ljust(col_widths[3]), fg=status_color),
-                str(run.error_count).ljust(col_widths[4])
-            ]
-            click.echo(sep.join(cells))
+        status_width = col_widths[3]
+        for site_name, timestamp, records_count, run_status, error_count in rows:
+            status_color = _STATUS_COLOR.get(run_status, "red")
+            styled_status = click.style(run_status.ljust(status_width), fg=status_color)
+            click.echo(row_fmt.format(site_name, timestamp, records_count, styled_status, error_count))
 
     sys.exit(0)
 
@@ -6,17 +6,124 @@ for the Configurable Web Scraping Framework.
 
 import os
 import copy
+import datetime
+import hashlib
+import io
+import itertools
+import json
 import logging
-from typing import Dict, Any, List, Optional
+import multiprocessing
+import pickle
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Any, Iterator, List, Mapping, Optional, Tuple
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as _SafeLoader
+
 from cwsf.config.schema import DEFAULT_CONFIG
 from cwsf.config.validator import validate_config
 
 
 logger = logging.getLogger(__name__)
 
+# Two-level in-process cache of parsed + defaulted configs. _MTIME_INDEX maps
+# realpath -> (mtime_ns, size, content_hash) as a fast path that needs only a
+# stat; when mtime/size change the file is re-read and hashed, and the LRU
+# _CONFIG_CACHE is keyed by that content hash. A `touch` or an atomic replace
+# with identical contents therefore costs a hash rather than a re-parse.
+# Entries already have defaults applied, so a hit skips both parsing and
+# apply_defaults (DEFAULT_CONFIG is read-only, so they cannot go stale).
+_CONFIG_CACHE_MAX_SIZE = 128
+_CONFIG_CACHE: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_MTIME_INDEX: Dict[str, Tuple[int, int, bytes]] = {}
+
+# Optional persistent cache of post-defaults configs as JSON sidecars in
+# <config_dir>/.cache/, keyed by the source file's content hash. Only
+# trusted when CWSF_CONFIG_CACHE=1, since anyone who can write the cache
+# directory can inject config contents.
+_DISK_CACHE_ENV_VAR = "CWSF_CONFIG_CACHE"
+_DISK_CACHE_DIRNAME = ".cache"
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively copy a read-only mapping (see schema.DEFAULT_CONFIG) into plain dicts."""
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
+# Plain-dict copy of the read-only DEFAULT_CONFIG, for pickling and codegen
+_DEFAULTS: Dict[str, Any] = _thaw(DEFAULT_CONFIG)
+
+# DEFAULT_CONFIG never changes at runtime, so pickle its mutable subtrees once;
+# pickle.loads materializes fresh copies much faster than copy.deepcopy.
+_DEFAULT_PICKLES: Dict[str, bytes] = {
+    key: pickle.dumps(value, protocol=5)
+    for key, value in _DEFAULTS.items()
+    if isinstance(value, (dict, list))
+}
+
+# Sidecars store post-defaults configs, so they are tagged with a fingerprint
+# of DEFAULT_CONFIG and ignored if the defaults change between releases.
+_DEFAULTS_FINGERPRINT = hashlib.blake2b(
+    json.dumps(_DEFAULTS, sort_keys=True).encode("utf-8"), digest_size=8
+).hexdigest()
+
+_LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def _compile_defaults_merger(defaults: Dict[str, Any]):
+    """Generate a function that applies ``defaults`` to a config dict in place.
+    
+    The shape of DEFAULT_CONFIG is fixed at import time, so instead of walking
+    it on every load we emit straight-line code with one membership test per
+    known key. Scalar defaults are inlined as literals, mutable subtrees are
+    materialized from their frozen pickles, and nested dict defaults are
+    merged underneath the user's values.
+    """
+    namespace: Dict[str, Any] = {"_loads": pickle.loads}
+    lines = ["def _merge_defaults(resolved):"]
+    for i, (key, value) in enumerate(defaults.items()):
+        if key in _DEFAULT_PICKLES:
+            namespace[f"_p{i}"] = _DEFAULT_PICKLES[key]
+            fill = f"_loads(_p{i})"
+        elif isinstance(value, _LITERAL_TYPES):
+            fill = repr(value)
+        else:
+            namespace[f"_v{i}"] = value
+            fill = f"_v{i}"
+        lines.append(f"    if {key!r} not in resolved:")
+        lines.append(f"        resolved[{key!r}] = {fill}")
+        if isinstance(value, dict) and value:
+            # Nested defaults are scalars, so a shallow merge is enough
+            namespace[f"_d{i}"] = value
+            lines.append(f"    elif isinstance(resolved[{key!r}], dict):")
+            lines.append(f"        resolved[{key!r}] = {{**_d{i}, **resolved[{key!r}]}}")
+    lines.append("    return resolved")
+    exec("\n".join(lines), namespace)
+    return namespace["_merge_defaults"]
+
+
+_merge_defaults = _compile_defaults_merger(_DEFAULTS)
+
+_YAML_EXTS = (".yaml", ".yml")
+
+# Parallel scans use spawned workers, each of which re-imports cwsf (and
+# yaml/jsonschema) before loading anything: ~0.3s, against well under 1ms
+# to load and validate a typical config. Below this many files that
+# startup costs more than it saves
+_PARALLEL_SCAN_THRESHOLD = 1024
+
+# Files per worker; a scan starts no more workers than this keeps busy
+_FILES_PER_SCAN_WORKER = 256
+
 
 class ConfigParseError(Exception):
     """Exception raised when a configuration file cannot be parsed.
@@ -45,45 +152,177 @@ def load_config(file_path: str) -> Dict[str, Any]:
         file_path: Path to the YAML configuration file.
         
     Returns:
-        A dictionary representing the parsed configuration contents.
+        A dictionary representing the parsed configuration contents, with
+        defaults applied. Results are cached by file contents, so repeat loads
+        of an unchanged file skip both parsing and defaulting.
         
     Raises:
         ConfigParseError: If the file cannot be read, is empty, or contains invalid YAML.
         FileNotFoundError: If the specified file does not exist.
     """
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # A single stat covers the existence check, the empty-file check and the
+    # cache key
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         raise FileNotFoundError(f"Configuration file not found: {file_path}")
     
     # Check if file is empty
-    if os.path.getsize(file_path) == 0:
+    if st.st_size == 0:
         raise ConfigParseError("Configuration file is empty", file_path)
-    
-    # Read and parse YAML
+
+    real_path = os.path.realpath(file_path)
+    indexed = _MTIME_INDEX.get(real_path)
+    if indexed is not None and indexed[0] == st.st_mtime_ns and indexed[1] == st.st_size:
+        cached = _get_cached(indexed[2])
+        if cached is not None:
+            return cached
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Check for empty content after reading (handles whitespace-only files)
-        if not content.strip():
-            raise ConfigParseError("Configuration file is empty", file_path)
-        
-        # Use safe_load to prevent arbitrary code execution (NFR-6)
-        config = yaml.safe_load(content)
-        
-        # Handle case where YAML parses to None (e.g., file with only comments)
-        if config is None:
-            raise ConfigParseError("Configuration file is empty", file_path)
-        
-        return apply_defaults(config)
-        
-    except yaml.YAMLError as e:
-        raise ConfigParseError(f"Invalid YAML syntax: {str(e)}", file_path)
+        with open(file_path, 'rb') as f:
+            data = f.read()
     except PermissionError:
         raise
     except IOError as e:
         raise ConfigParseError(f"Error reading file: {str(e)}", file_path)
 
+    content_hash = hashlib.blake2b(data, digest_size=16).digest()
+    _MTIME_INDEX[real_path] = (st.st_mtime_ns, st.st_size, content_hash)
+    cached = _get_cached(content_hash)
+    if cached is not None:
+        return cached
+
+    disk_cache_path = _disk_cache_path(file_path) if _disk_cache_enabled() else None
+    if disk_cache_path:
+        resolved = _read_disk_cache(disk_cache_path, content_hash)
+        if resolved is not None:
+            _store_cached(content_hash, resolved)
+            return _fast_clone(resolved)
+
+    # Parse YAML. Use a safe loader to prevent arbitrary code execution (NFR-6).
+    # The named stream keeps the file path in syntax error locations.
+    stream = io.BytesIO(data)
+    stream.name = file_path
+    try:
+        config = yaml.load(stream, Loader=_SafeLoader)
+    except yaml.YAMLError as e:
+        raise ConfigParseError(f"Invalid YAML syntax: {str(e)}", file_path)
+        
+    # Handle case where YAML parses to None (e.g., whitespace- or
+    # comment-only files)
+    if config is None:
+        raise ConfigParseError("Configuration file is empty", file_path)
+    
+    resolved = apply_defaults(config)
+    _store_cached(content_hash, resolved)
+    if disk_cache_path:
+        _write_disk_cache(disk_cache_path, content_hash, resolved)
+    return _fast_clone(resolved)
+
+
+# Leaf types YAML produces that are immutable, so clones can share them
+_IMMUTABLE_LEAVES = frozenset((str, int, float, bool, type(None), bytes, datetime.date, datetime.datetime))
+
+
+def _fast_clone(obj: Any) -> Any:
+    """Deep-copy a plain-data config tree.
+    
+    Rebuilds dicts and lists and shares immutable leaves, which is several
+    times faster than copy.deepcopy for the trees YAML produces and exact
+    for every value (including .inf/.nan floats). Anything else (e.g. a set
+    from !!set) falls back to copy.deepcopy.
+    """
+    kind = type(obj)
+    if kind is dict:
+        return {key: _fast_clone(value) for key, value in obj.items()}
+    if kind is list:
+        return [_fast_clone(value) for value in obj]
+    if kind in _IMMUTABLE_LEAVES:
+        return obj
+    return copy.deepcopy(obj)
+
+
+def _get_cached(content_hash: bytes) -> Optional[Dict[str, Any]]:
+    """Return a copy of a cached config, or None on a miss."""
+    cached = _CONFIG_CACHE.get(content_hash)
+    if cached is None:
+        return None
+    _CONFIG_CACHE.move_to_end(content_hash)
+    # Hand out a copy so callers can mutate the result safely
+    return _fast_clone(cached)
+
+
+def _store_cached(cache_key: bytes, resolved: Dict[str, Any]) -> None:
+    """Insert a resolved config into the LRU cache, evicting the oldest entry."""
+    _CONFIG_CACHE[cache_key] = resolved
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAX_SIZE:
+        _CONFIG_CACHE.popitem(last=False)
+
+
+def _disk_cache_enabled() -> bool:
+    """Return True if the on-disk JSON config cache is enabled."""
+    return os.environ.get(_DISK_CACHE_ENV_VAR) == "1"
+
+
+def _disk_cache_path(file_path: str) -> str:
+    """Return the JSON sidecar path for a YAML config file."""
+    config_dir, filename = os.path.split(file_path)
+    return os.path.join(config_dir, _DISK_CACHE_DIRNAME, filename + ".json")
+
+
+def _read_disk_cache(cache_path: str, content_hash: bytes) -> Optional[Dict[str, Any]]:
+    """Load a cached config if the sidecar was built from the same source bytes.
+
+    Returns None on a miss, if the sidecar cannot be read, or if it was
+    written for different file contents or different defaults.
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("source") != content_hash.hex()
+        or cached.get("defaults") != _DEFAULTS_FINGERPRINT
+    ):
+        return None
+    config = cached.get("config")
+    return config if isinstance(config, dict) else None
+
+
+def _write_disk_cache(cache_path: str, content_hash: bytes, resolved: Dict[str, Any]) -> None:
+    """Atomically write a resolved config to its JSON sidecar.
+
+    Failures are logged at DEBUG level and otherwise ignored; the cache is
+    purely an optimization.
+    """
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "source": content_hash.hex(),
+                "defaults": _DEFAULTS_FINGERPRINT,
+                "config": resolved,
+            }, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write config cache '{cache_path}': {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _cache_clear() -> None:
+    """Drop all entries from the load_config cache."""
+    _CONFIG_CACHE.clear()
+    _MTIME_INDEX.clear()
+
+
+load_config.cache_clear = _cache_clear
+
 
 def apply_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     """Apply default values to a configuration dictionary.
@@ -94,20 +333,10 @@ def apply_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         A new dictionary with default values applied for missing optional fields.
     """
-    # Deep copy to avoid modifying the original
-    resolved = copy.deepcopy(config)
-    
-    # Apply top-level defaults
-    for key, value in DEFAULT_CONFIG.items():
-        if key not in resolved:
-            resolved[key] = copy.deepcopy(value)
-        elif isinstance(value, dict) and isinstance(resolved[key], dict):
-            # Apply nested defaults for dictionaries
-            for sub_key, sub_value in value.items():
-                if sub_key not in resolved[key]:
-                    resolved[key][sub_key] = copy.deepcopy(sub_value)
-                    
-    return resolved
+    # Shallow copy only: the parsed YAML tree is already freshly owned by the
+    # caller, so only the default subtrees we insert need to be copied.
+    # Apply top-level and nested defaults via the generated merger
+    return _merge_defaults(dict(config))
 
 
 def apply_overrides(config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
@@ -118,20 +347,112 @@ def apply_overrides(config: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[s
         overrides: A flat dict of top-level keys to override (e.g., {"base_url": "https://..."}).
 
     Returns:
-        A new dict with the specified keys replaced. The original is not mutated.
+        A new dict with the specified keys replaced. The original is not mutated,
+        but nested values are shared with it (overrides are top-level scalars).
     """
-    result = copy.deepcopy(config)
-    for key, value in overrides.items():
-        if value is not None:          # only apply if the caller actually supplied a value
-            result[key] = value
-    return result
+    # Only apply overrides the caller actually supplied a value for
+    return {**config, **{k: v for k, v in overrides.items() if v is not None}}
 
 
-def scan_config_directory(
+_LoadResult = Tuple[str, Optional[Dict[str, Any]], Optional[Any], Optional[BaseException]]
+
+
+def _load_and_validate(
+    file_path: str,
+    overrides: Optional[Dict[str, Any]] = None,
+    config_file: Optional[str] = None,
+) -> _LoadResult:
+    """Load, override and validate a single config file.
+    
+    Defined at module level so it can be dispatched to a process pool. Errors
+    are returned rather than raised so one bad file does not abort the batch.
+    config_file is passed through to validate_config for message prefixes.
+    
+    Returns:
+        A (file_path, config_dict, validation_result, exception) tuple where
+        exactly one of validation_result and exception is set.
+    """
+    try:
+        config_dict = load_config(file_path)
+
+        # Apply CLI overrides before validation (design §4.1)
+        if overrides:
+            config_dict = apply_overrides(config_dict, overrides)
+
+        return file_path, config_dict, validate_config(config_dict, config_file=config_file), None
+    except Exception as e:
+        return file_path, None, None, e
+
+
+def _iter_load_and_validate(
+    file_paths: List[str],
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Iterator[_LoadResult]:
+    """Load and validate many config files, in parallel when worthwhile.
+    
+    Results are yielded in input order as soon as each one is ready. Falls
+    back to a serial scan for small batches or if a process pool cannot be
+    started (or breaks) on this platform; files already yielded are not
+    loaded twice.
+    
+    Workers are spawned rather than forked: by now the logging listener
+    (and possibly other) threads are running, and a forked child could
+    inherit a lock one of them holds. Configs loaded in workers don't reach
+    this process's load_config and validate_config caches.
+    """
+    done = 0
+    if len(file_paths) >= _PARALLEL_SCAN_THRESHOLD:
+        workers = max(1, min(os.cpu_count() or 1, len(file_paths) // _FILES_PER_SCAN_WORKER))
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+                for result in executor.map(
+                    _load_and_validate,
+                    file_paths,
+                    itertools.repeat(overrides),
+                    chunksize=4,
+                ):
+                    done += 1
+                    yield result
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.debug(f"Parallel config scan unavailable, scanning serially: {e}")
+
+    for file_path in file_paths[done:]:
+        yield _load_and_validate(file_path, overrides)
+
+
+def iter_validated_configs(directory_path: str) -> Iterator[_LoadResult]:
+    """Load and validate every YAML config file in a directory.
+    
+    Files are visited in sorted path order. Loads go through the load_config
+    cache, so commands that walk the same directory within one process reuse
+    the parsed configs instead of re-reading them.
+    
+    Args:
+        directory_path: Path to the directory to scan (non-recursive).
+        
+    Yields:
+        (file_path, config_dict, validation_result, exception) tuples. Load
+        failures are yielded with the exception set rather than raised.
+    """
+    with os.scandir(directory_path) as entries:
+        named_paths = sorted(
+            (entry.path, entry.name) for entry in entries
+            if entry.name.endswith(_YAML_EXTS) and entry.is_file()
+        )
+
+    for file_path, file_name in named_paths:
+        yield _load_and_validate(file_path, config_file=file_name)
+
+
+def iter_scan_config_directory(
     directory_path: str = "./configs",
     overrides: Optional[Dict[str, Any]] = None,
-) -> List[Dict[str, Any]]:
-    """Scan a directory for YAML configuration files and load them.
+) -> Iterator[Dict[str, Any]]:
+    """Scan a directory for YAML configuration files and yield valid ones.
+    
+    Configs are yielded as soon as they are loaded and validated, so callers
+    can start working on early configs while later files are still parsed.
     
     Args:
         directory_path: Path to the directory to scan. Defaults to "./configs".
@@ -139,8 +460,8 @@ def scan_config_directory(
                    (e.g., {"base_url": "https://staging.example.com"}). Applied before
                    validation so the override URL is subject to the same URI format check.
         
-    Returns:
-        A list of validated configuration dictionaries.
+    Yields:
+        Validated configuration dictionaries.
         
     Note:
         - Only .yaml and .yml files are processed.
@@ -152,72 +473,72 @@ def scan_config_directory(
         logger.info(f"Config directory '{directory_path}' not found; created.")
         os.makedirs(directory_path, exist_ok=True)
         logger.info(f"Startup scan complete: 0 configs loaded, 0 skipped due to errors.")
-        return []
+        return
 
     if not os.path.isdir(directory_path):
         logger.warning(f"Config path '{directory_path}' is not a directory.")
-        return []
+        return
 
-    loaded_configs = []
+    loaded_count = 0
     skipped_count = 0
     
-    # List files in the directory (non-recursive)
+    # List files in the directory (non-recursive). DirEntry caches the file
+    # type from the directory read, avoiding a stat() per entry.
     try:
-        all_entries = os.listdir(directory_path)
         files = []
-        for f in all_entries:
-            full_path = os.path.join(directory_path, f)
-            # AC 6: Handle symlinked YAML files correctly (os.path.isfile follows symlinks)
-            # AC 4: If a config file is replaced by a directory, os.path.isfile will be False
-            if os.path.isfile(full_path):
-                files.append(f)
-            elif os.path.isdir(full_path) and (f.endswith(".yaml") or f.endswith(".yml")):
-                logger.warning(f"Ignoring directory '{full_path}' which has a YAML extension.")
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                # AC 6: Handle symlinked YAML files correctly (is_file follows symlinks)
+                # AC 4: If a config file is replaced by a directory, is_file will be False
+                if entry.is_file():
+                    files.append(entry)
+                elif entry.is_dir() and entry.name.endswith(_YAML_EXTS):
+                    logger.warning(f"Ignoring directory '{entry.path}' which has a YAML extension.")
     except OSError as e:
         logger.error(f"Error accessing config directory '{directory_path}': {e}")
-        return []
+        return
 
     # AC 2: If the config directory is empty, log message
     if not files:
         logger.info("No config files found. Waiting for configs...")
         logger.info(f"Startup scan complete: 0 configs loaded, 0 skipped due to errors.")
-        return []
+        return
 
-    for filename in files:
-        if not (filename.endswith(".yaml") or filename.endswith(".yml")):
-            continue
+    yaml_paths = [entry.path for entry in files if entry.name.endswith(_YAML_EXTS)]
 
-        file_path = os.path.join(directory_path, filename)
-        
-        try:
-            # Load the config
-            config_dict = load_config(file_path)
-
-            # Apply CLI overrides before validation (design §4.1)
-            if overrides:
-                config_dict = apply_overrides(config_dict, overrides)
-
-            # Validate the config
-            validation_result = validate_config(config_dict)
-            
+    for file_path, config_dict, validation_result, exc in _iter_load_and_validate(yaml_paths, overrides):
+        if exc is None:
             if validation_result.is_valid:
-                loaded_configs.append(config_dict)
+                loaded_count += 1
+                yield config_dict
             else:
                 skipped_count += 1
                 error_msgs = "; ".join([f"{e.field_path}: {e.message}" for e in validation_result.errors])
                 logger.warning(f"Skipping invalid config '{file_path}': {error_msgs}")
-                
-        except (ConfigParseError, FileNotFoundError) as e:
+        elif isinstance(exc, (ConfigParseError, FileNotFoundError)):
             skipped_count += 1
-            logger.warning(f"Skipping malformed config '{file_path}': {str(e)}")
-        except PermissionError as e:
+            logger.warning(f"Skipping malformed config '{file_path}': {str(exc)}")
+        elif isinstance(exc, PermissionError):
             # AC 3: Handle unreadable config files (permissions error)
             skipped_count += 1
             logger.warning(f"Skipping unreadable config '{file_path}': Permission denied")
-        except Exception as e:
+        else:
             skipped_count += 1
-            logger.error(f"Unexpected error loading config '{file_path}': {str(e)}")
+            logger.error(f"Unexpected error loading config '{file_path}': {str(exc)}")
+
+    logger.info(f"Startup scan complete: {loaded_count} configs loaded, {skipped_count} skipped due to errors.")
+
 
-    logger.info(f"Startup scan complete: {len(loaded_configs)} configs loaded, {skipped_count} skipped due to errors.")
+def scan_config_directory(
+    directory_path: str = "./configs",
+    overrides: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Scan a directory for YAML configuration files and load them.
     
-    return loaded_configs
+    Eager wrapper around iter_scan_config_directory; see it for details.
+    
+    Returns:
+        A list of validated configuration dictionaries.
+    """
+    return list(iter_scan_config_directory(directory_path, overrides))
+
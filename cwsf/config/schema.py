@@ -13,19 +13,45 @@ Supported Versions:
 - "1.0": Initial schema version
 """
 
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
 # Supported schema versions
-SUPPORTED_VERSIONS = ["1.0"]
+SUPPORTED_VERSIONS = frozenset({"1.0"})
 
 # Allowed field transforms (NFR-6)
 ALLOWED_TRANSFORMS = ["strip", "regex", "to_int", "to_float", "default"]
 
+# Allowed values for enum-constrained settings, in the order the schema's
+# "enum" lists (and so its "is not one of" messages) give them
+FIELD_SELECTOR_TYPES = ("css", "xpath")
+SELECTOR_ENGINES = ("css", "xpath", "lexbor")
+RENDERERS = ("httpx", "playwright")
+WAIT_UNTIL_STATES = ("load", "domcontentloaded", "networkidle", "commit")
+ON_TIMEOUT_ACTIONS = ("proceed", "fail")
+PLAYWRIGHT_ACTIONS = ("click", "wait", "fill", "press", "hover")
+HTTP_METHODS = ("GET", "POST")
+TOKEN_SOURCE_TYPES = ("header", "cookie", "body_json", "body_selector")
+PAGINATION_TYPES = ("none", "url_pattern", "next_button", "scroll")
+OUTPUT_FORMATS = ("sqlite", "json", "csv")
+OUTPUT_MODES = ("append", "overwrite")
+
 # Mapping of version to JSON Schema
 SCHEMAS_BY_VERSION = {
     "1.0": None  # Will be populated with CONFIG_SCHEMA below
 }
 
+
+def _freeze(value: Dict[str, Any]) -> Mapping[str, Any]:
+    """Recursively wrap a dict (and its nested dicts) in read-only proxies."""
+    return MappingProxyType({
+        k: _freeze(v) if isinstance(v, dict) else v
+        for k, v in value.items()
+    })
+
+
 # Default values for optional configuration sections
-DEFAULT_CONFIG = {
+_DEFAULT_CONFIG_RAW = {
     "version": "1.0",
     "method": "GET",
     "headers": {},
@@ -57,6 +83,34 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Read-only view of the defaults, shared by every consumer without copying.
+# Use dict() on a section to get a mutable copy.
+DEFAULT_CONFIG: Mapping[str, Any] = _freeze(_DEFAULT_CONFIG_RAW)
+
+# JSON Schema for a single entry of selectors.fields. Kept separate from
+# CONFIG_SCHEMA so it can be compiled once and applied per field.
+FIELD_ITEM_SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["selector", "type"],
+    "properties": {
+        "selector": {
+            "type": "string",
+            "description": "CSS or XPath selector for the field"
+        },
+        "type": {
+            "type": "string",
+            "enum": list(FIELD_SELECTOR_TYPES),
+            "description": "Selector type"
+        },
+        "transform": {
+            "type": "string",
+            "enum": ALLOWED_TRANSFORMS,
+            "description": "Transform to apply (e.g., strip, regex)"
+        }
+    }
+}
+
 # JSON Schema for CWSF configuration validation (Version 1.0)
 CONFIG_SCHEMA = {
     "$schema": "http://json-schema.org/draft-07/schema#",
@@ -67,7 +121,7 @@ CONFIG_SCHEMA = {
     "properties": {
         "renderer": {
             "type": "string",
-            "enum": ["httpx", "playwright"],
+            "enum": list(RENDERERS),
             "default": "httpx",
             "description": "Engine to use for fetching pages"
         },
@@ -76,7 +130,7 @@ CONFIG_SCHEMA = {
             "properties": {
                 "wait_until": {
                     "type": "string",
-                    "enum": ["load", "domcontentloaded", "networkidle", "commit"],
+                    "enum": list(WAIT_UNTIL_STATES),
                     "default": "load",
                     "description": "When to consider navigation finished"
                 },
@@ -92,7 +146,7 @@ CONFIG_SCHEMA = {
                 },
                 "on_timeout": {
                     "type": "string",
-                    "enum": ["proceed", "fail"],
+                    "enum": list(ON_TIMEOUT_ACTIONS),
                     "default": "proceed",
                     "description": "Action to take if a wait condition times out"
                 },
@@ -105,7 +159,7 @@ CONFIG_SCHEMA = {
                         "properties": {
                             "action": {
                                 "type": "string",
-                                "enum": ["click", "wait", "fill", "press", "hover"],
+                                "enum": list(PLAYWRIGHT_ACTIONS),
                                 "description": "Action type"
                             },
                             "selector": {
@@ -125,7 +179,33 @@ CONFIG_SCHEMA = {
                                 "type": "string",
                                 "description": "Key to press (for 'press' action)"
                             }
-                        }
+                        },
+                        # Story 4.7: per-action required keys
+                        "allOf": [
+                            {
+                                "if": {
+                                    "required": ["action"],
+                                    "properties": {"action": {"enum": ["click", "fill", "hover", "press"]}}
+                                },
+                                "then": {
+                                    "required": ["selector"],
+                                    "properties": {"selector": {"not": {"type": "null"}, "minLength": 1}}
+                                }
+                            },
+                            {
+                                "if": {"required": ["action"], "properties": {"action": {"const": "wait"}}},
+                                # An explicit null counts as missing, too
+                                "then": {"required": ["seconds"], "properties": {"seconds": {"not": {"type": "null"}}}}
+                            },
+                            {
+                                "if": {"required": ["action"], "properties": {"action": {"const": "fill"}}},
+                                "then": {"required": ["value"], "properties": {"value": {"not": {"type": "null"}}}}
+                            },
+                            {
+                                "if": {"required": ["action"], "properties": {"action": {"const": "press"}}},
+                                "then": {"required": ["key"], "properties": {"key": {"not": {"type": "null"}}}}
+                            }
+                        ]
                     },
                     "default": []
                 }
@@ -148,7 +228,7 @@ CONFIG_SCHEMA = {
         },
         "method": {
             "type": "string",
-            "enum": ["GET", "POST"],
+            "enum": list(HTTP_METHODS),
             "description": "HTTP request method",
             "default": "GET"
         },
@@ -191,7 +271,7 @@ CONFIG_SCHEMA = {
                 },
                 "method": {
                     "type": "string",
-                    "enum": ["GET", "POST"],
+                    "enum": list(HTTP_METHODS),
                     "default": "POST",
                     "description": "HTTP method for login"
                 },
@@ -205,7 +285,7 @@ CONFIG_SCHEMA = {
                     "properties": {
                         "type": {
                             "type": "string",
-                            "enum": ["header", "cookie", "body_json", "body_selector"]
+                            "enum": list(TOKEN_SOURCE_TYPES)
                         },
                         "name": {
                             "type": "string",
@@ -216,7 +296,30 @@ CONFIG_SCHEMA = {
                             "description": "CSS/XPath selector for body_selector"
                         }
                     },
-                    "required": ["type"]
+                    "required": ["type"],
+                    # Story 4.6: body_selector needs a selector, the other types a name
+                    "allOf": [
+                        {
+                            "if": {
+                                "required": ["type"],
+                                "properties": {"type": {"const": "body_selector"}}
+                            },
+                            "then": {
+                                "required": ["selector"],
+                                "properties": {"selector": {"minLength": 1}}
+                            }
+                        },
+                        {
+                            "if": {
+                                "required": ["type"],
+                                "properties": {"type": {"enum": ["header", "cookie", "body_json"]}}
+                            },
+                            "then": {
+                                "required": ["name"],
+                                "properties": {"name": {"minLength": 1}}
+                            }
+                        }
+                    ]
                 }
             },
             "required": ["login_url"]
@@ -225,34 +328,28 @@ CONFIG_SCHEMA = {
             "type": "object",
             "required": ["container", "fields"],
             "properties": {
+                "engine": {
+                    "type": "string",
+                    "enum": list(SELECTOR_ENGINES),
+                    "default": "css",
+                    "description": "Selector type of the container, and of fields without a type ('xpath' skips CSS translation entirely; 'lexbor' parses with selectolax, CSS only)"
+                },
                 "container": {
                     "type": "string",
                     "description": "CSS/XPath selector for the container element"
                 },
+                "streaming": {
+                    "type": "boolean",
+                    "default": False,
+                    "description": "Extract records while the page is parsed instead of from a full tree (lower memory on very large pages; the container must be a simple CSS selector)"
+                },
                 "fields": {
                     "type": "object",
                     "minProperties": 1,
                     "description": "Field mappings for data extraction",
-                    "additionalProperties": {
-                        "type": "object",
-                        "required": ["selector", "type"],
-                        "properties": {
-                            "selector": {
-                                "type": "string",
-                                "description": "CSS or XPath selector for the field"
-                            },
-                            "type": {
-                                "type": "string",
-                                "enum": ["css", "xpath"],
-                                "description": "Selector type"
-                            },
-                            "transform": {
-                                "type": "string",
-                                "enum": ALLOWED_TRANSFORMS,
-                                "description": "Transform to apply (e.g., strip, regex)"
-                            }
-                        }
-                    }
+                    # Each mapping is checked against FIELD_ITEM_SCHEMA by
+                    # the validator, one field at a time
+                    "additionalProperties": True
                 }
             }
         },
@@ -261,7 +358,7 @@ CONFIG_SCHEMA = {
             "properties": {
                 "type": {
                     "type": "string",
-                    "enum": ["none", "url_pattern", "next_button", "scroll"],
+                    "enum": list(PAGINATION_TYPES),
                     "default": "none"
                 },
                 "param": {
@@ -289,6 +386,15 @@ CONFIG_SCHEMA = {
                     "description": "Time to wait for new content after scrolling"
                 }
             },
+            # Story 4.1: next_button pagination needs a selector for the link
+            "if": {
+                "required": ["type"],
+                "properties": {"type": {"const": "next_button"}}
+            },
+            "then": {
+                "required": ["selector"],
+                "properties": {"selector": {"minLength": 1}}
+            },
             "default": {
                 "type": "none",
                 "param": "page",
@@ -301,7 +407,7 @@ CONFIG_SCHEMA = {
             "properties": {
                 "format": {
                     "type": "string",
-                    "enum": ["sqlite", "json", "csv"],
+                    "enum": list(OUTPUT_FORMATS),
                     "default": "sqlite"
                 },
                 "destination": {
@@ -310,7 +416,7 @@ CONFIG_SCHEMA = {
                 },
                 "mode": {
                     "type": "string",
-                    "enum": ["append", "overwrite"],
+                    "enum": list(OUTPUT_MODES),
                     "default": "append",
                     "description": "How to handle existing data for the same site"
                 }
@@ -393,6 +499,20 @@ CONFIG_SCHEMA = {
                 }
             }
         }
+    },
+    # Story 4.1: scroll pagination only works with the playwright renderer
+    "if": {
+        "required": ["pagination"],
+        "properties": {
+            "pagination": {
+                "required": ["type"],
+                "properties": {"type": {"const": "scroll"}}
+            }
+        }
+    },
+    "then": {
+        "required": ["renderer"],
+        "properties": {"renderer": {"const": "playwright"}}
     }
 }
 
@@ -412,9 +532,10 @@ def get_schema_for_version(version: str) -> dict:
     Raises:
         ValueError: If the version is not supported.
     """
-    if version not in SUPPORTED_VERSIONS:
+    schema = SCHEMAS_BY_VERSION.get(version)
+    if schema is None:
         raise ValueError(
             f"Unsupported config version '{version}'. "
-            f"Supported versions: {SUPPORTED_VERSIONS}"
+            f"Supported versions: {sorted(SUPPORTED_VERSIONS)}"
         )
-    return SCHEMAS_BY_VERSION[version]
\ No newline at end of file
+    return schema
\ No newline at end of file
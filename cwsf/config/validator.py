@@ -5,7 +5,7 @@ against the JSON schema defined in schema.py.
 
 Error Output Format:
 --------------------
-The ValidationResult contains a list of ValidationError objects and a list of
+The ValidationResult contains a tuple of ValidationError objects and a tuple of
 ValidationWarning objects. Each ValidationError includes:
 - field_path: The path to the field that failed validation (e.g., "site_name", "selectors.fields.title.type")
 - message: Human-readable error message describing the issue
@@ -18,7 +18,7 @@ Each ValidationWarning includes:
 Example error output:
     ValidationResult(
         is_valid=False,
-        errors=[
+        errors=(
             ValidationError(
                 field_path="base_url",
                 message="'base_url' is a required property",
@@ -29,25 +29,42 @@ Example error output:
                 message="'PATCH' is not one of ['GET', 'POST']",
                 value="PATCH"
             )
-        ],
-        warnings=[
+        ),
+        warnings=(
             ValidationWarning(
                 field_path="rate_limit.unknown_key",
                 message="Unrecognized key 'unknown_key' in section 'rate_limit'"
-            )
-        ]
+            ),
+        )
     )
+
+Results are immutable and validate_config memoizes them by config content,
+so the same ValidationResult instance may be returned to several callers.
+
 """
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, field
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Callable, List, Mapping, Optional, Tuple
+from dataclasses import dataclass
 
-from jsonschema import validate, ValidationError as JsonSchemaValidationError, Draft7Validator
+# jsonschema is imported on first use (see _draft7_for): with the compiled
+# fast path, valid configs never need it.
+if TYPE_CHECKING:
+    from jsonschema import Draft7Validator
 
-from cwsf.config.schema import CONFIG_SCHEMA, SUPPORTED_VERSIONS, get_schema_for_version
+try:
+    import fastjsonschema
+except ImportError:  # optional dependency
+    fastjsonschema = None
 
+from cwsf.config.schema import FIELD_ITEM_SCHEMA, SUPPORTED_VERSIONS, get_schema_for_version
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class ValidationError:
     """Represents a single validation error.
     
@@ -61,7 +78,7 @@ class ValidationError:
     value: Any = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationWarning:
     """Represents a single validation warning (non-fatal issue).
     
@@ -73,32 +90,327 @@ class ValidationWarning:
     message: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Result of configuration validation.
     
     Attributes:
         is_valid: True if the configuration is valid, False otherwise
-        errors: List of ValidationError objects describing any validation failures
-        warnings: List of ValidationWarning objects describing non-fatal issues
+        errors: Tuple of ValidationError objects describing any validation failures
+        warnings: Tuple of ValidationWarning objects describing non-fatal issues
     """
     is_valid: bool
-    errors: List[ValidationError] = field(default_factory=list)
-    warnings: List["ValidationWarning"] = field(default_factory=list)
+    errors: Tuple[ValidationError, ...] = ()
+    warnings: Tuple["ValidationWarning", ...] = ()
     
     def __bool__(self) -> bool:
         """Allow using ValidationResult in boolean context."""
         return self.is_valid
 
 
+# Shared result for clean validations (no errors, no warnings)
+_VALID_EMPTY = ValidationResult(is_valid=True, errors=(), warnings=())
+
+
+def _compile_fast(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Compile a schema into a generated validator function, if possible.
+    
+    The compiled function only answers "valid or not": on failure we fall back
+    to Draft7Validator to build the detailed error list. Defaults and formats
+    are disabled to match Draft7Validator's behaviour (no data mutation, no
+    format checking). Returns None if fastjsonschema is unavailable or cannot
+    compile the schema.
+    """
+    if fastjsonschema is None:
+        return None
+    try:
+        return fastjsonschema.compile(
+            schema,
+            use_default=False,
+            use_formats=False,
+        )
+    except Exception:
+        return None
+
+
+def _passes_fast(compiled: Optional[Callable[[Any], Any]], config: Dict[str, Any]) -> bool:
+    """Return True if the compiled validator accepts config."""
+    if compiled is None:
+        return False
+    try:
+        compiled(config)
+    except fastjsonschema.JsonSchemaException:
+        return False
+    return True
+
+
+# Draft7Validators, keyed by id(schema) and built on first use. The schema is
+# kept alongside so its id cannot be reused while the entry exists.
+_DRAFT7_VALIDATORS: Dict[int, Tuple[Dict[str, Any], "Draft7Validator"]] = {}
+
+
+def _draft7_for(schema: Dict[str, Any]) -> "Draft7Validator":
+    """Return the Draft7Validator for schema, checking the schema on first use."""
+    entry = _DRAFT7_VALIDATORS.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        from jsonschema import Draft7Validator
+        Draft7Validator.check_schema(schema)
+        entry = (schema, Draft7Validator(schema))
+        _DRAFT7_VALIDATORS[id(schema)] = entry
+    return entry[1]
+
+
+def _schema_errors(
+    compiled: Optional[Callable[[Any], Any]],
+    schema: Dict[str, Any],
+    config: Any,
+) -> List[Any]:
+    """Return the jsonschema errors for config, or an empty list if it is valid.
+    
+    Valid configs are the common case, so they are recognised with the
+    compiled validator (or Draft7Validator.is_valid, which stops at the first
+    error) before any detailed errors are collected.
+    """
+    if compiled is not None:
+        if _passes_fast(compiled, config):
+            return []
+    elif _draft7_for(schema).is_valid(config):
+        return []
+    return list(_draft7_for(schema).iter_errors(config))
+
+
+# Compiled validators for the bundled schemas, built once at import
+_COMPILED = {version: _compile_fast(get_schema_for_version(version)) for version in SUPPORTED_VERSIONS}
+_FIELD_COMPILED = _compile_fast(FIELD_ITEM_SCHEMA)
+
+# Compiled validators for ad-hoc schemas, keyed like _DRAFT7_VALIDATORS
+_ADHOC_COMPILED: Dict[int, Tuple[Dict[str, Any], Optional[Callable[[Any], Any]]]] = {}
+
+
+def _adhoc_compiled(schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """Return the compiled validator for an ad-hoc schema, compiling it on first use."""
+    entry = _ADHOC_COMPILED.get(id(schema))
+    if entry is None or entry[0] is not schema:
+        entry = (schema, _compile_fast(schema))
+        _ADHOC_COMPILED[id(schema)] = entry
+    return entry[1]
+
+
+# Extracts the field name from "'<field_name>' is a required property"
+_REQUIRED_FIELD_RE = re.compile(r"'(\w+)'")
+
+# Stand-in for missing optional sections
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 # Known keys for rate_limit and retry sections (Story 5.6)
+
 _RATE_LIMIT_KNOWN_KEYS = {"delay_seconds", "max_concurrent"}
 _RETRY_KNOWN_KEYS = {"max_retries", "backoff_factor"}
+_RATE_LIMIT_KNOWN_KEYS_STR = str(sorted(_RATE_LIMIT_KNOWN_KEYS))
+_RETRY_KNOWN_KEYS_STR = str(sorted(_RETRY_KNOWN_KEYS))
+
+
+def _format_path(path: Any) -> str:
+    """Format a jsonschema error path as e.g. 'playwright_options.actions[0].selector'."""
+    # Most paths only go through object properties
+    if all(type(p) is str for p in path):
+        return ".".join(path)
+    parts: List[str] = []
+    for p in path:
+        if isinstance(p, int):
+            parts.append(f"[{p}]")
+        elif parts:
+            parts.append(f".{p}")
+        else:
+            parts.append(str(p))
+    return "".join(parts)
+
+
+def _conditional_error(error: Any, root: Any) -> Optional[Tuple[str, str, Any]]:
+    """Map a failed if/then rule of the config schema to its specific error.
+    
+    Cross-field rules (Stories 4.1, 4.6, 4.7) are expressed as if/then in the
+    schema, whose failures only read e.g. "'renderer' is a required
+    property". This returns the (field_path, message, value) the rule itself
+    describes, or None if error didn't come from a "then" branch.
+    """
+    schema_path = list(error.schema_path)
+    if "then" not in schema_path:
+        return None
+    rule = schema_path[:schema_path.index("then")]
+    # The object the rule applies to; for failed property checks (e.g.
+    # minLength) the error is on one of its values
+    path = list(error.path)
+    if error.validator == "required":
+        match = _REQUIRED_FIELD_RE.search(error.message)
+        key = match.group(1) if match else ""
+    else:
+        key = path.pop() if path else ""
+    owner = root
+    for part in path:
+        owner = owner[part]
+
+    if not rule:
+        return "pagination.type", "Scroll pagination requires 'renderer: playwright'", "scroll"
+    if rule[-1] == "pagination":
+        return "pagination.selector", "Next button pagination requires a 'selector'", None
+    if "token_from" in rule:
+        tf_type = owner.get("type")
+        if tf_type == "body_selector":
+            return "auth.token_from.selector", "token_from type 'body_selector' requires a 'selector'", None
+        return "auth.token_from.name", f"token_from type '{tf_type}' requires a 'name'", None
+    if "actions" in rule:
+        # Story 4.7: per-action required keys
+        action_type = owner.get("action")
+        field_path = f"{_format_path(path)}.{key}"
+        if key == "selector":
+            return field_path, f"Action '{action_type}' requires a 'selector'", None
+        return field_path, f"Action '{action_type}' requires '{key}'", None
+    return None
+
+
+def _append_schema_errors(
+    errors: List[ValidationError], schema_errors: List[Any], prefix: str = "", root: Any = None
+) -> None:
+    """Convert jsonschema errors into ValidationErrors and append them to errors.
+    
+    Args:
+        errors: The list to append to.
+        schema_errors: Errors from a jsonschema Draft7Validator.
+        prefix: Dotted path of the instance that was validated, if it is not
+            the config root.
+        root: The validated config, if it is the config root; failed
+            cross-field rules are then reported with their specific messages.
+    """
+    # Names used per error are bound to locals since invalid configs can
+    # produce many errors.
+    append = errors.append
+    VE = ValidationError
+    required_search = _REQUIRED_FIELD_RE.search
+    for error in schema_errors:
+        if root is not None:
+            conditional = _conditional_error(error, root)
+            if conditional is not None:
+                field_path, message, offending_value = conditional
+                append(VE(field_path=field_path, message=message, value=offending_value))
+                continue
+        path = error.path
+        field_path = _format_path(path) if path else ""
+        if prefix:
+            field_path = f"{prefix}.{field_path}" if field_path else prefix
+        # Clean up the message - remove the leading dot if present
+        message = error.message.lstrip(".")
+        offending_value = error.instance
+        
+        # For required field errors, extract the field name from the message
+        # JSON Schema error message format: "'<field_name>' is a required property"
+        if error.validator == 'required':
+            match = required_search(message)
+            if match:
+                field_path = f"{field_path}.{match.group(1)}" if field_path else match.group(1)
+            # For required fields, the value is None (field is missing)
+            offending_value = None
+        
+        # If field_path is still empty, use a reasonable default
+        append(VE(
+            field_path=field_path or "root",
+            message=message,
+            value=offending_value
+        ))
+
+
+def _unknown_key_warnings(
+    section: str, unknown: Any, known_keys_str: str, config_file: Optional[str]
+) -> List[ValidationWarning]:
+    """Build sorted 'Unrecognized key' warnings for a config section."""
+    file_prefix = f"[{config_file}] " if config_file else ""
+    return [
+        ValidationWarning(
+            field_path=f"{section}.{key}",
+            message=(
+                f"{file_prefix}Unrecognized key '{key}' in section '{section}'. "
+                f"Known keys: {known_keys_str}"
+            )
+        )
+        for key in sorted(unknown, key=str)
+    ]
+
+
+# Memoized validate_config results, keyed by a hash of the canonicalized
+# config plus the file name (which appears in warning messages)
+_RESULT_CACHE: "OrderedDict[bytes, ValidationResult]" = OrderedDict()
+_RESULT_CACHE_MAX_SIZE = 128
+
+
+# Scalar types a config digest can represent; each is tagged with its type
+# name, so e.g. 1, 1.0, True and "1" (or a str and a YAML date) never share one
+_DIGEST_SCALARS = frozenset((str, int, float, bool, type(None)))
+
+
+def _canonical(value: Any) -> str:
+    """A type-tagged canonical encoding of value; TypeError for unsupported types."""
+    kind = type(value)
+    if kind in _DIGEST_SCALARS:
+        return json.dumps([kind.__name__, value])
+    if kind is dict:
+        items = sorted(f"{_canonical(k)}:{_canonical(v)}" for k, v in value.items())
+        return "dict{" + ",".join(items) + "}"
+    if kind is list or kind is tuple:
+        return kind.__name__ + "[" + ",".join(_canonical(v) for v in value) + "]"
+    raise TypeError(f"Cannot digest a {kind.__name__}")
+
+
+def config_digest(value: Any) -> Optional[bytes]:
+    """Hash a config (or any nesting of dicts, lists and scalars) by content and type.
+    
+    Returns None if value contains anything else (e.g. a date from an
+    unquoted YAML scalar), so callers don't treat it as cacheable.
+    """
+    try:
+        canonical = _canonical(value)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+def _result_cache_key(config: Dict[str, Any], config_file: Optional[str]) -> Optional[bytes]:
+    """Hash a config for the result cache, or None if it can't be canonicalized."""
+    return config_digest((config_file, config))
 
 
 def validate_config(config: Dict[str, Any], config_file: Optional[str] = None) -> ValidationResult:
     """Validate a configuration dictionary against the CWSF schema.
     
+    Results are memoized by config content, so re-validating an unchanged
+    config returns the previous (immutable) ValidationResult.
+    
+    Args:
+        config: A dictionary representing the parsed configuration contents.
+        config_file: Optional name of the config file being validated, included
+            in error messages for clearer feedback.
+        
+    Returns:
+        A ValidationResult object; see _validate_config.
+    """
+    key = _result_cache_key(config, config_file)
+    if key is not None:
+        cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            _RESULT_CACHE.move_to_end(key)
+            return cached
+
+    result = _validate_config(config, config_file)
+
+    if key is not None:
+        _RESULT_CACHE[key] = result
+        if len(_RESULT_CACHE) > _RESULT_CACHE_MAX_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    return result
+
+
+def _validate_config(config: Dict[str, Any], config_file: Optional[str] = None) -> ValidationResult:
+    """Validate a configuration dictionary against the CWSF schema.
+    
     Args:
         config: A dictionary representing the parsed configuration contents.
         config_file: Optional name of the config file being validated, included
@@ -112,110 +424,79 @@ def validate_config(config: Dict[str, Any], config_file: Optional[str] = None) -
     """
     errors: List[ValidationError] = []
     warnings: List[ValidationWarning] = []
-    file_prefix = f"[{config_file}] " if config_file else ""
     
     # 1. Check for version field (required for version-specific schema selection)
     version = config.get("version")
     if not version:
         return ValidationResult(
             is_valid=False,
-            errors=[ValidationError(
+            errors=(ValidationError(
                 field_path="version",
                 message="'version' is a required property",
                 value=None
-            )]
+            ),)
         )
     
-    # 2. Check if version is supported
-    if version not in SUPPORTED_VERSIONS:
+    # 2. Check if version is supported (the version may be any YAML value,
+    # so make sure it is hashable before the set lookup)
+    if not isinstance(version, str) or version not in SUPPORTED_VERSIONS:
         return ValidationResult(
             is_valid=False,
-            errors=[ValidationError(
+            errors=(ValidationError(
                 field_path="version",
-                message=f"Unsupported config version '{version}'. Supported versions: {SUPPORTED_VERSIONS}",
+                message=f"Unsupported config version '{version}'. Supported versions: {sorted(SUPPORTED_VERSIONS)}",
                 value=version
-            )]
+            ),)
         )
     
-    # 3. Get schema for the specified version
-    try:
-        schema = get_schema_for_version(version)
-    except ValueError as e:
-        # This should theoretically be caught by the SUPPORTED_VERSIONS check above,
-        # but we'll handle it just in case.
-        return ValidationResult(
-            is_valid=False,
-            errors=[ValidationError(
-                field_path="version",
-                message=str(e),
-                value=version
-            )]
-        )
-    
-    # 4. Create a Draft7Validator instance for the specific schema
-    validator = Draft7Validator(schema)
+    # 3. Validate against the schema for that version; detailed errors are
+    # only collected when the config is invalid
+    schema_errors = _schema_errors(_COMPILED[version], get_schema_for_version(version), config)
     
     # Collect all validation errors
-    for error in validator.iter_errors(config):
-        field_path = ".".join(str(p) for p in error.path) if error.path else ""
-        message = error.message
-        offending_value = error.instance if error.instance is not None else None
-        
-        # Clean up the message - remove the leading dot if present
-        if message.startswith("."):
-            message = message[1:]
-        
-        # For required field errors, extract the field name from the message
-        # JSON Schema error message format: "'<field_name>' is a required property"
-        if error.validator == 'required':
-            # The error.message contains something like "'site_name' is a required property"
-            # We need to extract the field name
-            import re
-            match = re.search(r"'(\w+)'", message)
-            if match:
-                field_path = match.group(1)
-            # For required fields, the value is None (field is missing)
-            offending_value = None
-        
-        # If field_path is still empty, use a reasonable default
-        if not field_path:
-            field_path = "root"
-            
-        errors.append(ValidationError(
-            field_path=field_path,
-            message=message,
-            value=offending_value
-        ))
-    
-    # 5. Custom validation for rate_limit and retry unrecognized keys (Story 5.6)
-    rate_limit = config.get("rate_limit", {})
+    _append_schema_errors(errors, schema_errors, root=config)
+
+    # Field mappings are validated one by one against FIELD_ITEM_SCHEMA
+    # rather than as part of the whole-config schema walk
+    selectors = config.get("selectors")
+    fields = selectors.get("fields") if isinstance(selectors, dict) else None
+    if isinstance(fields, dict):
+        field_compiled = _FIELD_COMPILED
+        for name, field_config in fields.items():
+            field_errors = _schema_errors(field_compiled, FIELD_ITEM_SCHEMA, field_config)
+            if field_errors:
+                _append_schema_errors(errors, field_errors, f"selectors.fields.{name}")
+
+    # Sections read by the custom checks below, bound once. Missing sections
+    # fall back to a shared empty mapping instead of a fresh {} per call.
+    # The isinstance guards stay: these checks also run on configs that
+    # failed schema validation.
+    get = config.get
+    rate_limit = get("rate_limit") or _EMPTY
+    retry_section = get("retry") or _EMPTY
+    pagination = get("pagination") or _EMPTY
+
+    # 4. Custom validation for rate_limit and retry unrecognized keys (Story 5.6)
     if isinstance(rate_limit, dict):
-        for key in rate_limit:
-            if key not in _RATE_LIMIT_KNOWN_KEYS:
-                warnings.append(ValidationWarning(
-                    field_path=f"rate_limit.{key}",
-                    message=(
-                        f"{file_prefix}Unrecognized key '{key}' in section 'rate_limit'. "
-                        f"Known keys: {sorted(_RATE_LIMIT_KNOWN_KEYS)}"
-                    )
-                ))
-
-    retry_section = config.get("retry", {})
+        unknown = rate_limit.keys() - _RATE_LIMIT_KNOWN_KEYS
+        if unknown:
+            warnings.extend(_unknown_key_warnings(
+                "rate_limit", unknown, _RATE_LIMIT_KNOWN_KEYS_STR, config_file
+            ))
+
     if isinstance(retry_section, dict):
-        for key in retry_section:
-            if key not in _RETRY_KNOWN_KEYS:
-                warnings.append(ValidationWarning(
-                    field_path=f"retry.{key}",
-                    message=(
-                        f"{file_prefix}Unrecognized key '{key}' in section 'retry'. "
-                        f"Known keys: {sorted(_RETRY_KNOWN_KEYS)}"
-                    )
-                ))
-
-    # 6. Custom validation for pagination (Story 4.1 AC 5)
-    pagination = config.get("pagination", {})
+        unknown = retry_section.keys() - _RETRY_KNOWN_KEYS
+        if unknown:
+            warnings.extend(_unknown_key_warnings(
+                "retry", unknown, _RETRY_KNOWN_KEYS_STR, config_file
+            ))
+
+    # 5. Custom validation for url_pattern pagination (Story 4.1 AC 5). The
+    # placeholder depends on `param`, so this can't be a static schema rule;
+    # the next_button/scroll, auth.token_from and playwright action rules
+    # live in the schema.
     if pagination.get("type") == "url_pattern":
-        base_url = config.get("base_url", "")
+        base_url = get("base_url", "")
         param = pagination.get("param", "page")
         placeholder = f"{{{param}}}"
         if placeholder not in base_url:
@@ -224,76 +505,13 @@ def validate_config(config: Dict[str, Any], config_file: Optional[str] = None) -
                 message=f"URL pattern pagination requires placeholder '{placeholder}' in base_url",
                 value=base_url
             ))
-    
-    if pagination.get("type") == "next_button":
-        if not pagination.get("selector"):
-            errors.append(ValidationError(
-                field_path="pagination.selector",
-                message="Next button pagination requires a 'selector'",
-                value=None
-            ))
-
-    if pagination.get("type") == "scroll":
-        if config.get("renderer") != "playwright":
-            errors.append(ValidationError(
-                field_path="pagination.type",
-                message="Scroll pagination requires 'renderer: playwright'",
-                value="scroll"
-            ))
-
-    # 7. Custom validation for auth (Story 4.6)
-    auth = config.get("auth")
-    if auth:
-        token_from = auth.get("token_from")
-        if token_from:
-            tf_type = token_from.get("type")
-            if tf_type == "body_selector" and not token_from.get("selector"):
-                errors.append(ValidationError(
-                    field_path="auth.token_from.selector",
-                    message="token_from type 'body_selector' requires a 'selector'",
-                    value=None
-                ))
-            if tf_type in ["header", "cookie", "body_json"] and not token_from.get("name"):
-                errors.append(ValidationError(
-                    field_path=f"auth.token_from.name",
-                    message=f"token_from type '{tf_type}' requires a 'name'",
-                    value=None
-                ))
- 
-    # 8. Custom validation for playwright_options (Story 4.7)
-    playwright_options = config.get("playwright_options", {})
-    actions = playwright_options.get("actions", [])
-    for i, action in enumerate(actions):
-        action_type = action.get("action")
-        if action_type in ["click", "fill", "press", "hover"] and not action.get("selector"):
-            errors.append(ValidationError(
-                field_path=f"playwright_options.actions[{i}].selector",
-                message=f"Action '{action_type}' requires a 'selector'",
-                value=None
-            ))
-        if action_type == "wait" and action.get("seconds") is None:
-            errors.append(ValidationError(
-                field_path=f"playwright_options.actions[{i}].seconds",
-                message="Action 'wait' requires 'seconds'",
-                value=None
-            ))
-        if action_type == "fill" and action.get("value") is None:
-            errors.append(ValidationError(
-                field_path=f"playwright_options.actions[{i}].value",
-                message="Action 'fill' requires 'value'",
-                value=None
-            ))
-        if action_type == "press" and action.get("key") is None:
-            errors.append(ValidationError(
-                field_path=f"playwright_options.actions[{i}].key",
-                message="Action 'press' requires 'key'",
-                value=None
-            ))
 
+    if not errors and not warnings:
+        return _VALID_EMPTY
     return ValidationResult(
         is_valid=len(errors) == 0,
-        errors=errors,
-        warnings=warnings
+        errors=tuple(errors),
+        warnings=tuple(warnings)
     )
 
 
@@ -313,27 +531,24 @@ def validate_config_with_schema(config: Dict[str, Any], schema: Dict[str, Any])
     """
     errors: List[ValidationError] = []
     
-    validator = Draft7Validator(schema)
+    schema_errors = _schema_errors(_adhoc_compiled(schema), schema, config)
+    if not schema_errors:
+        return _VALID_EMPTY
     
-    for error in validator.iter_errors(config):
-        field_path = ".".join(str(p) for p in error.path) if error.path else error.json_path
-        message = error.message
-        offending_value = error.instance if error.instance is not None else None
-        
-        if message.startswith("."):
-            message = message[1:]
-        
+    append = errors.append
+    VE = ValidationError
+    for error in schema_errors:
+        path = error.path
+        field_path = ".".join(map(str, path)) if path else error.json_path
         # For required field errors, the value is None (field is missing)
-        if error.validator == 'required':
-            offending_value = None
-            
-        errors.append(ValidationError(
+        offending_value = None if error.validator == 'required' else error.instance
+        append(VE(
             field_path=field_path,
-            message=message,
+            message=error.message.lstrip("."),
             value=offending_value
         ))
     
     return ValidationResult(
         is_valid=len(errors) == 0,
-        errors=errors
+        errors=tuple(errors)
     )
@@ -4,22 +4,38 @@ This module implements a watcher that monitors the config directory for
 new, modified, or deleted YAML configuration files.
 """
 
+import heapq
+import itertools
 import logging
 import os
 import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from cwsf.config.loader import load_config, ConfigParseError
-from cwsf.config.validator import validate_config, ValidationError
-from watchdog.events import FileSystemEventHandler
+from cwsf.config.validator import validate_config, ValidationError, ValidationResult
+from watchdog.events import (
+    FileCreatedEvent,
+    FileDeletedEvent,
+    FileModifiedEvent,
+    FileMovedEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 from watchdog.observers.polling import PollingObserver
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of files whose parse/validation result ConfigWatcher keeps
+_PARSE_CACHE_MAX_SIZE = 1024
+
+# The only event types ConfigWatcherHandler acts on. Passing these to the
+# observer narrows the inotify mask on Linux, so opening/reading a config
+# (including our own loads) and directory events never reach Python.
+_WATCHED_EVENTS = [FileCreatedEvent, FileModifiedEvent, FileDeletedEvent, FileMovedEvent]
+
 
 class ConfigEventType(Enum):
     """Types of configuration change events."""
@@ -28,19 +44,34 @@ class ConfigEventType(Enum):
     REMOVED = auto()
     VALIDATED = auto()
     REJECTED = auto()
+    RENAMED = auto()
 
 
 @dataclass
 class ConfigEvent:
-    """Represents a configuration change event."""
+    """Represents a configuration change event.
+    
+    For RENAMED events, file_path is the new path and old_path the previous one.
+    """
     event_type: ConfigEventType
     file_path: str
     config: Optional[Dict[str, Any]] = None
     errors: List[ValidationError] = field(default_factory=list)
+    old_path: Optional[str] = None
 
 
 class ConfigWatcherHandler(FileSystemEventHandler):
-    """Handles file system events for configuration files."""
+    """Handles file system events for configuration files.
+    
+    Events are debounced per file by a single timer thread: each scheduled
+    event pushes (deadline, seq, file_path) onto a heap, and the thread sleeps
+    until the earliest deadline. seq increases with every scheduled event, so
+    ties are broken in scheduling order. Rescheduling a file leaves its old
+    heap entry in place; entries whose seq no longer matches the pending event
+    are dropped when they reach the top.
+    """
+
+    _EXTS = ('.yaml', '.yml')
 
     def __init__(
         self,
@@ -49,43 +80,86 @@ class ConfigWatcherHandler(FileSystemEventHandler):
     ):
         self.callback = callback
         self.debounce_seconds = debounce_seconds
-        self._pending_events: Dict[str, ConfigEvent] = {}
-        self._timers: Dict[str, threading.Timer] = {}
-        self._lock = threading.Lock()
+        # file_path -> (seq, event) for the latest event per file
+        self._pending_events: Dict[str, Tuple[int, ConfigEvent]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
 
     def _is_config_file(self, path: str) -> bool:
         """Check if the file is a valid YAML configuration file."""
-        filename = os.path.basename(path)
-        # Ignore temporary/editor swap files
-        if filename.startswith('.') or filename.endswith('~') or filename.endswith('.tmp'):
+        # Called for every raw event, so slice the name off by hand rather
+        # than going through os.path.basename
+        filename = path[path.rfind(os.sep) + 1:]
+        # Ignore temporary/editor swap files (a .tmp name can't also end in
+        # .yaml/.yml, so only dotfiles and ~ backups need excluding)
+        if not filename or filename[0] == '.' or filename[-1] == '~':
             return False
-        return filename.endswith(('.yaml', '.yml'))
+        return filename.endswith(self._EXTS)
 
-    def _emit_event(self, file_path: str):
-        """Emit the pending event for the given file path."""
-        with self._lock:
-            event = self._pending_events.pop(file_path, None)
-            self._timers.pop(file_path, None)
-            
-        if event:
+    def _next_due_event(self) -> Optional[ConfigEvent]:
+        """Block until a pending event is due and return it (None once stopped)."""
+        with self._cond:
+            while not self._stopped:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                deadline, seq, file_path = self._heap[0]
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    self._cond.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                pending = self._pending_events.get(file_path)
+                if pending is None or pending[0] != seq:
+                    # Superseded by a later event for the same file
+                    continue
+                del self._pending_events[file_path]
+                return pending[1]
+        return None
+
+    def _timer_loop(self):
+        """Emit debounced events as they become due."""
+        while True:
+            event = self._next_due_event()
+            if event is None:
+                return
             logger.info(f"Config {event.event_type.name.lower()}: {event.file_path}")
-            self.callback(event)
+            try:
+                self.callback(event)
+            except Exception as e:
+                logger.error(f"Error handling config event for '{event.file_path}': {e}", exc_info=True)
 
     def _schedule_event(self, event: ConfigEvent):
         """Schedule an event with debouncing."""
-        with self._lock:
-            # Cancel existing timer if any
-            if event.file_path in self._timers:
-                self._timers[event.file_path].cancel()
-            
-            self._pending_events[event.file_path] = event
-            timer = threading.Timer(
-                self.debounce_seconds,
-                self._emit_event,
-                args=[event.file_path]
-            )
-            self._timers[event.file_path] = timer
-            timer.start()
+        deadline = time.monotonic() + self.debounce_seconds
+        with self._cond:
+            seq = next(self._seq)
+            entry = (deadline, seq, event.file_path)
+            if event.old_path is not None:
+                # A rename replaces whatever was still pending for the old path
+                self._pending_events.pop(event.old_path, None)
+            self._pending_events[event.file_path] = (seq, event)
+            heapq.heappush(self._heap, entry)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._timer_loop, name="cwsf-config-debounce", daemon=True
+                )
+                self._thread.start()
+            elif self._heap[0] is entry:
+                # Only wake the timer thread if its next deadline moved earlier
+                self._cond.notify()
+
+    def stop(self):
+        """Stop the timer thread; pending events are discarded."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
 
     def on_created(self, event):
         if not event.is_directory and self._is_config_file(event.src_path):
@@ -101,11 +175,19 @@ class ConfigWatcherHandler(FileSystemEventHandler):
             self._schedule_event(ConfigEvent(ConfigEventType.REMOVED, event.src_path))
 
     def on_moved(self, event):
-        # Handle move as delete from src and add to dest
+        # A move between two config names is a rename; otherwise handle it as
+        # delete from src and/or add to dest
         if not event.is_directory:
-            if self._is_config_file(event.src_path):
+            src_is_config = self._is_config_file(event.src_path)
+            dest_is_config = self._is_config_file(event.dest_path)
+            if src_is_config and dest_is_config:
+                self._schedule_event(ConfigEvent(
+                    ConfigEventType.RENAMED, event.dest_path, old_path=event.src_path
+                ))
+                return
+            if src_is_config:
                 self._schedule_event(ConfigEvent(ConfigEventType.REMOVED, event.src_path))
-            if self._is_config_file(event.dest_path):
+            if dest_is_config:
                 self._schedule_event(ConfigEvent(ConfigEventType.ADDED, event.dest_path))
 
 
@@ -125,6 +207,9 @@ class ConfigWatcher:
         self.polling_interval = polling_interval
         self.debounce_seconds = debounce_seconds
         self._last_known_good: Dict[str, Dict[str, Any]] = {}
+        # file_path -> (mtime_ns, size, config, validation result), so repeated
+        # events for an unchanged file skip parsing and validation
+        self._parse_cache: Dict[str, Tuple[int, int, Dict[str, Any], ValidationResult]] = {}
         
         self.handler = ConfigWatcherHandler(self._handle_raw_event, debounce_seconds)
         
@@ -133,19 +218,29 @@ class ConfigWatcher:
         else:
             self.observer = Observer(timeout=polling_interval)
             
-        self.observer.schedule(self.handler, self.directory_path, recursive=False)
+        self.observer.schedule(
+            self.handler, self.directory_path, recursive=False, event_filter=_WATCHED_EVENTS
+        )
 
     def _handle_raw_event(self, event: ConfigEvent):
         """Handle raw file system events and perform auto-validation."""
         if event.event_type == ConfigEventType.REMOVED:
             self._last_known_good.pop(event.file_path, None)
+            self._parse_cache.pop(event.file_path, None)
             self.callback(event)
             return
 
+        if event.event_type == ConfigEventType.RENAMED:
+            if self._rename_cached(event):
+                return
+            # The old file's result can't be reused: report it removed and
+            # validate the new path like an added file
+            self.callback(ConfigEvent(ConfigEventType.REMOVED, event.old_path))
+            event = ConfigEvent(ConfigEventType.ADDED, event.file_path)
+
         # For ADDED and MODIFIED, perform validation
         try:
-            config_dict = load_config(event.file_path)
-            validation_result = validate_config(config_dict)
+            config_dict, validation_result = self._load_and_validate(event.file_path)
 
             if validation_result.is_valid:
                 self._last_known_good[event.file_path] = config_dict
@@ -156,41 +251,44 @@ class ConfigWatcher:
                 )
                 self.callback(validated_event)
             else:
-                error_msgs = "; ".join([f"{e.field_path}: {e.message}" for e in validation_result.errors])
-                
-                if event.file_path in self._last_known_good:
-                    logger.warning(
-                        f"Config '{event.file_path}' is now invalid; retaining last-known-good job for site '{self._last_known_good[event.file_path].get('site_name')}'. "
-                        f"Errors: {error_msgs}"
-                    )
-                else:
-                    logger.warning(f"Config rejected '{event.file_path}': {error_msgs}")
+                # Only format the error list if the warning will be emitted
+                if logger.isEnabledFor(logging.WARNING):
+                    error_msgs = "; ".join(f"{e.field_path}: {e.message}" for e in validation_result.errors)
+                    
+                    if event.file_path in self._last_known_good:
+                        logger.warning(
+                            "Config '%s' is now invalid; retaining last-known-good job for site '%s'. Errors: %s",
+                            event.file_path, self._last_known_good[event.file_path].get('site_name'), error_msgs
+                        )
+                    else:
+                        logger.warning("Config rejected '%s': %s", event.file_path, error_msgs)
 
                 rejected_event = ConfigEvent(
                     event_type=ConfigEventType.REJECTED,
                     file_path=event.file_path,
-                    errors=validation_result.errors
+                    errors=list(validation_result.errors)
                 )
                 self.callback(rejected_event)
 
         except (ConfigParseError, FileNotFoundError) as e:
+            error_msg = str(e)
             if event.file_path in self._last_known_good:
                 logger.warning(
-                    f"Config '{event.file_path}' is now malformed; retaining last-known-good job for site '{self._last_known_good[event.file_path].get('site_name')}'. "
-                    f"Error: {str(e)}"
+                    "Config '%s' is now malformed; retaining last-known-good job for site '%s'. Error: %s",
+                    event.file_path, self._last_known_good[event.file_path].get('site_name'), error_msg
                 )
             else:
-                logger.warning(f"Config rejected '{event.file_path}': {str(e)}")
+                logger.warning("Config rejected '%s': %s", event.file_path, error_msg)
             
             rejected_event = ConfigEvent(
                 event_type=ConfigEventType.REJECTED,
                 file_path=event.file_path,
-                errors=[ValidationError(field_path="", message=str(e))]
+                errors=[ValidationError(field_path="", message=error_msg)]
             )
             self.callback(rejected_event)
         except PermissionError as e:
             # AC 3: Handle unreadable config files (permissions error)
-            logger.warning(f"Skipping unreadable config '{event.file_path}': Permission denied")
+            logger.warning("Skipping unreadable config '%s': Permission denied", event.file_path)
             rejected_event = ConfigEvent(
                 event_type=ConfigEventType.REJECTED,
                 file_path=event.file_path,
@@ -198,7 +296,61 @@ class ConfigWatcher:
             )
             self.callback(rejected_event)
         except Exception as e:
-            logger.error(f"Unexpected error validating config '{event.file_path}': {str(e)}")
+            logger.error("Unexpected error validating config '%s': %s", event.file_path, e)
+
+    def _rename_cached(self, event: ConfigEvent) -> bool:
+        """Move the old path's valid cached config to the new path and emit RENAMED.
+        
+        A rename keeps mtime and size, so if those still match the parse cache
+        the file doesn't need to be parsed or validated again. Returns False
+        (leaving both caches without the old path) if the cache can't be used.
+        """
+        old_path = event.old_path
+        config_dict = self._last_known_good.pop(old_path, None)
+        cached = self._parse_cache.pop(old_path, None)
+        if config_dict is None or cached is None or cached[2] is not config_dict:
+            return False
+        try:
+            st = os.stat(event.file_path)
+        except OSError:
+            return False
+        if cached[0] != st.st_mtime_ns or cached[1] != st.st_size:
+            return False
+
+        self._last_known_good[event.file_path] = config_dict
+        self._parse_cache.pop(event.file_path, None)
+        self._parse_cache[event.file_path] = cached
+        self.callback(ConfigEvent(
+            event_type=ConfigEventType.RENAMED,
+            file_path=event.file_path,
+            config=config_dict,
+            old_path=old_path,
+        ))
+        return True
+
+    def _load_and_validate(self, file_path: str) -> Tuple[Dict[str, Any], ValidationResult]:
+        """Load and validate a config, reusing the last result if the file is unchanged."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            # Let load_config raise its usual error for missing/unreadable files
+            st = None
+            self._parse_cache.pop(file_path, None)
+        else:
+            cached = self._parse_cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2], cached[3]
+
+        config_dict = load_config(file_path)
+        validation_result = validate_config(config_dict)
+
+        if st is not None:
+            self._parse_cache.pop(file_path, None)
+            self._parse_cache[file_path] = (st.st_mtime_ns, st.st_size, config_dict, validation_result)
+            if len(self._parse_cache) > _PARSE_CACHE_MAX_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del self._parse_cache[next(iter(self._parse_cache))]
+        return config_dict, validation_result
 
     def start(self):
         """Start the watcher."""
@@ -212,4 +364,5 @@ class ConfigWatcher:
         """Stop the watcher."""
         self.observer.stop()
         self.observer.join()
+        self.handler.stop()
         logger.info("Stopped config watcher")
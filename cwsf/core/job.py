@@ -4,8 +4,9 @@ This module defines the Job data model and JobStatus enum used by the
 queue and orchestrator to manage scraping tasks.
 """
 
+import sys
 import uuid
-from dataclasses import dataclass, field, asdict
+from dataclasses import FrozenInstanceError, dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, Optional
@@ -20,7 +21,7 @@ class JobStatus(Enum):
     CANCELLED = "CANCELLED"
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class FailureContext:
     """Context for a failed request after retry exhaustion."""
     site_name: str
@@ -32,69 +33,126 @@ class FailureContext:
     timestamp: str  # ISO 8601
 
 
-@dataclass(frozen=True)
 class Job:
     """Represents a scraping job derived from a site configuration.
     
     Two jobs are considered equal if their job_id values match.
+    
+    Jobs are immutable. Values the queue and orchestrator read on every job
+    (priority, base_url) are extracted from the config once at construction,
+    and with_status/with_config copy the remaining slots directly.
     """
-    site_name: str
-    config: Dict[str, Any]
-    job_id: str = field(default_factory=lambda: "")  # Will be set in __post_init__
-    priority: int = 10
-    status: JobStatus = JobStatus.PENDING
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-
-    def __post_init__(self):
-        """Initialize job_id and priority if not provided."""
+
+    __slots__ = (
+        'site_name', 'config', 'job_id', 'priority', 'status',
+        'created_at', 'updated_at', 'base_url', '_hash',
+    )
+
+    def __init__(
+        self,
+        site_name: str,
+        config: Dict[str, Any],
+        job_id: str = "",
+        priority: int = 10,
+        status: JobStatus = JobStatus.PENDING,
+        created_at: Optional[datetime] = None,
+        updated_at: Optional[datetime] = None,
+    ):
         # job_id is derived from site_name as per Story 2.4
-        if not self.job_id:
-            # We use object.__setattr__ because the dataclass is frozen
-            object.__setattr__(self, 'job_id', self.site_name)
-        
         # Priority from config if present, otherwise use default
-        config_priority = self.config.get('priority')
+        config_priority = config.get('priority')
         if config_priority is not None:
-            object.__setattr__(self, 'priority', int(config_priority))
+            priority = int(config_priority)
+        if created_at is None or updated_at is None:
+            now = datetime.now(timezone.utc)
+            created_at = created_at or now
+            updated_at = updated_at or now
+        # Site names are held by the queue, orchestrator and run history;
+        # interning lets them all share one string
+        site_name = sys.intern(site_name)
+        _set = object.__setattr__
+        _set(self, 'site_name', site_name)
+        _set(self, 'config', config)
+        _set(self, 'job_id', job_id or site_name)
+        _set(self, 'priority', priority)
+        _set(self, 'status', status)
+        _set(self, 'created_at', created_at)
+        _set(self, 'updated_at', updated_at)
+        _set(self, 'base_url', config.get('base_url', 'unknown'))
+        # The queue hashes jobs on every enqueue/dequeue, so hash job_id once
+        _set(self, '_hash', hash(self.job_id))
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (Job, (
+            self.site_name, self.config, self.job_id, self.priority,
+            self.status, self.created_at, self.updated_at,
+        ))
+
+    def __repr__(self) -> str:
+        return (
+            f"Job(site_name={self.site_name!r}, job_id={self.job_id!r}, "
+            f"priority={self.priority!r}, status={self.status!r}, "
+            f"created_at={self.created_at!r}, updated_at={self.updated_at!r})"
+        )
 
     def __eq__(self, other):
         if not isinstance(other, Job):
             return False
-        return self.job_id == other.job_id
+        # Differing hashes skip the job_id string comparison
+        return self._hash == other._hash and self.job_id == other.job_id
 
     def __hash__(self):
-        return hash(self.job_id)
+        return self._hash
 
     def to_dict(self) -> Dict[str, Any]:
-        """Serialize the job to a dictionary."""
-        data = asdict(self)
-        data['status'] = self.status.value
-        data['created_at'] = self.created_at.isoformat()
-        data['updated_at'] = self.updated_at.isoformat()
-        return data
-
-    def with_status(self, status: JobStatus) -> 'Job':
-        """Return a new Job instance with the updated status."""
-        return Job(
-            site_name=self.site_name,
-            config=self.config,
-            job_id=self.job_id,
-            priority=self.priority,
-            status=status,
-            created_at=self.created_at,
-            updated_at=datetime.now(timezone.utc)
-        )
+        """Serialize the job to a dictionary.
+        
+        The config is included by reference, not copied.
+        """
+        return {
+            'site_name': self.site_name,
+            'config': self.config,
+            'job_id': self.job_id,
+            'priority': self.priority,
+            'status': self.status.value,
+            'created_at': self.created_at.isoformat(),
+            'updated_at': self.updated_at.isoformat(),
+        }
 
-    def with_config(self, config: Dict[str, Any]) -> 'Job':
-        """Return a new Job instance with the updated config."""
+    def _replace(self, **changes: Any) -> 'Job':
+        """Return a copy of this job with the given slots replaced."""
+        job = object.__new__(Job)
+        _set = object.__setattr__
+        for name in Job.__slots__:
+            _set(job, name, changes[name] if name in changes else getattr(self, name))
+        return job
+
+    def with_status(self, status: JobStatus, now: Optional[datetime] = None) -> 'Job':
+        """Return a new Job instance with the updated status.
+        
+        Args:
+            status: The new status.
+            now: Timestamp to use for updated_at; defaults to the current time.
+        """
+        return self._replace(status=status, updated_at=now or datetime.now(timezone.utc))
+
+    def with_config(self, config: Dict[str, Any], now: Optional[datetime] = None) -> 'Job':
+        """Return a new Job instance with the updated config.
+        
+        Args:
+            config: The new site configuration.
+            now: Timestamp to use for updated_at; defaults to the current time.
+        """
         priority = config.get('priority', self.priority)
-        return Job(
-            site_name=self.site_name,
+        return self._replace(
             config=config,
-            job_id=self.job_id,
             priority=int(priority),
-            status=self.status,
-            created_at=self.created_at,
-            updated_at=datetime.now(timezone.utc)
+            base_url=config.get('base_url', 'unknown'),
+            updated_at=now or datetime.now(timezone.utc),
         )
@@ -6,19 +6,62 @@ This module coordinates the configuration discovery, job queue, and scraping eng
 import logging
 from cwsf.utils.logging import setup_logging
 import os
+import sys
 import asyncio
 import time
-from typing import Dict, Optional, List, Any
+from datetime import datetime, timezone
+from types import ModuleType
+from typing import Dict, Optional, List, Any, Tuple
 
 from cwsf.config.watcher import ConfigEvent, ConfigEventType, ConfigWatcher
-from cwsf.config.loader import scan_config_directory
+from cwsf.config.loader import iter_scan_config_directory
+from cwsf.config.validator import config_digest
 from cwsf.core.job import Job, JobStatus
 from cwsf.core.queue import PriorityJobQueue
-from cwsf.utils.notifications import GotifyNotifier, RunSummary
+from cwsf.utils.notifications import FailureContext, GotifyNotifier, RunSummary
 from cwsf.utils.run_history import RunHistoryStore, RunResult
 
 logger = logging.getLogger(__name__)
 
+# The scraping engine (httpx, parsel, output writers) is imported on the
+# first job rather than at import time; see _get_engine.
+_engine = None
+
+
+def _get_engine() -> ModuleType:
+    """Return the cwsf.engine.orchestrator module, importing it on first use."""
+    global _engine
+    if _engine is None:
+        import cwsf.engine.orchestrator as engine
+        _engine = engine
+    return _engine
+
+
+# How often continuous mode logs a run summary, if any jobs ran
+_SUMMARY_INTERVAL_SECONDS = 60
+
+# Buffered run history is written once this many runs are pending (and
+# whenever the run loop goes idle, and at the end of a run)
+_HISTORY_FLUSH_SIZE = 16
+
+
+def _summary_glyphs() -> Tuple[str, str, str]:
+    """Return the (success, failure, separator) glyphs for the run summary.
+    
+    The summary is logged to stdout, so fall back to ASCII when its encoding
+    can't represent the Unicode glyphs (e.g. LANG=C or a legacy Windows console).
+    """
+    try:
+        "✓✗—".encode(getattr(sys.stdout, "encoding", None) or "ascii")
+    except (LookupError, UnicodeEncodeError):
+        return ("+", "-", "-")
+    return ("✓", "✗", "—")
+
+
+def _config_fingerprint(config: Dict[str, Any]) -> Optional[bytes]:
+    """Return a stable hash of a config dict, or None if it can't be serialized."""
+    return config_digest(config)
+
 
 class Orchestrator:
     """Coordinates the framework components.
@@ -36,24 +79,90 @@ class Orchestrator:
         config_dir: str = "./configs",
         gotify_config: Optional[Dict[str, Any]] = None,
         config_overrides: Optional[Dict[str, Any]] = None,   # NEW
+        max_concurrency: int = 5,
     ):
         self.queue = queue
         self.config_dir = config_dir
         self._config_overrides = config_overrides or {}
+        # Maximum number of jobs run at once in one-shot mode
+        self._max_concurrency = max_concurrency
         # Map file paths to site names to handle removals
         self._file_to_site: Dict[str, str] = {}
+        # Fingerprint of the config last enqueued per site
+        self._config_fingerprints: Dict[str, Optional[bytes]] = {}
         self._watcher: Optional[ConfigWatcher] = None
         self._stop_event = asyncio.Event()
         self.notifier = GotifyNotifier(gotify_config)
         self._results: List[Any] = []
         self.last_run_summary: Optional[RunSummary] = None
-        self.run_history = RunHistoryStore()
+        self.run_history = RunHistoryStore(flush_threshold=_HISTORY_FLUSH_SIZE)
+        # Config events arrive on the watcher's thread and are handed to the
+        # event loop through this queue, then applied in batches by _run_loop
+        self._event_queue: "asyncio.Queue[ConfigEvent]" = asyncio.Queue()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Set when _run_loop may have work: config events, jobs or a stop request
+        self._work_available = asyncio.Event()
 
     def handle_config_event(self, event: ConfigEvent):
         """Handle configuration discovery events and update the job queue.
         
         This implements Story 2.6: Wiring Discovery Events to the Job Queue.
+        While the orchestrator is running, events are queued for the event
+        loop rather than applied on the caller's thread.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._apply_config_event(event)
+            return
+        loop.call_soon_threadsafe(self._queue_config_event, event)
+
+    def _queue_config_event(self, event: ConfigEvent):
+        """Queue a config event for _run_loop and wake it (runs on the event loop)."""
+        self._event_queue.put_nowait(event)
+        self._work_available.set()
+
+    def _drain_config_events(self, max_events: int = 64) -> int:
+        """Apply up to max_events queued config events; return how many were applied.
+        
+        An event is skipped if a later event in the same batch replaces or
+        removes the job for the same file anyway. A REMOVED is only
+        superseded by a later REMOVED: a later VALIDATED may map the file to
+        a different site and would leave the old one queued. RENAMED events
+        are always applied since they also move the old path's job.
         """
+        queue = self._event_queue
+        batch: List[ConfigEvent] = []
+        while len(batch) < max_events and not queue.empty():
+            batch.append(queue.get_nowait())
+        if not batch:
+            return 0
+
+        events: List[ConfigEvent] = []
+        removed_later = set()
+        validated_later = set()
+        for event in reversed(batch):
+            event_type = event.event_type
+            if event_type != ConfigEventType.RENAMED and (
+                event.file_path in removed_later
+                or (event_type != ConfigEventType.REMOVED and event.file_path in validated_later)
+            ):
+                continue
+            events.append(event)
+            if event_type == ConfigEventType.REMOVED:
+                removed_later.add(event.file_path)
+            elif event_type == ConfigEventType.VALIDATED:
+                validated_later.add(event.file_path)
+
+        for event in reversed(events):
+            self._apply_config_event(event)
+        logger.info(
+            f"Applied {len(events)} config event(s) "
+            f"({len(batch) - len(events)} superseded); queue size: {self.queue.size()}"
+        )
+        return len(events)
+
+    def _apply_config_event(self, event: ConfigEvent):
+        """Update the job queue for a single configuration event."""
         if event.event_type == ConfigEventType.VALIDATED:
             config = event.config
             if not config:
@@ -65,24 +174,54 @@ class Orchestrator:
                 logger.error(f"Config from {event.file_path} missing site_name")
                 return
 
+            # Interned so _file_to_site, the fingerprint map and the Job
+            # share one copy of each site name
+            site_name = sys.intern(site_name)
+
             # Track which site this file belongs to
             self._file_to_site[event.file_path] = site_name
 
+            # Skip re-enqueueing when the config is unchanged (e.g. a touch
+            # or an editor rewriting identical contents)
+            fingerprint = _config_fingerprint(config)
+            if fingerprint is not None and self._config_fingerprints.get(site_name) == fingerprint:
+                logger.debug(f"Config for {site_name} unchanged ({event.file_path}); queue not updated")
+                return
+            self._config_fingerprints[site_name] = fingerprint
+
             # Create or update job
             job = Job(site_name=site_name, config=config)
             
             # PriorityJobQueue.enqueue handles both new and existing (PENDING/RUNNING) jobs
             self.queue.enqueue(job)
-            logger.info(f"Queue updated: {site_name} from {event.file_path}")
+            logger.debug(f"Queue updated: {site_name} from {event.file_path}")
 
         elif event.event_type == ConfigEventType.REMOVED:
             site_name = self._file_to_site.pop(event.file_path, None)
             if site_name:
+                self._config_fingerprints.pop(site_name, None)
                 self.queue.remove(site_name)
-                logger.info(f"Queue removed: {site_name} (file {event.file_path} deleted)")
+                logger.debug(f"Queue removed: {site_name} (file {event.file_path} deleted)")
             else:
                 logger.debug(f"Removed file {event.file_path} was not associated with any active site")
 
+        elif event.event_type == ConfigEventType.RENAMED:
+            site_name = self._file_to_site.pop(event.old_path, None)
+            if site_name is None:
+                # The old path had no job; treat the new file as newly validated
+                self._apply_config_event(ConfigEvent(
+                    ConfigEventType.VALIDATED, event.file_path, config=event.config
+                ))
+                return
+            # Renaming over another config file replaces that file's site
+            replaced = self._file_to_site.get(event.file_path)
+            if replaced is not None and replaced != site_name:
+                self._config_fingerprints.pop(replaced, None)
+                self.queue.remove(replaced)
+                logger.debug(f"Queue removed: {replaced} (file {event.file_path} replaced)")
+            self._file_to_site[event.file_path] = site_name
+            logger.debug(f"Config for {site_name} renamed: {event.old_path} -> {event.file_path}")
+
         elif event.event_type == ConfigEventType.REJECTED:
             # Story 2.6 Criterion 4 & 5:
             # - New file rejected: no job created (already handled by watcher not emitting VALIDATED)
@@ -119,11 +258,12 @@ class Orchestrator:
             
         logger.info(f"Starting CWSF in {mode_str} mode")
 
-        # 1. Startup scan
-        configs = scan_config_directory(self.config_dir, overrides=self._config_overrides or None)
+        # 1. Startup scan. Configs are enqueued as they are loaded.
+        configs = iter_scan_config_directory(self.config_dir, overrides=self._config_overrides or None)
         
         if site_name:
             # Story 8.3: Filter for specific site name
+            configs = list(configs)
             matched_config = next((c for c in configs if c.get("site_name") == site_name), None)
             if not matched_config:
                 available_sites = [c.get("site_name") for c in configs if c.get("site_name")]
@@ -135,27 +275,34 @@ class Orchestrator:
             
             configs = [matched_config]
 
-        if not configs and once and self.queue.size() == 0:
-            logger.warning("No valid configs discovered in one-shot mode.")
-            await self._generate_and_log_summary(0)
-            return
-
+        enqueued_count = 0
         for config in configs:
             site_name_val = config.get("site_name")
             job = Job(site_name=site_name_val, config=config)
             self.queue.enqueue(job)
+            enqueued_count += 1
 
         if once:
-            # 2. Process all jobs and exit
-            start_time = time.perf_counter()
-            await self._process_queue_until_empty()
-            duration = time.perf_counter() - start_time
-            
-            # 3. Generate and log summary (Story 7.4)
-            await self._generate_and_log_summary(duration)
+            # Resources kept between jobs are released however the run ends
+            try:
+                if not enqueued_count and self.queue.size() == 0:
+                    logger.warning("No valid configs discovered in one-shot mode.")
+                    await self._generate_and_log_summary(0)
+                    return
+
+                # 2. Process all jobs and exit
+                start_time = time.perf_counter()
+                await self._process_queue_until_empty()
+                duration = time.perf_counter() - start_time
+                
+                # 3. Generate and log summary (Story 7.4)
+                await self._generate_and_log_summary(duration)
+            finally:
+                await self._close_engine()
             logger.info("One-shot execution complete.")
         else:
             # 2. Start watcher and run indefinitely
+            self._loop = asyncio.get_running_loop()
             self._watcher = ConfigWatcher(self.config_dir, self.handle_config_event)
             self._watcher.start()
             
@@ -163,19 +310,56 @@ class Orchestrator:
                 await self._run_loop()
             finally:
                 self._watcher.stop()
+                self._loop = None
+                await self._flush_run_history()
+                await self._close_engine()
+
+    async def _close_engine(self):
+        """Release resources kept between jobs (Playwright browser, connection pools, run history connection)."""
+        if _engine is not None:
+            await _engine.close_shared_resources()
+        await self.notifier.aclose()
+        await asyncio.to_thread(self.run_history.close)
+
+    async def _record_run_history(self, run: RunResult):
+        """Buffer one run's history (Story 8.7); a failed write is logged, not raised."""
+        try:
+            await self.run_history.record_run_async(run)
+        except Exception as e:
+            logger.error(f"Failed to record run history: {e}")
+
+    async def _flush_run_history(self):
+        """Write buffered run history in a single transaction, off the event loop."""
+        try:
+            await self.run_history.flush_async()
+        except Exception as e:
+            logger.error(f"Failed to record run history: {e}")
 
     async def _generate_and_log_summary(self, duration: float):
         """Generate, log, and notify the run summary (Story 7.4, 7.5, 7.6)."""
+        await self._flush_run_history()
+
+        # Aggregate totals and build the per-site lines in a single pass
         total_sites = len(self._results)
-        sites_succeeded = sum(1 for r in self._results if not r.errors)
-        sites_failed = total_sites - sites_succeeded
-        total_records = sum(len(r.records) for r in self._results)
-        total_errors = sum(len(r.errors) for r in self._results)
-        
+        sites_succeeded = 0
+        total_records = 0
+        total_errors = 0
         failed_sites = {}
+        site_lines = []
+        success_icon, fail_icon, dash = _summary_glyphs()
         for r in self._results:
-            if r.errors:
+            error_count = len(r.errors)
+            record_count = r.record_count
+            total_records += record_count
+            total_errors += error_count
+            site_name = r.site_name or "unknown"
+            if error_count:
                 failed_sites[r.site_name] = r.errors[0] # Use first error as summary
+                site_lines.append(f"    {fail_icon} {site_name:<15} {dash} {r.errors[0]}")
+            else:
+                sites_succeeded += 1
+                site_lines.append(f"    {success_icon} {site_name:<15} {dash} {record_count} records")
+        sites_failed = total_sites - sites_succeeded
 
         summary = RunSummary(
             total_sites=total_sites,
@@ -196,19 +380,11 @@ class Orchestrator:
             f"Sites Failed:    {sites_failed}",
             f"Total Records:   {total_records}",
             "",
-            "Per-Site Results:"
+            "Per-Site Results:",
+            *site_lines,
+            "========================================",
         ]
         
-        for r in self._results:
-            status_icon = "✗" if r.errors else "✓"
-            site_name = r.site_name or "unknown"
-            if r.errors:
-                summary_lines.append(f"    {status_icon} {site_name:<15} — {r.errors[0]}")
-            else:
-                summary_lines.append(f"    {status_icon} {site_name:<15} — {len(r.records)} records")
-        
-        summary_lines.append("========================================")
-        
         logger.info("\n".join(summary_lines))
         
         # Send summary notification if failures occurred (Story 7.5 AC 7)
@@ -220,69 +396,103 @@ class Orchestrator:
         self._results = []
 
     async def _process_queue_until_empty(self):
-        """Process all jobs currently in the queue and exit."""
-        while self.queue.size() > 0:
+        """Process all jobs currently in the queue and exit.
+        
+        Sites are scraped independently, so up to max_concurrency jobs run at
+        once. Results are put back in dequeue (priority) order afterwards so
+        the summary doesn't depend on which job finished first.
+        """
+        jobs: List[Job] = []
+        while True:
             job = self.queue.dequeue()
-            if job:
+            if job is None:
+                break
+            jobs.append(job)
+        if not jobs:
+            return
+
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def _job_task(job: Job):
+            async with semaphore:
                 await self._execute_job(job)
-            await asyncio.sleep(0.1)
+
+        await asyncio.gather(*(_job_task(job) for job in jobs))
+
+        order = {job.site_name: i for i, job in enumerate(jobs)}
+        self._results.sort(key=lambda r: order.get(r.site_name, len(order)))
 
     async def _run_loop(self):
-        """Main execution loop for continuous mode."""
+        """Main execution loop for continuous mode.
+        
+        Sleeps until config events or jobs arrive (or the next periodic
+        summary is due) instead of polling the queue.
+        """
         last_summary_time = time.perf_counter()
         while not self._stop_event.is_set():
-            if self.queue.size() > 0:
-                job = self.queue.dequeue()
-                if job:
-                    await self._execute_job(job)
+            self._drain_config_events()
+            job = self.queue.dequeue()
+            if job:
+                await self._execute_job(job)
+                continue
             
             # In continuous mode, generate summary periodically if we have results
-            if self._results and (time.perf_counter() - last_summary_time > 60):
+            if self._results and (time.perf_counter() - last_summary_time > _SUMMARY_INTERVAL_SECONDS):
                 await self._generate_and_log_summary(time.perf_counter() - last_summary_time)
                 last_summary_time = time.perf_counter()
-                
-            await asyncio.sleep(1.0)
+
+            # Cleared before checking for work, so a config event or stop()
+            # arriving during the history flush below still wakes the wait
+            self._work_available.clear()
+            if not self._event_queue.empty() or self._stop_event.is_set():
+                continue
+            # Nothing to run: write out history before going idle
+            await self._flush_run_history()
+            timeout = None
+            if self._results:
+                timeout = max(0.0, _SUMMARY_INTERVAL_SECONDS - (time.perf_counter() - last_summary_time))
+            try:
+                await asyncio.wait_for(self._work_available.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
 
     async def _execute_job(self, job: Job):
         """Execute a single scraping job with error isolation.
         
         This implements Story 7.2: Implement Per-Site Error Isolation (Fault Tolerance).
         """
-        logger.info(f"Executing job: {job.site_name}")
+        logger.info("Executing job: %s", job.site_name)
         
-        # Import engine orchestrator here to avoid circular imports if any
-        import cwsf.engine.orchestrator
+        engine = _get_engine()
         
         try:
-            # Execute the scrape
-            result = await cwsf.engine.orchestrator.scrape_site(job.config)
+            # Execute the scrape. Only the record count is reported, so the
+            # records themselves needn't outlive their page.
+            result = await engine.scrape_site(job.config, keep_records_in_memory=False)
             self._results.append(result)
             
             status = "success"
             if result.errors:
-                status = "partial" if result.records else "failed"
-                logger.error(f"Job {job.site_name} completed with {len(result.errors)} errors")
+                status = "partial" if result.record_count else "failed"
+                logger.error("Job %s completed with %d errors", job.site_name, len(result.errors))
                 # Story 7.5: Send notification for each site failure after retry exhaustion
                 if result.failure_contexts:
-                    for failure in result.failure_contexts:
-                        await self.notifier.send_error(failure)
+                    await self.notifier.send_errors(result.failure_contexts)
                 elif result.errors:
                     # Fallback if failure_contexts not populated but errors exist
-                    from cwsf.utils.notifications import FailureContext
                     await self.notifier.send_error(FailureContext(
                         site_name=job.site_name,
-                        url=job.config.get("base_url", "unknown"),
+                        url=job.base_url,
                         error_message=result.errors[0]
                     ))
             else:
-                logger.info(f"Completed job: {job.site_name} successfully")
+                logger.info("Completed job: %s successfully", job.site_name)
 
-            # Record run history (Story 8.7)
-            from datetime import datetime, timezone
-            self.run_history.record_run(RunResult(
+            # Record run history (Story 8.7); written in batches by the store
+            await self._record_run_history(RunResult(
                 site_name=job.site_name,
                 timestamp=datetime.now(timezone.utc).isoformat(),
-                records_count=len(result.records),
+                records_count=result.record_count,
                 status=status,
                 error_count=len(result.errors),
                 last_error=result.errors[0] if result.errors else None
@@ -295,23 +505,20 @@ class Orchestrator:
             logger.error(error_msg, exc_info=True)
             
             # Record failure for summary
-            from cwsf.engine.fetcher import ScrapeResult
-            fail_result = ScrapeResult(site_name=job.site_name)
+            fail_result = engine.ScrapeResult(site_name=job.site_name)
             fail_result.errors.append(error_msg)
             self._results.append(fail_result)
             
             # Notify of critical failure
-            from cwsf.utils.notifications import FailureContext
             await self.notifier.send_error(FailureContext(
                 site_name=job.site_name,
-                url=job.config.get("base_url", "unknown"),
+                url=job.base_url,
                 error_message=error_msg,
                 error_type=type(exc).__name__
             ))
 
             # Record run history for critical failure (Story 8.7)
-            from datetime import datetime, timezone
-            self.run_history.record_run(RunResult(
+            await self._record_run_history(RunResult(
                 site_name=job.site_name,
                 timestamp=datetime.now(timezone.utc).isoformat(),
                 records_count=0,
@@ -323,3 +530,4 @@ class Orchestrator:
     def stop(self):
         """Stop the orchestrator."""
         self._stop_event.set()
+        self._work_available.set()
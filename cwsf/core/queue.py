@@ -4,11 +4,12 @@ This module implements a thread-safe, priority-based job queue for managing
 scraping tasks.
 """
 
-import heapq
+import itertools
 import logging
 import threading
+from collections import deque
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 from cwsf.core.job import Job, JobStatus
 
@@ -19,17 +20,39 @@ class PriorityJobQueue:
     """A thread-safe priority queue for Job objects.
     
     Jobs are ordered by priority (lower number = higher priority).
-    Jobs with the same priority are ordered by their creation time (FIFO).
+    Jobs with the same priority are served in the order they were queued (FIFO):
+    each priority has its own deque, so there is no heap and no datetime
+    comparison on the hot path.
+    
+    The deques are never searched: replaced or removed jobs leave stale
+    entries behind, recognised by a per-job version number and skipped by
+    dequeue(). Once stale entries outnumber live ones the deques are rebuilt.
+    
+    Writes take the lock, and keep it only for the table/bucket updates:
+    timestamps are taken, the job copies made by remove() and update() built,
+    and log messages emitted outside it, so handler I/O never holds up other
+    producers or consumers. Log calls use lazy %-formatting, so nothing is
+    formatted when INFO is disabled. The read-only methods don't
+    take it at all: size() is a single
+    len() of a dict, and list_jobs() returns a snapshot tuple that is rebuilt
+    (under the lock) only on the first read after a write.
     """
 
     def __init__(self):
         self._lock = threading.Lock()
-        # _heap stores (priority, created_at, job_id) to maintain priority and FIFO order
-        self._heap: List[Tuple[int, datetime, str]] = []
+        # _buckets maps priority to a FIFO of (version, job_id) entries
+        self._buckets: Dict[int, Deque[Tuple[int, str]]] = {}
+        # Total number of entries across all buckets, stale ones included
+        self._entry_count = 0
+        # _versions maps job_id to the version of its live bucket entry
+        self._versions: Dict[str, int] = {}
+        self._version_counter = itertools.count()
         # _jobs maps job_id to the actual Job object
         self._jobs: Dict[str, Job] = {}
         # _running_jobs maps job_id to Job objects currently in RUNNING state
         self._running_jobs: Dict[str, Job] = {}
+        # Pending + running jobs as of the last write; None once a write invalidates it
+        self._snapshot: Optional[Tuple[Job, ...]] = ()
 
     def enqueue(self, job: Job) -> None:
         """Adds a job to the queue.
@@ -38,39 +61,82 @@ class PriorityJobQueue:
         If it exists in RUNNING state, it is updated (but remains RUNNING).
         """
         with self._lock:
+            self._snapshot = None
             if job.job_id in self._running_jobs:
-                logger.info(f"Updating RUNNING job: {job.job_id}")
                 self._running_jobs[job.job_id] = job
-                return
-
-            if job.job_id in self._jobs:
-                logger.info(f"Updating PENDING job: {job.job_id}")
-                # We don't remove from heap because it's inefficient.
-                # Instead, we update the _jobs dict. dequeue() will handle stale heap entries.
-                self._jobs[job.job_id] = job
+                state = "running"
             else:
-                logger.info(f"Enqueuing new job: {job.job_id} (priority={job.priority})")
+                old_job = self._jobs.get(job.job_id)
                 self._jobs[job.job_id] = job
-                heapq.heappush(self._heap, (job.priority, job.created_at, job.job_id))
+                if old_job is None:
+                    self._push(job.priority, job.job_id)
+                    state = "new"
+                else:
+                    # The job keeps its place in the queue; a new entry is only
+                    # needed if its priority changed (the old one goes stale)
+                    if job.priority != old_job.priority:
+                        self._push(job.priority, job.job_id)
+                    state = "pending"
+
+        if state == "new":
+            logger.info("Enqueuing new job: %s (priority=%d)", job.job_id, job.priority)
+        elif state == "pending":
+            logger.info("Updating PENDING job: %s", job.job_id)
+        else:
+            logger.info("Updating RUNNING job: %s", job.job_id)
+
+    def _push(self, priority: int, job_id: str) -> None:
+        """Append an entry for job_id to its priority's bucket, making any older entry stale. Lock must be held."""
+        version = next(self._version_counter)
+        self._versions[job_id] = version
+        bucket = self._buckets.get(priority)
+        if bucket is None:
+            bucket = self._buckets[priority] = deque()
+        bucket.append((version, job_id))
+        self._entry_count += 1
+        self._compact_if_stale()
+
+    def _compact_if_stale(self) -> None:
+        """Rebuild the buckets without stale entries once they outnumber live ones. Lock must be held."""
+        if self._entry_count > 2 * len(self._jobs):
+            versions = self._versions
+            buckets: Dict[int, Deque[Tuple[int, str]]] = {}
+            for priority, bucket in self._buckets.items():
+                live = deque(entry for entry in bucket if versions.get(entry[1]) == entry[0])
+                if live:
+                    buckets[priority] = live
+            self._buckets = buckets
+            self._entry_count = sum(len(bucket) for bucket in buckets.values())
 
     def dequeue(self) -> Optional[Job]:
         """Returns the highest-priority PENDING job and transitions it to RUNNING.
         
         Returns None if no PENDING jobs are available.
         """
+        now = datetime.now(timezone.utc)
         with self._lock:
-            while self._heap:
-                priority, created_at, job_id = heapq.heappop(self._heap)
-                
-                # Check if the job still exists and is still PENDING
-                # (It might have been removed or updated)
-                job = self._jobs.get(job_id)
-                if job and job.status == JobStatus.PENDING:
-                    # Transition to RUNNING
-                    running_job = job.with_status(JobStatus.RUNNING)
-                    del self._jobs[job_id]
-                    self._running_jobs[job_id] = running_job
-                    return running_job
+            # There are only ever a handful of distinct priorities
+            for priority in sorted(self._buckets):
+                bucket = self._buckets[priority]
+                while bucket:
+                    version, job_id = bucket.popleft()
+                    self._entry_count -= 1
+                    
+                    # Skip entries left behind by a removal or priority change
+                    if self._versions.get(job_id) != version:
+                        continue
+                    job = self._jobs.get(job_id)
+                    if job and job.status == JobStatus.PENDING:
+                        # Transition to RUNNING
+                        running_job = job.with_status(JobStatus.RUNNING, now)
+                        del self._jobs[job_id]
+                        del self._versions[job_id]
+                        self._running_jobs[job_id] = running_job
+                        self._snapshot = None
+                        if not bucket:
+                            del self._buckets[priority]
+                        return running_job
+                del self._buckets[priority]
             
             return None
 
@@ -79,15 +145,32 @@ class PriorityJobQueue:
         
         If the job is currently RUNNING, it is marked CANCELLED.
         """
+        now = datetime.now(timezone.utc)
+        # Build the CANCELLED copy before taking the lock; it is only used if
+        # the running job is still the one it was copied from
+        running = self._running_jobs.get(job_id)
+        cancelled = running.with_status(JobStatus.CANCELLED, now) if running is not None else None
         with self._lock:
+            self._snapshot = None
             if job_id in self._jobs:
-                logger.info(f"Removing PENDING job: {job_id}")
                 del self._jobs[job_id]
-                # Note: stale entry remains in heap, handled by dequeue()
+                # The bucket entry stays behind as a stale entry for dequeue() to skip
+                del self._versions[job_id]
+                self._compact_if_stale()
+                state = "pending"
             elif job_id in self._running_jobs:
-                logger.info(f"Cancelling RUNNING job: {job_id}")
                 job = self._running_jobs[job_id]
-                self._running_jobs[job_id] = job.with_status(JobStatus.CANCELLED)
+                if job is not running:
+                    cancelled = job.with_status(JobStatus.CANCELLED, now)
+                self._running_jobs[job_id] = cancelled
+                state = "running"
+            else:
+                return
+
+        if state == "pending":
+            logger.info("Removing PENDING job: %s", job_id)
+        else:
+            logger.info("Cancelling RUNNING job: %s", job_id)
 
     def update(self, job_id: str, new_config: Dict) -> None:
         """Replaces the config on a PENDING job.
@@ -95,38 +178,61 @@ class PriorityJobQueue:
         If the job is RUNNING, the update is deferred (the job object is updated
         in _running_jobs, but it's up to the orchestrator to check it).
         """
+        now = datetime.now(timezone.utc)
+        # Build the updated copy before taking the lock; it is only used if
+        # the job hasn't been replaced or dequeued in the meantime
+        seen = self._jobs.get(job_id) or self._running_jobs.get(job_id)
+        updated = seen.with_config(new_config, now) if seen is not None else None
         with self._lock:
+            self._snapshot = None
             if job_id in self._jobs:
-                logger.info(f"Updating config for PENDING job: {job_id}")
                 old_job = self._jobs[job_id]
-                new_job = old_job.with_config(new_config)
+                new_job = updated if old_job is seen else old_job.with_config(new_config, now)
                 self._jobs[job_id] = new_job
                 
-                # If priority changed, we need to push a new entry to the heap
+                # If priority changed, we need to push a new entry to its bucket
                 if new_job.priority != old_job.priority:
-                    heapq.heappush(self._heap, (new_job.priority, new_job.created_at, job_id))
+                    self._push(new_job.priority, job_id)
+                state = "pending"
             
             elif job_id in self._running_jobs:
-                logger.info(f"Updating config for RUNNING job: {job_id} (deferred)")
                 old_job = self._running_jobs[job_id]
-                self._running_jobs[job_id] = old_job.with_config(new_config)
+                if old_job is not seen:
+                    updated = old_job.with_config(new_config, now)
+                self._running_jobs[job_id] = updated
+                state = "running"
+            else:
+                return
+
+        if state == "pending":
+            logger.info("Updating config for PENDING job: %s", job_id)
+        else:
+            logger.info("Updating config for RUNNING job: %s (deferred)", job_id)
 
     def list_jobs(self) -> List[Job]:
         """Returns all jobs with their current status and priority."""
-        with self._lock:
-            return list(self._jobs.values()) + list(self._running_jobs.values())
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = tuple(self._jobs.values()) + tuple(self._running_jobs.values())
+                    self._snapshot = snapshot
+        return list(snapshot)
 
     def size(self) -> int:
         """Returns the count of PENDING jobs."""
-        with self._lock:
-            # We can't just use len(self._heap) because of stale entries
-            return len(self._jobs)
+        # We can't just count bucket entries because of stale ones. len() of
+        # a dict is atomic, so no lock is needed.
+        return len(self._jobs)
 
     def complete(self, job_id: str, success: bool = True) -> None:
         """Marks a RUNNING job as COMPLETED or FAILED."""
         with self._lock:
-            if job_id in self._running_jobs:
-                job = self._running_jobs.pop(job_id)
-                new_status = JobStatus.COMPLETED if success else JobStatus.FAILED
-                # In a real system, we might move this to a history list
-                logger.info(f"Job {job_id} finished with status {new_status}")
+            job = self._running_jobs.pop(job_id, None)
+            if job is None:
+                return
+            self._snapshot = None
+        new_status = JobStatus.COMPLETED if success else JobStatus.FAILED
+        # In a real system, we might move this to a history list
+        logger.info("Job %s finished with status %s", job_id, new_status)
@@ -1,11 +1,14 @@
+import contextlib
+import functools
 from dataclasses import dataclass, field
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Mapping
 from urllib.parse import urlparse
 import httpx
 import time
 import asyncio
 import logging
 from datetime import datetime, timezone
+from parsel import Selector
 from cwsf.engine.rate_limiter import DomainRateLimiter
 from cwsf.core.job import FailureContext
 
@@ -16,15 +19,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FetchResult:
     url: str
     status_code: int
     body: str
-    headers: httpx.Headers
+    # httpx.Headers for httpx fetches; a plain dict (lower-case names) for Playwright
+    headers: Mapping[str, str]
     elapsed_time: float
+    _selector: Optional[Selector] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    @property
+    def selector(self) -> Selector:
+        """The parsed body, built on first use and shared by everything reading this page."""
+        if self._selector is None:
+            object.__setattr__(self, "_selector", Selector(text=self.body))
+        return self._selector
+
+@dataclass(slots=True, frozen=True)
 class ScrapeRecord:
     """A single extracted record with metadata."""
     fields: Dict[str, Any]
@@ -34,9 +46,16 @@ class ScrapeRecord:
 
 @dataclass
 class ScrapeResult:
-    """Result of a full site scrape."""
+    """Result of a full site scrape.
+    
+    record_count counts every extracted record. records only holds them when
+    they weren't already written out page by page (i.e. non-sqlite output)
+    and the caller asked scrape_site to keep them, so large sites don't keep
+    every record in memory.
+    """
     site_name: str
     records: List[ScrapeRecord] = field(default_factory=list)
+    record_count: int = 0
     errors: List[str] = field(default_factory=list)
     failure_contexts: List[FailureContext] = field(default_factory=list)
     stats: Dict[str, Any] = field(default_factory=dict)
@@ -67,26 +86,119 @@ _domain_semaphores = type('MockDict', (dict,), {
     '__contains__': lambda self, k: k in _domain_limiters
 })()
 
+@functools.lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Return the limiter key (netloc) for a URL; pages of a site share it."""
+    return urlparse(url).netloc or "default"
+
 async def _get_domain_limiter(url: str, rate_limit_config: Optional[Dict[str, Any]], retry_config: Optional[Dict[str, Any]]) -> DomainRateLimiter:
     """
     Get or create a DomainRateLimiter for a domain.
     """
-    domain = urlparse(url).netloc
-    if not domain:
-        domain = "default"
+    domain = _netloc(url)
+
+    # Fast path: the limiter almost always exists already
+    limiter = _domain_limiters.get(domain)
+    if limiter is not None:
+        return limiter
         
+    # Build the limiter outside the lock; if another fetch registered one for
+    # this domain in the meantime, theirs wins and this one is dropped
+    rl_cfg = rate_limit_config or {}
+    retry_cfg = retry_config or {}
+    tentative = DomainRateLimiter(
+        delay_seconds=rl_cfg.get("delay_seconds", 1.0),
+        max_concurrent=rl_cfg.get("max_concurrent", 1),
+        max_retries=retry_cfg.get("max_retries", 3),
+        backoff_factor=retry_cfg.get("backoff_factor", 2.0)
+    )
     async with _limiters_lock:
-        if domain not in _domain_limiters:
-            rl_cfg = rate_limit_config or {}
-            retry_cfg = retry_config or {}
-            
-            _domain_limiters[domain] = DomainRateLimiter(
-                delay_seconds=rl_cfg.get("delay_seconds", 1.0),
-                max_concurrent=rl_cfg.get("max_concurrent", 1),
-                max_retries=retry_cfg.get("max_retries", 3),
-                backoff_factor=retry_cfg.get("backoff_factor", 2.0)
-            )
-        return _domain_limiters[domain]
+        return _domain_limiters.setdefault(domain, tentative)
+
+# Shared Playwright browser, launched on the first playwright fetch and reused
+# by later ones (each fetch gets its own context). It belongs to the event
+# loop that launched it; see _get_browser and close_browser.
+_pw_instance = None
+_pw_browser = None
+_pw_loop: Optional[asyncio.AbstractEventLoop] = None
+_pw_lock: Optional[asyncio.Lock] = None
+
+async def _get_browser():
+    """
+    Return the shared Chromium browser, launching it if needed.
+    """
+    global _pw_instance, _pw_browser, _pw_loop, _pw_lock
+    loop = asyncio.get_running_loop()
+    browser = _pw_browser
+    if browser is not None and _pw_loop is loop and browser.is_connected():
+        return browser
+
+    if _pw_loop is not loop:
+        # Started under an earlier event loop (e.g. a previous asyncio.run);
+        # those objects can't be used or closed from this loop
+        _pw_instance = _pw_browser = None
+        _pw_loop = loop
+        _pw_lock = asyncio.Lock()
+
+    async with _pw_lock:
+        if _pw_browser is None or not _pw_browser.is_connected():
+            if _pw_instance is None:
+                _pw_instance = await async_playwright().start()
+            _pw_browser = await _pw_instance.chromium.launch(headless=True)
+        return _pw_browser
+
+async def close_browser() -> None:
+    """
+    Close the shared Playwright browser, if one was launched on this event loop.
+    """
+    global _pw_instance, _pw_browser, _pw_loop
+    browser, instance = _pw_browser, _pw_instance
+    if _pw_loop is not asyncio.get_running_loop():
+        return
+    _pw_instance = _pw_browser = _pw_loop = None
+    try:
+        if browser is not None:
+            await browser.close()
+        if instance is not None:
+            await instance.stop()
+    except Exception as e:
+        logger.warning(f"Error shutting down Playwright: {e}")
+
+async def close_shared_resources() -> None:
+    """
+    Close the shared Playwright browser and connection pool used by fetch().
+    """
+    await close_browser()
+    await close_default_transport()
+
+# Connection pool shared by fetch() calls that don't pass a client. Each such
+# call still gets its own AsyncClient (headers, cookie jar) on top of it, so
+# no session state leaks between fetches. Like the browser, it belongs to the
+# event loop that created it.
+_default_transport: Optional[httpx.AsyncHTTPTransport] = None
+_default_transport_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _get_default_transport() -> httpx.AsyncHTTPTransport:
+    """
+    Return the shared transport for the running event loop, creating it if needed.
+    """
+    global _default_transport, _default_transport_loop
+    loop = asyncio.get_running_loop()
+    if _default_transport is None or _default_transport_loop is not loop:
+        _default_transport = httpx.AsyncHTTPTransport()
+        _default_transport_loop = loop
+    return _default_transport
+
+async def close_default_transport() -> None:
+    """
+    Close the shared connection pool, if one was created on this event loop.
+    """
+    global _default_transport, _default_transport_loop
+    transport = _default_transport
+    if transport is None or _default_transport_loop is not asyncio.get_running_loop():
+        return
+    _default_transport = _default_transport_loop = None
+    await transport.aclose()
 
 async def fetch_playwright(
     url: str,
@@ -112,97 +224,102 @@ async def fetch_playwright(
     actions = options.get("actions", [])
 
     start_time = time.perf_counter()
+    context = None
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent=headers.get("User-Agent", "CWSF/1.0") if headers else "CWSF/1.0",
-                extra_http_headers=headers or {}
-            )
-            
-            if cookies:
-                formatted_cookies = [
-                    {"name": k, "value": v, "url": url} for k, v in cookies.items()
-                ]
-                await context.add_cookies(formatted_cookies)
+        browser = await _get_browser()
+        context = await browser.new_context(
+            user_agent=headers.get("User-Agent", "CWSF/1.0") if headers else "CWSF/1.0",
+            extra_http_headers=headers or {}
+        )
+        
+        if cookies:
+            formatted_cookies = [
+                {"name": k, "value": v, "url": url} for k, v in cookies.items()
+            ]
+            await context.add_cookies(formatted_cookies)
 
-            page = await context.new_page()
-            
+        page = await context.new_page()
+        
+        try:
+            response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+        except Exception as e:
+            if on_timeout == "fail":
+                raise FetchError(url, f"Navigation timeout: {str(e)}")
+            logger.warning(f"Navigation timeout for {url}, proceeding anyway: {e}")
+            response = None
+        
+        if wait_for_selector:
             try:
-                response = await page.goto(url, wait_until=wait_until, timeout=timeout)
+                await page.wait_for_selector(wait_for_selector, timeout=timeout)
             except Exception as e:
                 if on_timeout == "fail":
-                    raise FetchError(url, f"Navigation timeout: {str(e)}")
-                logger.warning(f"Navigation timeout for {url}, proceeding anyway: {e}")
-                response = None
+                    raise FetchError(url, f"Wait for selector '{wait_for_selector}' timeout: {str(e)}")
+                logger.warning(f"Wait for selector '{wait_for_selector}' timeout for {url}, proceeding anyway: {e}")
+
+        for action_cfg in actions:
+            action_type = action_cfg.get("action")
+            selector = action_cfg.get("selector")
+            try:
+                if action_type == "click":
+                    await page.click(selector, timeout=timeout)
+                elif action_type == "wait":
+                    await asyncio.sleep(action_cfg.get("seconds", 0))
+                elif action_type == "fill":
+                    await page.fill(selector, action_cfg.get("value", ""), timeout=timeout)
+                elif action_type == "press":
+                    await page.press(selector, action_cfg.get("key", ""), timeout=timeout)
+                elif action_type == "hover":
+                    await page.hover(selector, timeout=timeout)
+            except Exception as e:
+                if on_timeout == "fail":
+                    raise FetchError(url, f"Action '{action_type}' failed: {str(e)}")
+                logger.warning(f"Action '{action_type}' failed for {url}, proceeding anyway: {e}")
+
+        if pagination_config and pagination_config.get("type") == "scroll":
+            max_scrolls = pagination_config.get("max_pages", 10)
+            scroll_wait = pagination_config.get("scroll_wait_seconds", 2.0)
+            container_selector = (selectors or {}).get("container")
             
-            if wait_for_selector:
-                try:
-                    await page.wait_for_selector(wait_for_selector, timeout=timeout)
-                except Exception as e:
-                    if on_timeout == "fail":
-                        raise FetchError(url, f"Wait for selector '{wait_for_selector}' timeout: {str(e)}")
-                    logger.warning(f"Wait for selector '{wait_for_selector}' timeout for {url}, proceeding anyway: {e}")
-
-            for action_cfg in actions:
-                action_type = action_cfg.get("action")
-                selector = action_cfg.get("selector")
-                try:
-                    if action_type == "click":
-                        await page.click(selector, timeout=timeout)
-                    elif action_type == "wait":
-                        await asyncio.sleep(action_cfg.get("seconds", 0))
-                    elif action_type == "fill":
-                        await page.fill(selector, action_cfg.get("value", ""), timeout=timeout)
-                    elif action_type == "press":
-                        await page.press(selector, action_cfg.get("key", ""), timeout=timeout)
-                    elif action_type == "hover":
-                        await page.hover(selector, timeout=timeout)
-                except Exception as e:
-                    if on_timeout == "fail":
-                        raise FetchError(url, f"Action '{action_type}' failed: {str(e)}")
-                    logger.warning(f"Action '{action_type}' failed for {url}, proceeding anyway: {e}")
-
-            if pagination_config and pagination_config.get("type") == "scroll":
-                max_scrolls = pagination_config.get("max_pages", 10)
-                scroll_wait = pagination_config.get("scroll_wait_seconds", 2.0)
-                container_selector = (selectors or {}).get("container")
+            last_count = 0
+            if container_selector:
+                last_count = await page.locator(container_selector).count()
+            
+            for i in range(max_scrolls):
+                logger.info(f"Scrolling iteration {i+1}/{max_scrolls} for {url}")
+                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await asyncio.sleep(scroll_wait)
                 
-                last_count = 0
                 if container_selector:
-                    last_count = await page.locator(container_selector).count()
-                
-                for i in range(max_scrolls):
-                    logger.info(f"Scrolling iteration {i+1}/{max_scrolls} for {url}")
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    await asyncio.sleep(scroll_wait)
-                    
-                    if container_selector:
-                        new_count = await page.locator(container_selector).count()
-                        if new_count <= last_count:
-                            logger.info(f"No new content detected after scroll {i+1}. Stopping.")
-                            break
-                        last_count = new_count
-            
-            body = await page.content()
-            status = response.status if response else 200
-            resp_headers = await response.all_headers() if response else {}
-            
-            await browser.close()
-            
-            elapsed_time = time.perf_counter() - start_time
-            
-            return FetchResult(
-                url=url,
-                status_code=status,
-                body=body,
-                headers=httpx.Headers(resp_headers),
-                elapsed_time=elapsed_time
-            )
+                    new_count = await page.locator(container_selector).count()
+                    if new_count <= last_count:
+                        logger.info(f"No new content detected after scroll {i+1}. Stopping.")
+                        break
+                    last_count = new_count
+        
+        body = await page.content()
+        status = response.status if response else 200
+        resp_headers = response.headers if response else {}
+        
+        elapsed_time = time.perf_counter() - start_time
+        
+        return FetchResult(
+            url=url,
+            status_code=status,
+            body=body,
+            headers=resp_headers,
+            elapsed_time=elapsed_time
+        )
     except Exception as exc:
         if isinstance(exc, FetchError):
             raise
         raise FetchError(url, f"Playwright error: {str(exc)}") from exc
+    finally:
+        # Only the context is per-fetch; the browser stays up for the next one
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Error closing Playwright context for {url}: {e}")
 
 async def fetch(
     url: str,
@@ -253,16 +370,19 @@ async def fetch(
                         **kwargs
                     )
                 else:
-                    async with httpx.AsyncClient(
+                    # Not used as a context manager: closing the client would
+                    # close the shared transport's connection pool
+                    client_new = httpx.AsyncClient(
                         timeout=timeout,
                         headers=default_headers,
-                        cookies=cookies
-                    ) as client_new:
-                        response = await client_new.request(
-                            method=method,
-                            url=url,
-                            **kwargs
-                        )
+                        cookies=cookies,
+                        transport=_get_default_transport()
+                    )
+                    response = await client_new.request(
+                        method=method,
+                        url=url,
+                        **kwargs
+                    )
             except (httpx.ConnectError, httpx.TimeoutException) as exc:
                 raise FetchError(url, str(exc)) from exc
             
@@ -363,12 +483,15 @@ async def perform_login(client: httpx.AsyncClient, auth_config: Dict[str, Any])
 
 async def run_all(
     configs: List[Dict[str, Any]],
-    max_concurrency: int = 5
+    max_concurrency: Optional[int] = None
 ) -> List[ScrapeResult]:
     """
     Fetch pages from multiple site configs concurrently.
+    
+    Each domain's rate limiter bounds concurrency per domain; max_concurrency
+    is an optional hard cap on fetches in flight overall.
     """
-    semaphore = asyncio.Semaphore(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
 
     async def _fetch_task(config: Dict[str, Any]) -> ScrapeResult:
         site_name = config.get("site_name", "unknown")
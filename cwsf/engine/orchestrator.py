@@ -1,22 +1,162 @@
 import logging
+import logging.handlers
 import asyncio
+import contextlib
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 
-from cwsf.engine.fetcher import fetch, perform_login, FetchError, ScrapeRecord, ScrapeResult
-from cwsf.engine.parser import parse_records
-from cwsf.engine.paginator import PaginatorFactory, UrlPatternPaginator
+from cwsf.engine.fetcher import close_shared_resources as close_fetch_resources, fetch, perform_login, FetchError, FetchResult, ScrapeRecord, ScrapeResult
+from cwsf.engine.parser import CompiledSelectors, ParseError, compile_selectors, parse_records_compiled
+from cwsf.engine.paginator import NextButtonPaginator, PaginatorFactory, UrlPatternPaginator
 
 logger = logging.getLogger(__name__)
 import httpx
 from cwsf.output import SqliteWriter
 
-async def scrape_site(config: Dict[str, Any]) -> ScrapeResult:
+# Pages of records waiting to be written; the fetch loop blocks once this
+# many are queued so a slow database applies back-pressure
+_WRITE_QUEUE_SIZE = 3
+
+# Queued pages are combined into one write (one transaction) up to this many rows
+_WRITE_BATCH_SIZE = 500
+
+# Pages are parsed in worker processes so that CPU-bound parsing runs in
+# parallel with each other and with the event loop. The pool is created on
+# first use; if it can't be used (no process support, unpicklable selectors)
+# parsing falls back to a worker thread. Workers are spawned rather than
+# forked, since by then the logging listener and writer threads are running
+# and a forked child could inherit a lock one of them holds. Their log
+# records are sent back over a queue and logged here.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_log_listener: Optional[logging.handlers.QueueListener] = None
+_parse_in_threads = False
+
+class _ForwardToLogger(logging.Handler):
+    """Hands a parse worker's log record to this process's logger of the same name."""
+    def emit(self, record: logging.LogRecord) -> None:
+        record_logger = logging.getLogger(record.name)
+        if record_logger.isEnabledFor(record.levelno):
+            record_logger.handle(record)
+
+def _init_parse_worker(log_queue: Any, level: int) -> None:
+    """Parse worker initializer: route all logging to the parent over log_queue."""
+    root = logging.getLogger()
+    root.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(level)
+
+def _start_parse_pool() -> ProcessPoolExecutor:
+    """Spawn the parse pool and start forwarding its workers' log records."""
+    global _parse_log_listener
+    context = multiprocessing.get_context("spawn")
+    log_queue = context.Queue()
+    _parse_log_listener = logging.handlers.QueueListener(log_queue, _ForwardToLogger())
+    _parse_log_listener.start()
+    return ProcessPoolExecutor(
+        mp_context=context,
+        initializer=_init_parse_worker,
+        initargs=(log_queue, logging.getLogger().getEffectiveLevel()),
+    )
+
+def _stop_parse_log_listener() -> None:
+    """Stop forwarding parse worker log records, after the pool has shut down."""
+    global _parse_log_listener
+    listener, _parse_log_listener = _parse_log_listener, None
+    if listener is not None:
+        listener.stop()
+
+async def _parse_page(body: str, selectors: CompiledSelectors) -> List[Dict[str, Any]]:
+    """
+    Run parse_records_compiled for one page off the event loop.
+    """
+    global _parse_pool, _parse_in_threads
+    if not _parse_in_threads:
+        try:
+            if _parse_pool is None:
+                _parse_pool = _start_parse_pool()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_parse_pool, parse_records_compiled, body, selectors)
+        except (OSError, pickle.PicklingError, BrokenProcessPool) as e:
+            logger.warning(f"Parsing in a process pool failed ({e}); parsing in threads instead")
+            _parse_in_threads = True
+    return await asyncio.to_thread(parse_records_compiled, body, selectors)
+
+async def _parse_page_shared(page: FetchResult, selectors: CompiledSelectors) -> List[Dict[str, Any]]:
+    """
+    Run parse_records_compiled for one page in a worker thread, on page.selector.
+    
+    Used when the paginator also reads the page, so the tree parsed here is
+    the one it reuses instead of parsing the body a second time.
+    """
+    return await asyncio.to_thread(lambda: parse_records_compiled(page.selector, selectors))
+
+async def close_shared_resources() -> None:
+    """
+    Close fetch()'s shared browser and connection pool, and the parse worker pool.
+    """
+    global _parse_pool
+    await close_fetch_resources()
+    pool, _parse_pool = _parse_pool, None
+    if pool is not None:
+        await asyncio.to_thread(pool.shutdown)
+    _stop_parse_log_listener()
+
+async def _write_pages(config: Dict[str, Any], pages: "asyncio.Queue[Optional[List[Dict[str, Any]]]]") -> None:
+    """
+    Write batches of records from pages until a None sentinel arrives.
+    
+    Runs alongside scrape_site's fetch loop so writing page N overlaps with
+    fetching page N+1. Pages that queued up while a write was running are
+    combined into a single write of up to _WRITE_BATCH_SIZE rows. The
+    writer is opened on the first batch, so sites that yield no records
+    don't create a database. Database calls run off the event loop (writes
+    on the writer's own thread). After a write error the remaining batches
+    are drained (so the fetch loop never blocks on a full queue) and the
+    error is raised once the sentinel arrives.
+    """
+    writer: Optional[SqliteWriter] = None
+    error: Optional[BaseException] = None
+    try:
+        done = False
+        while not done:
+            batch = await pages.get()
+            if batch is None:
+                break
+            while len(batch) < _WRITE_BATCH_SIZE and not pages.empty():
+                more = pages.get_nowait()
+                if more is None:
+                    done = True
+                    break
+                batch = batch + more
+            if error is not None:
+                continue
+            try:
+                if writer is None:
+                    writer = SqliteWriter()
+                    await asyncio.to_thread(writer.open, config)
+                await writer.write_records_async(batch)
+            except Exception as exc:
+                error = exc
+    finally:
+        if writer is not None:
+            # Closing commits and checkpoints the WAL, so it blocks too
+            await asyncio.to_thread(writer.close)
+    if error is not None:
+        raise error
+
+async def scrape_site(config: Dict[str, Any], keep_records_in_memory: bool = True) -> ScrapeResult:
     """
     Orchestrate fetching -> parsing -> transforms -> record emission for a single site.
     
     Args:
         config: A validated site configuration dictionary.
+        keep_records_in_memory: Whether records are collected on
+            result.records (whether or not they are also written out page by
+            page). When False only result.record_count is kept, so memory
+            stays flat however many pages the site has.
         
     Returns:
         ScrapeResult containing extracted records, errors, and stats.
@@ -35,134 +175,161 @@ async def scrape_site(config: Dict[str, Any]) -> ScrapeResult:
         result.errors.append("Missing base_url in config")
         return result
 
-    paginator = PaginatorFactory.get_paginator(config)
+    # Selectors are the same for every page, so translate them (and the
+    # pagination selector) once up front
+    try:
+        compiled_selectors = compile_selectors(selectors)
+        paginator = PaginatorFactory.get_paginator(config)
+    except ParseError as exc:
+        result.errors.append(str(exc))
+        logger.error(f"Invalid selectors for site {site_name}: {exc}")
+        return result
     
     # Initialize current_url. If url_pattern, the first page might be base_url with {page} replaced.
     # Story 4.1 AC 1 & 4: generate URLs by substituting {page} with values starting from pagination.start.
     if isinstance(paginator, UrlPatternPaginator):
-        current_url = base_url.replace(paginator.placeholder, str(paginator.start_page))
+        current_url = paginator.url_for_page(paginator.start_page)
     else:
         current_url = base_url
+
+    # A next-button paginator looks for its link in the page tree; records
+    # are then parsed from that same tree rather than from a second parse
+    # in a worker process
+    share_page_tree = isinstance(paginator, NextButtonPaginator) and bool(paginator.selector)
         
     current_page = 1 # This tracks how many pages we have fetched
-    
-    # Create a persistent client for the entire scrape job to maintain session (Story 4.6 AC 4)
-    async with httpx.AsyncClient(headers={"User-Agent": "CWSF/1.0"}, follow_redirects=True) as client:
-        # Apply initial headers and cookies
-        client.headers.update(headers)
-        client.cookies.update(cookies)
 
-        # Perform login if configured (Story 4.6 AC 3)
-        if auth_config:
-            await perform_login(client, auth_config)
+    # Records are written page by page as they are parsed (Story 5.5)
+    output_config = config.get("output", {})
+    pages: "asyncio.Queue[Optional[List[Dict[str, Any]]]]" = asyncio.Queue(maxsize=_WRITE_QUEUE_SIZE)
+    writer_task = None
+    if output_config.get("format", "sqlite") == "sqlite":
+        writer_task = asyncio.create_task(_write_pages(config, pages))
+    try:
+        # Create a persistent client for the entire scrape job to maintain session (Story 4.6 AC 4)
+        async with httpx.AsyncClient(headers={"User-Agent": "CWSF/1.0"}, follow_redirects=True) as client:
+            # Apply initial headers and cookies
+            client.headers.update(headers)
+            client.cookies.update(cookies)
 
-        while current_url:
-            try:
-                # 1. Fetch
-                fetch_res = await fetch(
-                    url=current_url,
-                    method=method,
-                    client=client,
-                    renderer=config.get("renderer", "httpx"),
-                    playwright_options=config.get("playwright_options"),
-                    pagination_config=config.get("pagination"),
-                    selectors=selectors,
-                    rate_limit_config=config.get("rate_limit"),
-                    retry_config=config.get("retry"),
-                    site_name=site_name,
-                    scrape_result=result
-                )
+            # Perform login if configured (Story 4.6 AC 3)
+            if auth_config:
+                await perform_login(client, auth_config)
+
+            while current_url:
+                try:
+                    # 1. Fetch
+                    fetch_res = await fetch(
+                        url=current_url,
+                        method=method,
+                        client=client,
+                        renderer=config.get("renderer", "httpx"),
+                        playwright_options=config.get("playwright_options"),
+                        pagination_config=config.get("pagination"),
+                        selectors=selectors,
+                        rate_limit_config=config.get("rate_limit"),
+                        retry_config=config.get("retry"),
+                        site_name=site_name,
+                        scrape_result=result
+                    )
             
-                # Update stats for the last page fetched
-                result.stats["status_code"] = fetch_res.status_code
-                result.stats["elapsed_time"] = result.stats.get("elapsed_time", 0) + fetch_res.elapsed_time
+                    # Update stats for the last page fetched
+                    result.stats["status_code"] = fetch_res.status_code
+                    result.stats["elapsed_time"] = result.stats.get("elapsed_time", 0) + fetch_res.elapsed_time
                 
-                # 2. Check for non-200 status code
-                if fetch_res.status_code >= 400:
-                    error_msg = f"HTTP {fetch_res.status_code} error for {current_url}"
-                    result.errors.append(error_msg)
+                    # 2. Check for non-200 status code
+                    if fetch_res.status_code >= 400:
+                        error_msg = f"HTTP {fetch_res.status_code} error for {current_url}"
+                        result.errors.append(error_msg)
                     
-                    # Story 4.6 AC 5: Log a specific warning for 401/403 (possible session expiration)
-                    if fetch_res.status_code in (401, 403):
-                        logger.warning(
-                            f"Possible session expiration or authorization failure: "
-                            f"HTTP {fetch_res.status_code} for {current_url} (site: {site_name})"
-                        )
-                    else:
-                        logger.error(f"{error_msg} (site: {site_name})")
-                    # Stop pagination on error (Story 4.1 AC 3)
-                    break
+                        # Story 4.6 AC 5: Log a specific warning for 401/403 (possible session expiration)
+                        if fetch_res.status_code in (401, 403):
+                            logger.warning(
+                                f"Possible session expiration or authorization failure: "
+                                f"HTTP {fetch_res.status_code} for {current_url} (site: {site_name})"
+                            )
+                        else:
+                            logger.error(f"{error_msg} (site: {site_name})")
+                        # Stop pagination on error (Story 4.1 AC 3)
+                        break
 
-                # 3. Parse (includes transforms)
-                raw_records = parse_records(fetch_res.body, selectors)
+                    # 3. Parse (includes transforms). Parsing is CPU-bound, so it
+                    # runs in a worker process (or thread) to keep other sites' fetches moving.
+                    if share_page_tree:
+                        raw_records = await _parse_page_shared(fetch_res, compiled_selectors)
+                    else:
+                        raw_records = await _parse_page(fetch_res.body, compiled_selectors)
                 
-                # 4. Emit (add metadata)
-                timestamp = datetime.now(timezone.utc).isoformat()
-                for raw_rec in raw_records:
-                    record = ScrapeRecord(
-                        fields=raw_rec,
-                        site_name=site_name,
-                        source_url=fetch_res.url,
-                        timestamp=timestamp
-                    )
-                    result.records.append(record)
+                    # 4. Emit (add metadata): keep the records on the result
+                    # if asked to, and hand the page to the writer
+                    timestamp = datetime.now(timezone.utc).isoformat()
+                    result.record_count += len(raw_records)
+                    if keep_records_in_memory:
+                        for raw_rec in raw_records:
+                            record = ScrapeRecord(
+                                # The writer adds its metadata columns to
+                                # raw_rec in place, so keep a copy of the fields
+                                fields=dict(raw_rec) if writer_task is not None else raw_rec,
+                                site_name=site_name,
+                                source_url=fetch_res.url,
+                                timestamp=timestamp
+                            )
+                            result.records.append(record)
+                    if writer_task is not None:
+                        # Unless copied above, the parsed dicts aren't kept
+                        # anywhere else, so add the metadata columns in place
+                        source_url = fetch_res.url
+                        for raw_rec in raw_records:
+                            raw_rec["site_name"] = site_name
+                            raw_rec["source_url"] = source_url
+                            raw_rec["scrape_timestamp"] = timestamp
+                        if raw_records:
+                            await pages.put(raw_records)
                     
-                logger.info(f"Successfully scraped {len(raw_records)} records from {current_url} for site {site_name}")
+                    logger.info(f"Successfully scraped {len(raw_records)} records from {current_url} for site {site_name}")
                 
-                # 5. Check if we should stop
-                if paginator.should_stop(current_page, fetch_res, len(raw_records)):
-                    break
+                    # 5. Check if we should stop
+                    if paginator.should_stop(current_page, fetch_res, len(raw_records)):
+                        break
                     
-                # 6. Get next URL
-                current_url = paginator.get_next_url(fetch_res, current_page)
-                current_page += 1
+                    # 6. Get next URL
+                    current_url = paginator.get_next_url(fetch_res, current_page)
+                    current_page += 1
                 
-            except FetchError as exc:
-                result.errors.append(str(exc))
-                logger.error(f"Failed to fetch {current_url} for site {site_name}: {exc}")
-                break # Stop pagination on fetch error
-            except Exception as exc:
-                result.errors.append(f"Unexpected error during scrape: {exc}")
-                logger.error(f"Unexpected error scraping {current_url} for site {site_name}: {exc}")
-                break # Stop pagination on unexpected error
-            
-    # 7. Write results (Story 5.5)
-    if result.records:
-        output_config = config.get("output", {})
-        format_type = output_config.get("format", "sqlite")
-        if format_type == "sqlite":
-            writer = SqliteWriter()
-            try:
-                writer.open(config)
-                # Convert ScrapeRecord objects to dicts for the writer
-                records_to_write = []
-                for rec in result.records:
-                    data = rec.fields.copy()
-                    data["site_name"] = rec.site_name
-                    data["source_url"] = rec.source_url
-                    data["scrape_timestamp"] = rec.timestamp
-                    records_to_write.append(data)
-                writer.write_records(records_to_write)
-            finally:
-                writer.close()
-            
+                except FetchError as exc:
+                    result.errors.append(str(exc))
+                    logger.error(f"Failed to fetch {current_url} for site {site_name}: {exc}")
+                    break # Stop pagination on fetch error
+                except Exception as exc:
+                    result.errors.append(f"Unexpected error during scrape: {exc}")
+                    logger.error(f"Unexpected error scraping {current_url} for site {site_name}: {exc}")
+                    break # Stop pagination on unexpected error
+    finally:
+        if writer_task is not None:
+            await pages.put(None)
+            await writer_task
+
     return result
 
 async def run_all(
     configs: List[Dict[str, Any]],
-    max_concurrency: int = 5
+    max_concurrency: Optional[int] = None
 ) -> List[ScrapeResult]:
     """
     Process multiple site configs concurrently.
     
+    Concurrency against each domain is already bounded by that domain's
+    rate limiter (rate_limit.max_concurrent), so sites on different domains
+    don't wait on each other.
+    
     Args:
         configs: List of site configuration dictionaries.
-        max_concurrency: Maximum number of concurrent scrape tasks.
+        max_concurrency: Optional hard cap on the number of sites scraped at once.
         
     Returns:
         List of ScrapeResult objects.
     """
-    semaphore = asyncio.Semaphore(max_concurrency)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
 
     async def _scrape_task(config: Dict[str, Any]) -> ScrapeResult:
         async with semaphore:
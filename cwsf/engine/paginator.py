@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Set
-from urllib.parse import urljoin
+from urllib.parse import parse_qsl, urljoin, urlsplit
 import logging
-from parsel import Selector
+from lxml import etree
 from cwsf.engine.fetcher import FetchResult
+from cwsf.engine.parser import ParseError, compile_selector, select_all
 
 logger = logging.getLogger(__name__)
 
@@ -57,20 +58,26 @@ class UrlPatternPaginator(BasePaginator):
         self.base_url = config.get("base_url", "")
         self.param = self.pagination_config.get("param", "page")
         self.placeholder = f"{{{self.param}}}"
+        # base_url split around the placeholder once, so building a page URL
+        # is a join rather than a scan of the URL
+        self._url_parts = self.base_url.split(self.placeholder)
+        self._stop_page = self.start_page + self.max_pages
+
+    def url_for_page(self, page: int) -> str:
+        """base_url with the placeholder replaced by page."""
+        parts = self._url_parts
+        if len(parts) == 2:
+            return f"{parts[0]}{page}{parts[1]}"
+        return str(page).join(parts)
 
     def get_next_url(self, current_response: FetchResult, current_page_number: int) -> Optional[str]:
-        next_page = current_page_number + 1
-        # If we started at 0, current_page_number 1 means we just finished page 0.
-        # But the orchestrator starts current_page at 1 and increments.
-        # Let's adjust the logic: current_page_number is the count of pages fetched.
-        
-        # Actually, let's use the start_page from config.
+        # current_page_number is the count of pages fetched, counting from start_page
         target_page = self.start_page + current_page_number
         
-        if target_page >= self.start_page + self.max_pages:
+        if target_page >= self._stop_page:
             return None
             
-        return self.base_url.replace(self.placeholder, str(target_page))
+        return self.url_for_page(target_page)
 
 class NextButtonPaginator(BasePaginator):
     """
@@ -79,45 +86,83 @@ class NextButtonPaginator(BasePaginator):
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.selector = self.pagination_config.get("selector")
-        self.visited_urls: Set[str] = set()
+        # Hashes of the normalized URLs visited so far, for cycle detection
+        self._seen: Set[int] = set()
+        # "scheme://netloc" of the last page, reused to resolve root-relative links
+        self._origin: Optional[str] = None
+        # The selector may be CSS or XPath. Which one is decided (and the
+        # selector compiled) once here: CSS if it translates, else XPath
+        # (e.g. "//a[@rel='next']/@href" or "a[@rel='next']/@href").
+        # Raises ParseError if it's neither.
+        self._compiled = None
+        if self.selector:
+            try:
+                self._compiled = compile_selector(self.selector, "css")
+            except ParseError as css_error:
+                try:
+                    self._compiled = compile_selector(self.selector, "xpath")
+                except ParseError:
+                    raise css_error from None
 
     def get_next_url(self, current_response: FetchResult, current_page_number: int) -> Optional[str]:
         if not self.selector:
             return None
             
         # Add current URL to visited to detect cycles
-        self.visited_urls.add(current_response.url)
+        self._seen.add(self._url_key(current_response.url))
         
-        sel = Selector(text=current_response.body)
+        # The page's tree, shared with the record parser when it ran in this process
+        root = current_response.selector.root
         
-        # Extract the href. We support both CSS and XPath via parsel.
-        # If the user provided a selector like "a::attr(href)", parsel handles it.
+        # Extract the href. If the user provided a selector like
+        # "a::attr(href)", the CSS translation handles it.
         # If they just provided "a.next", we might need to be smarter,
         # but the story says "li.next > a::attr(href)".
         try:
-            next_href = sel.css(self.selector).get()
-        except Exception:
-            next_href = None
-            
-        if not next_href:
-            try:
-                next_href = sel.xpath(self.selector).get()
-            except Exception:
-                next_href = None
+            values = select_all(root, self._compiled)
+        except etree.XPathError as e:
+            raise ParseError(f"Invalid pagination selector '{self.selector}': {str(e)}")
+        next_href = values[0] if values else None
         
         if not next_href:
             return None
             
         # Resolve relative URL
-        next_url = urljoin(current_response.url, next_href)
+        next_url = self._resolve(current_response.url, next_href.strip())
         
         # Cycle detection (Story 4.2 AC 6)
-        if next_url in self.visited_urls:
-            logger.warning(f"Pagination cycle detected: {next_url} already visited. Stopping.")
+        if self._url_key(next_url) in self._seen:
+            logger.warning("Pagination cycle detected: %s already visited. Stopping.", next_url)
             return None
             
         return next_url
 
+    @staticmethod
+    def _url_key(url: str) -> int:
+        """Hash of the URL with its fragment dropped and query parameters sorted.
+        
+        Only the hash is kept, so memory per visited page stays constant
+        however long its URL is.
+        """
+        parts = urlsplit(url)
+        query = tuple(sorted(parse_qsl(parts.query, keep_blank_values=True))) if parts.query else ()
+        return hash((parts.scheme.lower(), parts.netloc.lower(), parts.path, query))
+
+    def _resolve(self, base_url: str, href: str) -> str:
+        """urljoin(base_url, href), without re-parsing base_url for the common link shapes."""
+        if href.startswith(("http://", "https://")) and "/." not in href:
+            return href
+        if href.startswith("/") and not href.startswith("//") and "/." not in href:
+            origin = self._origin
+            if origin is None or not base_url.startswith(origin) or base_url[len(origin):len(origin) + 1] not in ("", "/", "?", "#"):
+                parts = urlsplit(base_url)
+                if not (parts.scheme and parts.netloc):
+                    return urljoin(base_url, href)
+                origin = self._origin = f"{parts.scheme}://{parts.netloc}"
+            return origin + href
+        # Path-relative links, dot segments, data:/mailto: etc.
+        return urljoin(base_url, href)
+
 class ScrollPaginator(BasePaginator):
     """
     Pagination strategy that scrolls to the bottom of the page to load more content.
@@ -1,14 +1,107 @@
+import functools
+import io
 import logging
-from typing import Any, Optional, Union, List, Dict
+import re
+from dataclasses import dataclass, field, fields as dataclass_fields
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Union, List, Dict, Tuple
+from lxml import etree
 from parsel import Selector
-from cwsf.engine.transforms import apply_transforms
+from parsel.csstranslator import HTMLTranslator
+
+if TYPE_CHECKING:
+    from cwsf.engine.plan import FieldPlan, SelectorsPlan
 
 logger = logging.getLogger(__name__)
 
+_css_translator = HTMLTranslator()
+# The EXSLT namespaces (re:, set:) parsel makes available to XPath selectors
+_XPATH_NAMESPACES = dict(Selector._default_namespaces)
+
+# A CSS container that is a single tag with classes, ids or attributes (no
+# combinators or pseudo-classes) can be matched on each element as it is
+# parsed, which is what streaming needs
+_STREAMABLE_CONTAINER = re.compile(r"^([a-zA-Z][\w-]*)(?:[.#][\w-]+|\[[^\]]+\])*$")
+
 class ParseError(Exception):
     """Raised when parsing fails."""
     pass
 
+@dataclass(slots=True, frozen=True)
+class CompiledSelectors:
+    """A 'selectors' config with every selector translated to XPath.
+    
+    Built once per site by compile_selectors() and reused for every page.
+    Holds only strings and dicts, so it can be sent to a worker process.
+    For the "lexbor" engine the selectors are kept as CSS. stream_tag and
+    stream_match are set when the page should be parsed incrementally (see
+    _iter_records_streaming).
+    """
+    container: Optional[str]
+    container_source: Optional[str]
+    fields: Tuple[Tuple[str, str, Dict[str, Any]], ...]
+    engine: str = "css"
+    stream_tag: Optional[str] = None
+    stream_match: Optional[str] = None
+    _plan: Optional["SelectorsPlan"] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def plan(self) -> "SelectorsPlan":
+        """The compiled XPaths and transform pipelines, built on first use."""
+        if self._plan is None:
+            from cwsf.engine.plan import build_plan
+            object.__setattr__(self, "_plan", build_plan(self))
+        return self._plan
+
+    # The plan holds compiled XPath objects, which can't be pickled, so it is
+    # left out when the selectors are sent to a worker process and rebuilt there
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, f.name) for f in dataclass_fields(self) if f.init)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for f, value in zip((f for f in dataclass_fields(self) if f.init), state):
+            object.__setattr__(self, f.name, value)
+        object.__setattr__(self, "_plan", None)
+
+# Compiled selectors are cached process-wide, so every page of a long
+# pagination run (and every site sharing a selector) reuses them
+@functools.lru_cache(maxsize=512)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """Compile an XPath the way parsel would evaluate it."""
+    return etree.XPath(xpath, namespaces=_XPATH_NAMESPACES, smart_strings=False)
+
+@functools.lru_cache(maxsize=512)
+def compile_selector(selector: str, selector_type: str = "css") -> etree.XPath:
+    """Return the compiled XPath for a CSS or XPath selector.
+    
+    Raises:
+        ParseError: If the selector type is unknown or the selector is invalid.
+    """
+    return _compile_xpath(_to_xpath(selector, selector_type))
+
+def _to_text(node: Any) -> str:
+    """Serialize one XPath result the same way parsel's Selector.get() does."""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, bool):
+        return "1" if node else "0"
+    try:
+        return etree.tostring(node, method="html", encoding="unicode", with_tail=False)
+    except TypeError:
+        return str(node)
+
+def select_all(root: etree._Element, compiled: etree.XPath) -> List[str]:
+    """Run a compiled selector on an element; results serialized like parsel's getall()."""
+    results = compiled(root)
+    if not isinstance(results, list):
+        return [_to_text(results)]
+    return [_to_text(node) for node in results]
+
+def _field_value(results: List[str]) -> Any:
+    """None for no match, the value for one match, else the list of values."""
+    if not results:
+        return None
+    return results[0] if len(results) == 1 else results
+
 def parse_field(html_or_selector: Union[str, Selector], selector: str, selector_type: str = "css") -> Any:
     """Extract field values from HTML using CSS or XPath selectors.
     
@@ -24,73 +117,237 @@ def parse_field(html_or_selector: Union[str, Selector], selector: str, selector_
     Raises:
         ParseError: If the selector type is unknown or the selector is invalid.
     """
+    compiled = compile_selector(selector, selector_type)
     if isinstance(html_or_selector, str):
-        sel = Selector(text=html_or_selector)
+        root = Selector(text=html_or_selector).root
     else:
-        sel = html_or_selector
+        root = html_or_selector.root
+    if not isinstance(root, etree._Element):
+        return None
 
+    try:
+        results = select_all(root, compiled)
+    except etree.XPathError as e:
+        raise ParseError(f"Invalid {selector_type} selector '{selector}': {str(e)}")
+
+    return _field_value(results)
+
+def _to_xpath(selector: str, selector_type: str) -> str:
+    """Translate a CSS selector to XPath and check that the result compiles."""
     try:
         if selector_type == "css":
-            results = sel.css(selector).getall()
+            xpath = _css_translator.css_to_xpath(selector)
         elif selector_type == "xpath":
-            results = sel.xpath(selector).getall()
+            xpath = selector
         else:
             raise ParseError(f"Unknown selector type: {selector_type}")
+        _compile_xpath(xpath)
     except Exception as e:
         if isinstance(e, ParseError):
             raise
         raise ParseError(f"Invalid {selector_type} selector '{selector}': {str(e)}")
+    return xpath
 
-    if not results:
-        return None
-    
-    return results[0] if len(results) == 1 else results
-
-def parse_records(html: str, selectors_config: Dict[str, Any]) -> List[Dict[str, Any]]:
-    """Extract multiple records from HTML based on a container selector.
+def compile_selectors(selectors_config: Dict[str, Any]) -> CompiledSelectors:
+    """Prepare the 'selectors' section of a config for parse_records_compiled.
     
     Args:
-        html: The HTML string to parse.
         selectors_config: The 'selectors' section of the config, containing
                          'container' and 'fields'.
                          
     Returns:
-        A list of dictionaries, where each dictionary represents one record.
-        If no container is specified, extracts a single record from the full page.
+        A CompiledSelectors to pass to parse_records_compiled for each page.
+        
+    Raises:
+        ParseError: If a selector type is unknown or a selector is invalid.
     """
-    sel = Selector(text=html)
-    container_selector = selectors_config.get("container")
-    fields_config = selectors_config.get("fields", {})
+    # With engine "xpath" the container and untyped fields are authored as
+    # XPath and used as-is. CSS is translated with a descendant-or-self::
+    # prefix, so it is already scoped to the container it runs in.
+    engine = selectors_config.get("engine", "css")
+    container_selector = selectors_config.get("container") or None
+    if engine == "lexbor":
+        from cwsf.engine.parser_lexbor import check_selectors
+        check_selectors(selectors_config)
+        fields = tuple(
+            (field_name, field_cfg["selector"], field_cfg)
+            for field_name, field_cfg in selectors_config.get("fields", {}).items()
+        )
+        return CompiledSelectors(
+            container=container_selector, container_source=container_selector, fields=fields, engine=engine
+        )
 
-    if not container_selector:
-        # Single record from full page
-        record = {}
-        for field_name, field_cfg in fields_config.items():
-            val = parse_field(
-                sel,
-                field_cfg["selector"],
-                field_cfg.get("type", "css")
+    container = None
+    if container_selector:
+        container_type = "xpath" if engine == "xpath" or container_selector.startswith("/") else "css"
+        container = _to_xpath(container_selector, container_type)
+
+    fields = tuple(
+        (field_name, _to_xpath(field_cfg["selector"], field_cfg.get("type", engine)), field_cfg)
+        for field_name, field_cfg in selectors_config.get("fields", {}).items()
+    )
+
+    stream_tag = stream_match = None
+    if selectors_config.get("streaming") and container_selector:
+        simple = _STREAMABLE_CONTAINER.match(container_selector) if container_type == "css" else None
+        if simple:
+            stream_tag = simple.group(1).lower()
+            stream_match = _css_translator.css_to_xpath(container_selector, prefix="self::")
+        else:
+            logger.warning(
+                "selectors.streaming needs a simple CSS container (tag with optional classes, ids "
+                "or attributes); '%s' will be parsed without streaming.", container_selector
             )
-            record[field_name] = apply_transforms(val, field_cfg)
-        return [record]
+    return CompiledSelectors(
+        container=container, container_source=container_selector, fields=fields,
+        stream_tag=stream_tag, stream_match=stream_match,
+    )
+
+def _extract_record(root: etree._Element, fields: Tuple["FieldPlan", ...]) -> Dict[str, Any]:
+    """Extract one record's fields (with transforms) from an element."""
+    record = {}
+    for fp in fields:
+        try:
+            results = select_all(root, fp.xpath)
+        except etree.XPathError as e:
+            raise ParseError(f"Invalid selector '{fp.selector}' for field '{fp.name}': {str(e)}")
+        value = _field_value(results)
+        record[fp.name] = value if fp.pipeline is None else fp.pipeline(value)
+    return record
+
+def _iter_records_streaming(
+    html: str,
+    compiled: CompiledSelectors,
+    fields: Tuple["FieldPlan", ...],
+) -> Iterator[Dict[str, Any]]:
+    """Yield records as their container elements finish parsing.
+    
+    Only elements with the container's tag are reported by the parser, and
+    each matched container is cleared (along with the siblings before it)
+    once its record is extracted, so the tree never holds the whole page.
+    Containers must not be nested inside one another.
+    """
+    is_container = _compile_xpath(compiled.stream_match)
+    events = etree.iterparse(
+        io.BytesIO(html.encode("utf-8")),
+        events=("end",),
+        tag=compiled.stream_tag,
+        html=True,
+        encoding="utf-8",
+        recover=True,
+    )
+    for _, element in events:
+        if not is_container(element):
+            continue
+        yield _extract_record(element, fields)
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+def iter_records_compiled(html_or_selector: Union[str, Selector], compiled: CompiledSelectors) -> Iterator[Dict[str, Any]]:
+    """Yield records from HTML one at a time, using selectors from compile_selectors.
+    
+    Each record is extracted only when the consumer asks for it, so a writer
+    can store records as they are produced instead of waiting for the page.
+    Given an already-parsed Selector, its tree is used as-is (no streaming).
+    
+    Args:
+        html_or_selector: The HTML string or a parsel.Selector object to parse.
+        compiled: The site's compiled selectors.
+                         
+    Yields:
+        One dictionary per record. If no container is specified, yields a
+        single record from the full page.
+    """
+    if compiled.engine == "lexbor":
+        from cwsf.engine.parser_lexbor import iter_records_lexbor
+        html = html_or_selector if isinstance(html_or_selector, str) else html_or_selector.get()
+        yield from iter_records_lexbor(html, compiled)
+        return
+
+    # Run each field's compiled XPath directly on each container's element,
+    # skipping parsel's per-call lookup and Selector wrapping of every result,
+    # then its transform pipeline
+    plan = compiled.plan
+    fields = plan.fields
+
+    if compiled.stream_tag is not None and isinstance(html_or_selector, str):
+        matched = 0
+        for record in _iter_records_streaming(html_or_selector, compiled, fields):
+            matched += 1
+            yield record
+        if not matched:
+            logger.warning("Container selector '%s' matched 0 elements.", compiled.container_source)
+        return
+
+    if isinstance(html_or_selector, str):
+        root = Selector(text=html_or_selector).root
+    else:
+        root = html_or_selector.root
+
+    if plan.container is None:
+        # Single record from full page
+        yield _extract_record(root, fields)
+        return
 
     # Multiple records from containers
-    containers = sel.css(container_selector) if not container_selector.startswith("/") else sel.xpath(container_selector)
+    containers = plan.container(root)
+    if not isinstance(containers, list):
+        containers = []
+    containers = [node for node in containers if isinstance(node, etree._Element)]
     
     if not containers:
-        logger.warning(f"Container selector '{container_selector}' matched 0 elements.")
-        return []
+        logger.warning("Container selector '%s' matched 0 elements.", compiled.container_source)
+        return
 
-    records = []
     for container in containers:
-        record = {}
-        for field_name, field_cfg in fields_config.items():
-            val = parse_field(
-                container,
-                field_cfg["selector"],
-                field_cfg.get("type", "css")
-            )
-            record[field_name] = apply_transforms(val, field_cfg)
-        records.append(record)
+        yield _extract_record(container, fields)
+
+def parse_records_compiled(html_or_selector: Union[str, Selector], compiled: CompiledSelectors) -> List[Dict[str, Any]]:
+    """Extract multiple records from HTML using selectors from compile_selectors.
+    
+    The list form of iter_records_compiled, for callers that need every
+    record at once (e.g. results sent back from a worker process).
     
-    return records
+    Args:
+        html_or_selector: The HTML string or a parsel.Selector object to parse.
+        compiled: The site's compiled selectors.
+                         
+    Returns:
+        A list of dictionaries, where each dictionary represents one record.
+        If no container is specified, extracts a single record from the full page.
+    """
+    return list(iter_records_compiled(html_or_selector, compiled))
+
+def iter_records(html_or_selector: Union[str, Selector], selectors_config: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Yield records from HTML one at a time, based on a container selector.
+    
+    Args:
+        html_or_selector: The HTML string or a parsel.Selector object to parse.
+        selectors_config: The 'selectors' section of the config, containing
+                         'container' and 'fields'.
+                         
+    Yields:
+        One dictionary per record. If no container is specified, yields a
+        single record from the full page.
+    """
+    return iter_records_compiled(html_or_selector, compile_selectors(selectors_config))
+
+def parse_records(html_or_selector: Union[str, Selector], selectors_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Extract multiple records from HTML based on a container selector.
+    
+    Compiles the selectors on every call; when parsing several pages with the
+    same selectors, use compile_selectors() and parse_records_compiled().
+    
+    Args:
+        html_or_selector: The HTML string or a parsel.Selector object to parse.
+        selectors_config: The 'selectors' section of the config, containing
+                         'container' and 'fields'.
+                         
+    Returns:
+        A list of dictionaries, where each dictionary represents one record.
+        If no container is specified, extracts a single record from the full page.
+    """
+    return list(iter_records(html_or_selector, selectors_config))
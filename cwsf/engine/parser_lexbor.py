@@ -0,0 +1,117 @@
+"""selectolax (lexbor) backend for parse_records.
+
+Used for sites with ``selectors.engine: lexbor``. lexbor parses and queries
+much faster than lxml, but only understands CSS: fields must be CSS
+selectors, optionally ending in parsel's ``::text`` or ``::attr(name)``.
+Requires the optional selectolax package (``pip install cwsf[lexbor]``).
+"""
+
+import functools
+import logging
+import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from cwsf.engine.parser import CompiledSelectors, ParseError
+from cwsf.engine.transforms import build_pipeline
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+# parsel's pseudo-elements, which lexbor doesn't support: ::text and ::attr(name)
+_PSEUDO_ELEMENT = re.compile(r"::(text|attr\(\s*([^)\s]+)\s*\))\s*$")
+
+
+@functools.lru_cache(maxsize=512)
+def _split_selector(selector: str) -> Tuple[str, str, Optional[str]]:
+    """Split a selector into (css, mode, attribute), mode being "html", "text" or "attr"."""
+    match = _PSEUDO_ELEMENT.search(selector)
+    if not match:
+        return selector, "html", None
+    css = selector[:match.start()].strip() or "*"
+    if match.group(2):
+        return css, "attr", match.group(2)
+    return css, "text", None
+
+
+def check_selectors(selectors_config: Dict[str, Any]) -> None:
+    """Check that a 'selectors' section can be used with the lexbor engine.
+
+    Raises:
+        ParseError: If selectolax isn't installed, or a selector is XPath.
+    """
+    if LexborHTMLParser is None:
+        raise ParseError("selectors.engine 'lexbor' requires selectolax (pip install cwsf[lexbor])")
+    container = selectors_config.get("container")
+    if container and container.startswith("/"):
+        raise ParseError(f"The lexbor engine only supports CSS selectors, got container '{container}'")
+    for field_name, field_cfg in selectors_config.get("fields", {}).items():
+        if field_cfg.get("type", "css") != "css":
+            raise ParseError(f"The lexbor engine only supports CSS selectors (field '{field_name}')")
+
+
+def _select_all(node: Any, selector: str) -> List[str]:
+    """All values a field selector yields from node."""
+    css, mode, attribute = _split_selector(selector)
+    matches = node.css(css)
+    if mode == "text":
+        return [match.text(deep=False) for match in matches]
+    if mode == "attr":
+        return [match.attributes[attribute] for match in matches if match.attributes.get(attribute) is not None]
+    return [match.html for match in matches]
+
+
+def _extract_record(node: Any, fields: List[Tuple[str, str, Callable[[Any], Any]]]) -> Dict[str, Any]:
+    """Extract one record's fields (with transforms) from a node."""
+    record = {}
+    for field_name, selector, pipeline in fields:
+        try:
+            results = _select_all(node, selector)
+        except ValueError as e:
+            raise ParseError(f"Invalid selector '{selector}' for field '{field_name}': {str(e)}")
+        if not results:
+            val = None
+        else:
+            val = results[0] if len(results) == 1 else results
+        record[field_name] = pipeline(val)
+    return record
+
+
+def iter_records_lexbor(html: str, compiled: CompiledSelectors) -> Iterator[Dict[str, Any]]:
+    """Yield records from HTML one at a time with selectolax's lexbor parser.
+
+    Args:
+        html: The HTML string to parse.
+        compiled: The site's selectors from compile_selectors() (engine "lexbor").
+
+    Yields:
+        One dictionary per record. If no container is specified, yields a
+        single record from the full page.
+    """
+    tree = LexborHTMLParser(html)
+    fields = [(field_name, selector, build_pipeline(field_cfg)) for field_name, selector, field_cfg in compiled.fields]
+
+    if compiled.container is None:
+        # Single record from full page
+        yield _extract_record(tree, fields)
+        return
+
+    try:
+        containers = tree.css(compiled.container)
+    except ValueError as e:
+        raise ParseError(f"Invalid css selector '{compiled.container}': {str(e)}")
+
+    if not containers:
+        logger.warning("Container selector '%s' matched 0 elements.", compiled.container_source)
+        return
+
+    for container in containers:
+        yield _extract_record(container, fields)
+
+
+def parse_records_lexbor(html: str, compiled: CompiledSelectors) -> List[Dict[str, Any]]:
+    """The list form of iter_records_lexbor."""
+    return list(iter_records_lexbor(html, compiled))
@@ -0,0 +1,57 @@
+"""Per-site extraction plans for parse_records.
+
+A SelectorsPlan holds everything parsing a page needs, ready to run: each
+field's compiled XPath and transform pipeline. It is built once from a
+CompiledSelectors (see CompiledSelectors.plan), so the per-page work is only
+walking the tree.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from lxml import etree
+
+from cwsf.engine.parser import CompiledSelectors, _compile_xpath
+from cwsf.engine.transforms import _identity, build_pipeline
+
+
+@dataclass(slots=True, frozen=True)
+class FieldPlan:
+    """How to extract one field: its compiled XPath and transform pipeline.
+    
+    pipeline is None when the field has no transform or default, so the
+    value is stored without a call.
+    """
+    name: str
+    xpath: etree.XPath
+    pipeline: Optional[Callable[[Any], Any]]
+    # The selector as configured, for error messages
+    selector: str
+
+
+@dataclass(slots=True, frozen=True)
+class SelectorsPlan:
+    """A site's container XPath (None for one record per page) and field plans."""
+    container: Optional[etree.XPath]
+    fields: Tuple[FieldPlan, ...]
+
+
+def _plan_pipeline(field_cfg: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+    """The field's transform pipeline, or None if it would leave values unchanged."""
+    pipeline = build_pipeline(field_cfg)
+    return None if pipeline is _identity else pipeline
+
+
+def build_plan(compiled: CompiledSelectors) -> SelectorsPlan:
+    """Compile the XPaths and transform pipelines for an lxml-engine CompiledSelectors."""
+    container = _compile_xpath(compiled.container) if compiled.container is not None else None
+    fields = tuple(
+        FieldPlan(
+            name=field_name,
+            xpath=_compile_xpath(xpath),
+            pipeline=_plan_pipeline(field_cfg),
+            selector=field_cfg["selector"],
+        )
+        for field_name, xpath, field_cfg in compiled.fields
+    )
+    return SelectorsPlan(container=container, fields=fields)
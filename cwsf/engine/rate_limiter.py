@@ -1,13 +1,23 @@
 import asyncio
 import time
 import logging
+from datetime import datetime, timezone
 from typing import Any, Callable, Awaitable, Optional, Dict
 from urllib.parse import urlparse
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, nullcontext
 
 logger = logging.getLogger(__name__)
 
 RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+# RETRYABLE_STATUS_CODES as a bitmap, so the per-response check is a shift and a mask
+_RETRY_BITMAP = sum(1 << code for code in RETRYABLE_STATUS_CODES)
+
+# At or above this many concurrent requests a domain is treated as unlimited
+UNLIMITED_CONCURRENCY = 1000
+
+def _utc_timestamp() -> str:
+    """Current UTC time as e.g. 2024-01-31T12:00:00Z."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
 
 class DomainRateLimiter:
     """
@@ -27,27 +37,41 @@ class DomainRateLimiter:
         self.backoff_factor = backoff_factor
         
         self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Start time of the most recently admitted request, or the end time of
+        # the most recently finished one, whichever is later
         self._last_request_time = 0.0
-        self._lock = asyncio.Lock()
+
+        # With no delay there is nothing to time, so an attempt only needs the
+        # semaphore, or nothing at all when concurrency is unlimited. None
+        # means the full acquire() is needed.
+        self._gate: Any = None
+        if delay_seconds <= 0:
+            self._gate = nullcontext() if max_concurrent >= UNLIMITED_CONCURRENCY else self._semaphore
 
     @asynccontextmanager
     async def acquire(self):
         """
         Async context manager to enforce concurrency and per-request delay.
+        
+        Each request reserves its start time before sleeping, so concurrent
+        waiters are spaced delay_seconds apart without holding a lock while
+        they sleep. The reservation runs without an await in between, so on
+        the event loop it needs no lock at all.
         """
         async with self._semaphore:
-            async with self._lock:
-                now = time.perf_counter()
-                wait_time = self.delay_seconds - (now - self._last_request_time)
-                if wait_time > 0:
-                    logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
-                    await asyncio.sleep(wait_time)
+            now = time.perf_counter()
+            start = max(now, self._last_request_time + self.delay_seconds)
+            self._last_request_time = start
+            wait_time = start - now
+            if wait_time > 0:
+                logger.debug("Rate limiting: waiting %.2fs", wait_time)
+                await asyncio.sleep(wait_time)
             
             try:
                 yield
             finally:
-                async with self._lock:
-                    self._last_request_time = time.perf_counter()
+                # The delay also runs from when this request finished
+                self._last_request_time = max(self._last_request_time, time.perf_counter())
 
     async def execute(self, url: str, request_callable: Callable[[], Awaitable[Any]], site_name: str = "unknown") -> Any:
         """
@@ -62,38 +86,39 @@ class DomainRateLimiter:
                     # Exponential backoff: backoff_factor ^ attempt_number
                     wait_time = self.backoff_factor ** attempt
                     logger.warning(
-                        f"Retry attempt {attempt}/{self.max_retries} for {url} "
-                        f"(site: {site_name}) after {wait_time}s backoff"
+                        "Retry attempt %d/%d for %s (site: %s) after %ss backoff",
+                        attempt, self.max_retries, url, site_name, wait_time
                     )
                     await asyncio.sleep(wait_time)
 
                 # Each attempt must acquire the rate limiter (delay + concurrency)
-                async with self.acquire():
+                async with self.acquire() if self._gate is None else self._gate:
                     result = await request_callable()
                 
                 # Check if result has status_code (like FetchResult or httpx.Response)
                 status_code = getattr(result, "status_code", None)
                 
-                if status_code in RETRYABLE_STATUS_CODES:
+                if type(status_code) is int and status_code >= 0 and (_RETRY_BITMAP >> status_code) & 1:
                     if attempt < self.max_retries:
                         logger.warning(
-                            f"Retryable status {status_code} for {url} (site: {site_name}). "
-                            f"Attempt {attempt + 1}/{self.max_retries}"
+                            "Retryable status %s for %s (site: %s). Attempt %d/%d",
+                            status_code, url, site_name, attempt + 1, self.max_retries
                         )
                         continue
                     else:
                         # Exhausted retries with a retryable status code
                         # Story 7.3: Log final failure with full context
-                        logger.error(
-                            f"Exhausted retries for {url} (site: {site_name}). "
-                            f"Final status: {status_code}, retries attempted: {attempt}, "
-                            f"timestamp: {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}"
-                        )
+                        if logger.isEnabledFor(logging.ERROR):
+                            logger.error(
+                                "Exhausted retries for %s (site: %s). "
+                                "Final status: %s, retries attempted: %d, timestamp: %s",
+                                url, site_name, status_code, attempt, _utc_timestamp()
+                            )
                         return result
                 
                 # Success recovery log
                 if attempt > 0:
-                    logger.info(f"Recovered on attempt {attempt} for {url} (site: {site_name})")
+                    logger.info("Recovered on attempt %d for %s (site: %s)", attempt, url, site_name)
 
                 # Success or non-retryable error
                 return result
@@ -102,17 +127,18 @@ class DomainRateLimiter:
                 last_exception = exc
                 if attempt < self.max_retries:
                     logger.warning(
-                        f"Retryable error for {url} (site: {site_name}): {exc}. "
-                        f"Attempt {attempt + 1}/{self.max_retries}"
+                        "Retryable error for %s (site: %s): %s. Attempt %d/%d",
+                        url, site_name, exc, attempt + 1, self.max_retries
                     )
                     continue
                 else:
                     # Story 7.3: Log final failure with full context
-                    logger.error(
-                        f"Exhausted retries for {url} (site: {site_name}). "
-                        f"Final error: {type(exc).__name__}: {exc}, retries attempted: {attempt}, "
-                        f"timestamp: {time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())}"
-                    )
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error(
+                            "Exhausted retries for %s (site: %s). "
+                            "Final error: %s: %s, retries attempted: %d, timestamp: %s",
+                            url, site_name, type(exc).__name__, exc, attempt, _utc_timestamp()
+                        )
                     raise
 
         # Should not reach here if max_retries >= 0
@@ -1,9 +1,15 @@
+import functools
 import logging
 import re
 from typing import Any, Callable, Dict, Optional, Union, List
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=256)
+def _compile_re(pattern: str) -> "re.Pattern[str]":
+    """Compile a transform_pattern once; the same few patterns run on every record."""
+    return re.compile(pattern)
+
 def regex_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
     """Apply a regex extraction pattern to a value.
     
@@ -23,17 +29,20 @@ def regex_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
         return value
 
     pattern = config["transform_pattern"]
+    search = _compile_re(pattern).search
     
     def _apply_regex(val: Any) -> Any:
         if not isinstance(val, str):
             return val
         
-        match = re.search(pattern, val)
+        match = search(val)
         if match:
             # Return first capture group if it exists, else the whole match
             return match.group(1) if match.groups() else match.group(0)
         
-        logger.debug(f"Regex pattern '{pattern}' did not match value: {val}")
+        # The miss path can be the common one, so skip the call entirely below DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Regex pattern '%s' did not match value: %s", pattern, val)
         return None
 
     if isinstance(value, list):
@@ -41,6 +50,18 @@ def regex_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
     
     return _apply_regex(value)
 
+def _to_bool(val: Any) -> bool:
+    if isinstance(val, str):
+        return val.lower() in ("true", "1", "yes", "on")
+    return bool(val)
+
+_CASTS: Dict[str, Callable[[Any], Any]] = {
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+    "str": str,
+}
+
 def cast_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
     """Cast a value to a specified type (int, float, bool, str).
     
@@ -60,27 +81,20 @@ def cast_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
         return value
 
     cast_type = config["cast_type"]
+    # Pick the converter once rather than re-checking cast_type per element
+    convert = _CASTS.get(cast_type)
+    if convert is None:
+        logger.warning("Unsupported cast type: %s", cast_type)
+        return value
     
     def _apply_cast(val: Any) -> Any:
         if val is None:
             return None
             
         try:
-            if cast_type == "int":
-                return int(val)
-            elif cast_type == "float":
-                return float(val)
-            elif cast_type == "bool":
-                if isinstance(val, str):
-                    return val.lower() in ("true", "1", "yes", "on")
-                return bool(val)
-            elif cast_type == "str":
-                return str(val)
-            else:
-                logger.warning(f"Unsupported cast type: {cast_type}")
-                return val
+            return convert(val)
         except (ValueError, TypeError) as e:
-            logger.warning(f"Failed to cast value '{val}' to {cast_type}: {str(e)}")
+            logger.warning("Failed to cast value '%s' to %s: %s", val, cast_type, e)
             return None
 
     if isinstance(value, list):
@@ -104,7 +118,9 @@ def strip_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
     if isinstance(value, str):
         return value.strip()
     if isinstance(value, list):
-        return [strip_transform(v, config) for v in value]
+        # Elements are nearly always strings; only anything else (e.g. a
+        # nested list) goes back through the full dispatch
+        return [v.strip() if type(v) is str else strip_transform(v, config) for v in value]
     return value
 
 def default_transform(value: Any, config: Optional[Dict[str, Any]] = None) -> Any:
@@ -155,15 +171,66 @@ def apply_transforms(value: Any, field_config: Dict[str, Any]) -> Any:
     if transform_key:
         transform_fn = TRANSFORMS.get(transform_key)
         if not transform_fn:
-            logger.warning(f"Unknown transform: {transform_key}")
+            logger.warning("Unknown transform: %s", transform_key)
         else:
             try:
                 value = transform_fn(value, field_config)
             except Exception as e:
-                logger.error(f"Error applying transform '{transform_key}': {str(e)}")
+                logger.error("Error applying transform '%s': %s", transform_key, e)
 
     # 2. Apply default value if configured (always runs last)
     if "default" in field_config:
         value = default_transform(value, field_config)
 
     return value
+
+def _identity(value: Any) -> Any:
+    return value
+
+@functools.lru_cache(maxsize=1024)
+def _build_pipeline(frozen_config: tuple) -> Callable[[Any], Any]:
+    """Build the pipeline for a field config given as sorted (key, type, value) triples."""
+    field_config = {key: value for key, _, value in frozen_config}
+    transform_key = field_config.get("transform")
+    transform_fn = None
+    if transform_key:
+        transform_fn = TRANSFORMS.get(transform_key)
+        if not transform_fn:
+            logger.warning("Unknown transform: %s", transform_key)
+    has_default = "default" in field_config
+
+    if transform_fn is None and not has_default:
+        return _identity
+
+    def pipeline(value: Any) -> Any:
+        if transform_fn is not None:
+            try:
+                value = transform_fn(value, field_config)
+            except Exception as e:
+                logger.error("Error applying transform '%s': %s", transform_key, e)
+        if has_default:
+            value = default_transform(value, field_config)
+        return value
+
+    return pipeline
+
+def build_pipeline(field_config: Dict[str, Any]) -> Callable[[Any], Any]:
+    """Return a function applying a field's transforms, equivalent to apply_transforms.
+    
+    The transform lookup and option checks are done once here instead of for
+    every value, and pipelines are cached per distinct field config. Fields
+    with neither a transform nor a default get a no-op.
+    
+    Args:
+        field_config: The configuration for the field.
+        
+    Returns:
+        A function taking the extracted value and returning the transformed value.
+    """
+    try:
+        # The value's type is part of the key: 1, 1.0 and True hash and
+        # compare equal, but a default of each must stay as configured
+        return _build_pipeline(tuple(sorted((key, type(value), value) for key, value in field_config.items())))
+    except TypeError:
+        # Unhashable option values (e.g. a list default): no caching
+        return functools.partial(apply_transforms, field_config=field_config)
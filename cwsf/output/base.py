@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, Iterator
 
 
 class BaseWriter(ABC):
@@ -22,12 +22,13 @@ class BaseWriter(ABC):
         pass
 
     @abstractmethod
-    def write_records(self, records: List[Dict[str, Any]]) -> int:
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> int:
         """
         Write a batch of scraped records.
         
         Args:
-            records: A list of dictionaries containing the scraped data.
+            records: The dictionaries containing the scraped data. May be a
+                generator, in which case it is consumed exactly once.
             
         Returns:
             int: The count of records successfully written.
@@ -41,26 +42,30 @@ class BaseWriter(ABC):
         """
         pass
 
-    def write_metadata(self, records: List[Dict[str, Any]], site_name: str, source_url: str) -> int:
+    def write_metadata(self, records: Iterable[Dict[str, Any]], site_name: str, source_url: str) -> int:
         """
         Enriches records with metadata and delegates to write_records.
         
+        Records are enriched as write_records consumes them, so a generator
+        (e.g. from iter_records) is written without being collected first.
+        
         Args:
-            records: A list of dictionaries containing the scraped data.
+            records: The dictionaries containing the scraped data.
             site_name: The name of the site being scraped.
             source_url: The URL from which the records were extracted.
             
         Returns:
             int: The count of records successfully written.
         """
-        scrape_timestamp = datetime.now(timezone.utc).isoformat()
-        
-        enriched_records = []
+        metadata = {
+            "site_name": site_name,
+            "scrape_timestamp": datetime.now(timezone.utc).isoformat(),
+            "source_url": source_url,
+        }
+        return self.write_records(self._enrich(records, metadata))
+
+    @staticmethod
+    def _enrich(records: Iterable[Dict[str, Any]], metadata: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """Yield each record merged with metadata; the caller's dicts are left untouched."""
         for record in records:
-            enriched_record = record.copy()
-            enriched_record["site_name"] = site_name
-            enriched_record["scrape_timestamp"] = scrape_timestamp
-            enriched_record["source_url"] = source_url
-            enriched_records.append(enriched_record)
-            
-        return self.write_records(enriched_records)
+            yield {**record, **metadata}
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable
 from .base import BaseWriter
 
 
@@ -27,12 +27,12 @@ class WebhookWriter(BaseWriter):
         self.method = output_config.get("method", "POST")
         self.headers = output_config.get("headers", {})
 
-    def write_records(self, records: List[Dict[str, Any]]) -> int:
+    def write_records(self, records: Iterable[Dict[str, Any]]) -> int:
         """
         Raises NotImplementedError as this writer is a stub.
         
         Args:
-            records: A list of dictionaries containing the scraped data.
+            records: The dictionaries containing the scraped data.
             
         Raises:
             NotImplementedError: Always raised with a message indicating V2 implementation.
@@ -1,27 +1,89 @@
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+# Writes queued log records to the real handlers on a background thread;
+# replaced on every setup_logging() call and stopped by stop_logging()
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# logging's own source file, used by findCaller(); saved so it can be restored
+_SRCFILE = logging._srcfile
+# Format fields that need findCaller() (a stack walk per record)
+_CALLER_FIELDS = ("%(pathname)", "%(filename)", "%(module)", "%(funcName)", "%(lineno)")
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as one JSON object per line.
+    
+    Uses orjson when installed (pip install cwsf[fast]), else the json module.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if orjson is not None:
+            return orjson.dumps(entry, default=str).decode()
+        return json.dumps(entry, default=str)
+
+def _configure_record_details(numeric_level: int, format_str: str) -> None:
+    """
+    Below DEBUG verbosity, stop collecting record details the format doesn't use.
+    
+    At INFO and above, records no longer carry thread/process details or the
+    caller's filename, line number and function (no stack walk per record)
+    unless format_str shows them, and errors raised by handlers are not
+    printed. At DEBUG everything is collected as usual.
+    """
+    detailed = numeric_level < logging.INFO
+    logging.logThreads = detailed or "%(thread" in format_str
+    logging.logProcesses = detailed or "%(process" in format_str
+    logging.logMultiprocessing = detailed or "%(processName" in format_str
+    logging.raiseExceptions = detailed
+    needs_caller = detailed or any(field in format_str for field in _CALLER_FIELDS)
+    logging._srcfile = _SRCFILE if needs_caller else None
+
 def setup_logging(
     level: Optional[str] = None,
     log_file: Optional[str] = None,
-    format_str: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    format_str: str = "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    json_format: bool = False
 ) -> None:
     """
     Configures centralized logging for the framework.
     
+    Loggers only put records on an in-memory queue; a background thread
+    writes them to the console and log file, so logging never blocks the
+    caller on I/O. Call stop_logging() to flush the queue (it also runs at exit).
+    
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL). 
                Defaults to CWSF_LOG_LEVEL env var or INFO.
         log_file: Optional path to a log file.
         format_str: Format string for log messages.
+        json_format: Write each record as a JSON object instead of using format_str.
     """
     if level is None:
         level = os.environ.get("CWSF_LOG_LEVEL", "INFO").upper()
     
     numeric_level = getattr(logging, level, logging.INFO)
     
+    stop_logging()
+
     handlers: list[logging.Handler] = [logging.StreamHandler(sys.stdout)]
     
     if log_file:
@@ -30,17 +92,50 @@ def setup_logging(
             log_dir = os.path.dirname(log_file)
             if log_dir:
                 os.makedirs(log_dir, exist_ok=True)
-            handlers.append(logging.FileHandler(log_file))
+            # The file is only opened on the first record it receives (on the
+            # listener thread), so check now that it could be, for AC 6
+            target = log_file if os.path.exists(log_file) else (log_dir or ".")
+            if not os.access(target, os.W_OK):
+                raise PermissionError(f"Permission denied: '{log_file}'")
+            handlers.append(logging.FileHandler(log_file, delay=True))
         except Exception as e:
             # Acceptance Criteria 6: Log warning to console and continue with console-only
             print(f"WARNING: Failed to setup file logging at {log_file}: {e}. Falling back to console-only logging.", file=sys.stderr)
 
+    formatter = JsonFormatter() if json_format else logging.Formatter(format_str)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    global _listener
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    # The queue handler only merges the message and its arguments; the
+    # handlers above apply format_str when they write the record
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Configure root logger
     logging.basicConfig(
         level=numeric_level,
-        format=format_str,
-        handlers=handlers,
+        handlers=[queue_handler],
         force=True  # Override any existing configuration
     )
+    _configure_record_details(numeric_level, "" if json_format else format_str)
 
     logging.getLogger("cwsf").debug(f"Logging initialized at level {level}")
+
+@atexit.register
+def stop_logging() -> None:
+    """
+    Writes out any queued log records and stops the background writer thread.
+    
+    Records logged afterwards are dropped until setup_logging() is called again.
+    """
+    global _listener
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
@@ -6,14 +6,14 @@ to a Gotify server when scraping errors occur or when a run completes.
 
 import logging
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FailureContext:
     """Context for a scraping failure."""
     site_name: str
@@ -24,7 +24,7 @@ class FailureContext:
     retries_attempted: int = 0
     timestamp: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunSummary:
     """Summary of a scraping run."""
     total_sites: int
@@ -38,6 +38,14 @@ class RunSummary:
 class GotifyNotifier:
     """Sends notifications to a Gotify server."""
 
+    SUMMARY_TITLE = "CWSF Run Summary (Failures Detected)"
+
+    # Errors reported within this many seconds of the first are sent together
+    ERROR_BATCH_WINDOW = 2.0
+
+    # At most this many errors are spelled out in one grouped notification
+    MAX_BATCHED_ERRORS = 20
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize the notifier with Gotify configuration.
 
@@ -50,6 +58,33 @@ class GotifyNotifier:
         self.app_token = self.config.get("app_token")
         self.priority = self.config.get("priority", 5)
         self.enabled = bool(self.server_url and self.app_token)
+        # Created on the first notification and kept, so later notifications
+        # reuse its pooled keep-alive connection; released by aclose()
+        self._client: Optional[httpx.AsyncClient] = None
+        # Errors waiting for the current batch window to close
+        self._pending_errors: List[FailureContext] = []
+        # The task waiting out the current window, if one is open; flush()
+        # cancels it while it is still waiting
+        self._flush_task: Optional[asyncio.Task] = None
+        # Window tasks whose grouped notification is being sent
+        self._sending: Set[asyncio.Task] = set()
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=10.0, limits=httpx.Limits(max_keepalive_connections=4)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Send any pending errors, then close the shared client, if one was created."""
+        await self.flush()
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     async def _send_notification(self, title: str, message: str, priority: Optional[int] = None) -> bool:
         """Send a notification to Gotify.
@@ -76,10 +111,9 @@ class GotifyNotifier:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-                response.raise_for_status()
-                return True
+            response = await self._get_client().post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            return True
         except httpx.HTTPStatusError as e:
             logger.warning(f"Gotify server returned error: {e.response.status_code} {e.response.text}")
         except httpx.RequestError as e:
@@ -89,26 +123,100 @@ class GotifyNotifier:
         
         return False
 
+    @staticmethod
+    def _format_error(failure: FailureContext) -> str:
+        """The notification body for one failure."""
+        lines = [
+            f"Site: {failure.site_name}",
+            f"URL: {failure.url}",
+            f"Error: {failure.error_message}",
+        ]
+        # Optional fields are left out when unset (or zero retries)
+        optional = (("Status", failure.http_status), ("Retries", failure.retries_attempted))
+        lines.extend(f"{label}: {value}" for label, value in optional if value)
+        return "\n".join(lines) + "\n"
+
+    def _format_errors(self, failures: List[FailureContext]) -> Tuple[str, str]:
+        """The title and body of the notification for a batch of failures.
+
+        A single failure gets the same notification as before batching;
+        otherwise the first MAX_BATCHED_ERRORS are listed and the rest counted.
+        """
+        if len(failures) == 1:
+            failure = failures[0]
+            return f"CWSF Scrape Error: {failure.site_name}", self._format_error(failure)
+
+        sites = dict.fromkeys(failure.site_name for failure in failures)
+        if len(sites) == 1:
+            title = f"CWSF Scrape Errors: {failures[0].site_name} ({len(failures)})"
+        else:
+            title = f"CWSF Scrape Errors: {len(failures)} failures across {len(sites)} sites"
+        blocks = [self._format_error(failure) for failure in failures[:self.MAX_BATCHED_ERRORS]]
+        hidden = len(failures) - len(blocks)
+        if hidden:
+            blocks.append(f"... and {hidden} more\n")
+        return title, "\n".join(blocks)
+
     async def send_error(self, failure: FailureContext) -> bool:
-        """Send an error notification for a failed scraping job.
+        """Queue an error notification for a failed scraping job.
+
+        Errors are coalesced: the first one opens an ERROR_BATCH_WINDOW
+        second window, and everything queued before it closes goes out as
+        one notification. flush() sends them without waiting.
 
         Args:
             failure: FailureContext object containing error details.
 
         Returns:
-            True if successful, False otherwise.
+            True if the error was queued, False if notifications are disabled.
+        """
+        if not self.enabled:
+            return False
+        self._pending_errors.append(failure)
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after(self.ERROR_BATCH_WINDOW))
+        return True
+
+    async def send_errors(self, failures: List[FailureContext]) -> List[bool]:
+        """Queue error notifications for several failures (see send_error).
+
+        Args:
+            failures: FailureContext objects to report.
+
+        Returns:
+            Whether each failure was queued, in the order of failures.
         """
-        title = f"CWSF Scrape Error: {failure.site_name}"
-        message = (
-            f"Site: {failure.site_name}\n"
-            f"URL: {failure.url}\n"
-            f"Error: {failure.error_message}\n"
-        )
-        if failure.http_status:
-            message += f"Status: {failure.http_status}\n"
-        if failure.retries_attempted > 0:
-            message += f"Retries: {failure.retries_attempted}\n"
+        return [await self.send_error(failure) for failure in failures]
+
+    async def _flush_after(self, delay: float) -> None:
+        """Wait out a batch window, then send what was queued during it."""
+        await asyncio.sleep(delay)
+        task = asyncio.current_task()
+        # From here on flush() leaves this task alone; aclose() waits for it
+        self._flush_task = None
+        self._sending.add(task)
+        try:
+            await self._send_pending_errors()
+        finally:
+            self._sending.discard(task)
+
+    async def flush(self) -> bool:
+        """Send queued errors now rather than when their window closes.
 
+        Returns:
+            True if a notification was sent, False if none was pending or sending failed.
+        """
+        task, self._flush_task = self._flush_task, None
+        if task is not None:
+            task.cancel()
+        return await self._send_pending_errors()
+
+    async def _send_pending_errors(self) -> bool:
+        """Send everything queued as one notification."""
+        failures, self._pending_errors = self._pending_errors, []
+        if not failures:
+            return False
+        title, message = self._format_errors(failures)
         return await self._send_notification(title, message)
 
     async def send_summary(self, summary: RunSummary) -> bool:
@@ -124,16 +232,19 @@ class GotifyNotifier:
             # Story 7.5 AC 7: Only send summary notification if there were failures
             return False
 
-        title = "CWSF Run Summary (Failures Detected)"
-        message = (
-            f"Sites Attempted: {summary.total_sites}\n"
-            f"Sites Succeeded: {summary.sites_succeeded}\n"
-            f"Sites Failed: {summary.sites_failed}\n"
-            f"Total Records: {summary.total_records}\n"
-            f"Duration: {summary.duration_seconds:.1f}s\n\n"
-            "Failed Sites:\n"
-        )
-        for site, error in summary.failed_sites.items():
-            message += f"- {site}: {error}\n"
-
-        return await self._send_notification(title, message)
+        # The run's queued errors go out ahead of its summary
+        await self.flush()
+
+        lines = [
+            f"Sites Attempted: {summary.total_sites}",
+            f"Sites Succeeded: {summary.sites_succeeded}",
+            f"Sites Failed: {summary.sites_failed}",
+            f"Total Records: {summary.total_records}",
+            f"Duration: {summary.duration_seconds:.1f}s",
+            "",
+            "Failed Sites:",
+            *(f"- {site}: {error}" for site, error in summary.failed_sites.items()),
+        ]
+        message = "\n".join(lines) + "\n"
+
+        return await self._send_notification(self.SUMMARY_TITLE, message)
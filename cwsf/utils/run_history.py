@@ -1,11 +1,14 @@
+import asyncio
 import sqlite3
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunResult:
     site_name: str
     timestamp: str
@@ -14,96 +17,156 @@ class RunResult:
     error_count: int
     last_error: Optional[str] = None
 
+def _as_row(result: RunResult) -> Tuple[Any, ...]:
+    """A RunResult as the values of a run_history INSERT."""
+    return (
+        result.site_name,
+        result.timestamp,
+        result.records_count,
+        result.status,
+        result.error_count,
+        result.last_error
+    )
+
 class RunHistoryStore:
     """
     Persistent store for run history using a lightweight SQLite database.
+    
+    One connection is kept open and shared (under a lock) by every call;
+    close() releases it, and the next call reopens it. record_run buffers
+    rows and writes them in one transaction once flush_threshold are
+    pending, on flush() or close(), or before a read.
     """
-    def __init__(self, db_path: str = "./output/cwsf_meta.db"):
+    def __init__(self, db_path: str = "./output/cwsf_meta.db", flush_threshold: int = 256):
         self.db_path = Path(db_path)
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pending: List[Tuple[Any, ...]] = []
+        # The thread the *_async methods run on, created on first use
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._ensure_db_exists()
 
+    def _connection(self) -> sqlite3.Connection:
+        """The shared connection, opened on first use. Call with self._lock held."""
+        if self._conn is None:
+            # Rows stay plain tuples: queries select RunResult's fields in
+            # declaration order, so each row maps straight onto RunResult(*row)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            # WAL persists in the database file, so commits append to the
+            # -wal file (see SqliteWriter); synchronous is per connection
+            journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if journal_mode.lower() == "wal":
+                conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn = conn
+        return self._conn
+
     def _ensure_db_exists(self):
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self.db_path))
-        try:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS run_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    site_name TEXT NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    records_count INTEGER NOT NULL,
-                    status TEXT NOT NULL,
-                    error_count INTEGER NOT NULL,
-                    last_error TEXT
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS run_history (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        site_name TEXT NOT NULL,
+                        timestamp TEXT NOT NULL,
+                        records_count INTEGER NOT NULL,
+                        status TEXT NOT NULL,
+                        error_count INTEGER NOT NULL,
+                        last_error TEXT
+                    )
+                """)
+                # Serves both the newest-run-per-site and per-site history queries
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_rh_site_ts ON run_history(site_name, timestamp DESC)"
                 )
-            """)
-            conn.commit()
-        finally:
+
+    def close(self):
+        """Writes any buffered runs and closes the shared connection, if open."""
+        with self._lock:
+            try:
+                self._flush_locked()
+            finally:
+                conn, self._conn = self._conn, None
+        if conn is not None:
             conn.close()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    async def _run_async(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run func(*args) on the store's own thread, off the event loop."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cwsf-run-history")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def record_run_async(self, result: RunResult):
+        """record_run for callers on an event loop; a flush it triggers doesn't block the loop."""
+        await self._run_async(self.record_run, result)
+
+    async def flush_async(self):
+        """flush() for callers on an event loop."""
+        await self._run_async(self.flush)
 
     def record_run(self, result: RunResult):
-        conn = sqlite3.connect(str(self.db_path))
-        try:
-            conn.execute("""
+        """Buffers a run; written once flush_threshold runs are pending."""
+        self.record_run_batch([result])
+
+    def record_run_batch(self, results: List[RunResult]):
+        """Buffers several runs; written once flush_threshold runs are pending."""
+        if not results:
+            return
+        with self._lock:
+            self._pending.extend(_as_row(result) for result in results)
+            if len(self._pending) >= self.flush_threshold:
+                self._flush_locked()
+
+    def flush(self):
+        """Writes all buffered runs in a single transaction."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """flush() with self._lock held. Rows that fail to write are dropped."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        conn = self._connection()
+        with conn:
+            conn.executemany("""
                 INSERT INTO run_history (site_name, timestamp, records_count, status, error_count, last_error)
                 VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                result.site_name,
-                result.timestamp,
-                result.records_count,
-                result.status,
-                result.error_count,
-                result.last_error
-            ))
-            conn.commit()
-        finally:
-            conn.close()
+            """, pending)
 
     def get_last_runs(self) -> List[RunResult]:
         """Returns the latest run result for each site."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            cursor = conn.execute("""
-                SELECT h1.* FROM run_history h1
-                JOIN (
-                    SELECT site_name, MAX(timestamp) as max_ts
+        with self._lock:
+            self._flush_locked()
+            cursor = self._connection().execute("""
+                SELECT site_name, timestamp, records_count, status, error_count, last_error
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY site_name ORDER BY timestamp DESC
+                    ) AS rn
                     FROM run_history
-                    GROUP BY site_name
-                ) h2 ON h1.site_name = h2.site_name AND h1.timestamp = h2.max_ts
-                ORDER BY h1.site_name ASC
+                )
+                WHERE rn = 1
+                ORDER BY site_name ASC
             """)
-            rows = cursor.fetchall()
-            return [RunResult(
-                site_name=row["site_name"],
-                timestamp=row["timestamp"],
-                records_count=row["records_count"],
-                status=row["status"],
-                error_count=row["error_count"],
-                last_error=row["last_error"]
-            ) for row in rows]
-        finally:
-            conn.close()
+            return [RunResult(*row) for row in cursor]
 
     def get_site_history(self, site_name: str, limit: int = 5) -> List[RunResult]:
         """Returns the history for a specific site."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            cursor = conn.execute("""
-                SELECT * FROM run_history
+        with self._lock:
+            self._flush_locked()
+            cursor = self._connection().execute("""
+                SELECT site_name, timestamp, records_count, status, error_count, last_error
+                FROM run_history
                 WHERE site_name = ?
                 ORDER BY timestamp DESC
                 LIMIT ?
             """, (site_name, limit))
-            rows = cursor.fetchall()
-            return [RunResult(
-                site_name=row["site_name"],
-                timestamp=row["timestamp"],
-                records_count=row["records_count"],
-                status=row["status"],
-                error_count=row["error_count"],
-                last_error=row["last_error"]
-            ) for row in rows]
-        finally:
-            conn.close()
+            return [RunResult(*row) for row in cursor]